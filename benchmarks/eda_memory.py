@@ -0,0 +1,106 @@
+"""
+Peak-RSS benchmark for the EDA analyzers with and without copying.
+
+Builds a synthetic news frame, constructs every EDA analyzer on it and runs
+their non-plotting methods, once with the default ``copy=True`` and once
+with ``copy=False``. Each mode runs in a fresh subprocess so the peak RSS
+numbers do not leak into each other.
+
+Usage:
+    python benchmarks/eda_memory.py --rows 1000000
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_news_frame(rows: int, seed: int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    words = np.array(
+        "stocks rally fall earnings beat miss oil tech bank rates guidance "
+        "upgrade downgrade shares record quarter revenue outlook".split()
+    )
+    headlines = [" ".join(w) for w in rng.choice(words, size=(rows, 8))]
+    dates = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        rng.integers(0, 3 * 365 * 24 * 3600, rows), unit="s"
+    )
+    return pd.DataFrame(
+        {
+            "headline": headlines,
+            "url": [f"https://news.example.com/{i}" for i in range(rows)],
+            "publisher": rng.choice(
+                [f"pub{i}@site{i % 7}.com" for i in range(200)], rows
+            ),
+            "date": dates.strftime("%Y-%m-%d %H:%M:%S"),
+            "stock": rng.choice([f"T{i}" for i in range(500)], rows),
+            "sentiment_score": rng.uniform(-1, 1, rows),
+        }
+    )
+
+
+def run_suite(rows: int, copy: bool):
+    from eda.data_quality_utils import DataQualityUtils
+    from eda.publisher_analyzer import PublisherAnalyzer
+    from eda.textual_eda import TextualEDA
+    from eda.time_series_analyzer import TimeSeriesAnalyzer
+    from eda.topic_modeler import TopicModeler
+    from eda.visualizer import DataVisualizer
+
+    df = make_news_frame(rows)
+    baseline = peak_rss_mb()
+
+    analyzers = [
+        DataQualityUtils(df, copy=copy),
+        TextualEDA(df, source_col="publisher", copy=copy),
+        TimeSeriesAnalyzer(df, copy=copy),
+        TopicModeler(df, copy=copy),
+        PublisherAnalyzer(df, copy=copy),
+        DataVisualizer(df, copy=copy),
+    ]
+    dq, eda, tsa, _, pa, _ = analyzers
+    dq.summary()
+    eda.headline_length_stats()
+    eda.articles_per_publisher()
+    tsa.detect_spikes()
+    pa.run_all(plot=False)
+
+    peak = peak_rss_mb()
+    print(
+        f"copy={copy!s:<5}  frame baseline {baseline:8.1f} MB  "
+        f"peak {peak:8.1f} MB  analyzers +{peak - baseline:8.1f} MB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--mode", choices=["copy", "nocopy"])
+    args = parser.parse_args()
+
+    if args.mode:
+        run_suite(args.rows, copy=args.mode == "copy")
+        return
+
+    for mode in ("copy", "nocopy"):
+        subprocess.run(
+            [sys.executable, __file__, "--rows", str(args.rows), "--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Wall-time, peak-RSS and quality benchmark for the TopicModeler engines.
+
+Builds a synthetic headline corpus with planted topics (each headline draws
+most of its words from one topic's vocabulary) and fits every engine on it.
+Each engine runs in a fresh subprocess so peak RSS is measured in isolation.
+Quality is reported as UMass coherence and as topic purity: the share of
+headlines whose predicted topic's majority planted topic matches their own.
+
+Usage:
+    python benchmarks/topic_engines.py --rows 200000 --topics 10
+"""
+
+import argparse
+import os
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in kilobytes on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_corpus(rows: int, n_topics: int, seed: int = 0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    vocab = np.array([f"term{t}x{w}" for t in range(n_topics) for w in range(40)])
+    vocab = vocab.reshape(n_topics, 40)
+    shared = np.array([f"common{w}" for w in range(60)])
+    planted = rng.integers(0, n_topics, rows)
+    topical = vocab[planted[:, None], rng.integers(0, 40, (rows, 6))]
+    noise = shared[rng.integers(0, len(shared), (rows, 2))]
+    headlines = [" ".join(words) for words in np.hstack([topical, noise])]
+    return pd.DataFrame({"headline": headlines}), planted
+
+
+def purity(predicted, planted) -> float:
+    import pandas as pd
+
+    table = pd.crosstab(predicted, planted)
+    return float(table.max(axis=1).sum() / len(predicted))
+
+
+def run_engine(rows: int, n_topics: int, engine: str):
+    from eda.topic_modeler import TopicModeler, umass_coherence
+
+    df, planted = make_corpus(rows, n_topics)
+    baseline = peak_rss_mb()
+
+    modeler = TopicModeler(df, n_topics=n_topics, copy=False, engine=engine)
+    start = time.perf_counter()
+    modeler.fit()
+    fit_time = time.perf_counter() - start
+    predicted = modeler.document_topics().argmax(axis=1)
+
+    peak = peak_rss_mb()
+    coherence = umass_coherence(modeler.tfidf_matrix(), modeler.model.components_)
+    print(
+        f"{engine:<14} fit {fit_time:8.2f} s  +{peak - baseline:8.1f} MB  "
+        f"coherence {coherence:8.3f}  purity {purity(predicted, planted):6.3f}"
+    )
+
+
+def main():
+    from eda.topic_modeler import ENGINES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--topics", type=int, default=10)
+    parser.add_argument("--engine", choices=ENGINES)
+    args = parser.parse_args()
+
+    if args.engine:
+        run_engine(args.rows, args.topics, args.engine)
+        return
+
+    for engine in ENGINES:
+        subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--rows",
+                str(args.rows),
+                "--topics",
+                str(args.topics),
+                "--engine",
+                engine,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
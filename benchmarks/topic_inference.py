@@ -0,0 +1,68 @@
+"""
+Startup and batch-inference latency benchmark for saved TopicModelers.
+
+Fits a model on the synthetic corpus from ``topic_engines.py``, saves it,
+and times loading it back with and without memory-mapping, then times
+``predict_topics`` for several batch sizes (median of repeated runs).
+
+Usage:
+    python benchmarks/topic_inference.py --rows 100000 --topics 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from topic_engines import make_corpus  # noqa: E402
+
+
+def median_time(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main():
+    from eda.topic_modeler import ENGINES, TopicModeler
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--topics", type=int, default=10)
+    parser.add_argument("--engine", choices=ENGINES, default="minibatch_nmf")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df, _ = make_corpus(args.rows, args.topics)
+    modeler = TopicModeler(df, n_topics=args.topics, engine=args.engine).fit()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "topics.joblib")
+        modeler.save(path)
+        print(f"artifact size {os.path.getsize(path) / 1024**2:8.2f} MB")
+        for mmap_mode in (None, "r"):
+            seconds = median_time(
+                lambda: TopicModeler.load(path, mmap_mode=mmap_mode), args.repeat
+            )
+            print(f"load mmap_mode={mmap_mode!s:<4}  {seconds * 1000:8.2f} ms")
+
+        loaded = TopicModeler.load(path)
+        for batch_size in (1, 100, 10_000):
+            batch = df["headline"].iloc[:batch_size]
+            seconds = median_time(lambda: loaded.predict_topics(batch), args.repeat)
+            print(
+                f"predict batch={batch_size:<6}  {seconds * 1000:8.2f} ms  "
+                f"({seconds / len(batch) * 1e6:8.2f} us/text)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+# src/eda/data_profiler.py
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .fingerprint_store import FingerprintStore, hash_rows, hash_values
+
+DEFAULT_INVALID_TOKENS = ("NA", "null", "NULL", "-", "N/A")
+
+
+def _merge_sorted(seen: np.ndarray, new: np.ndarray) -> np.ndarray:
+    """Union of two sorted, unique uint64 arrays."""
+    if len(seen) == 0:
+        return new
+    if len(new) == 0:
+        return seen
+    return np.union1d(seen, new)
+
+
+def _is_text_column(series: pd.Series) -> bool:
+    dtype = series.dtype
+    return (
+        pd.api.types.is_object_dtype(dtype)
+        or isinstance(dtype, (pd.StringDtype, pd.CategoricalDtype))
+        or (isinstance(dtype, pd.ArrowDtype) and pd.api.types.is_string_dtype(dtype))
+    )
+
+
+class DataProfiler:
+    """
+    Accumulates a data-quality profile one chunk at a time.
+
+    Each column is factorized once per chunk; missing counts, distinct
+    counts and invalid-token counts are all derived from those codes, and
+    invalid tokens are matched against the unique values only. Duplicate
+    rows are tracked through 64-bit row hashes, so the profile of a file
+    larger than memory can be built with ``from_csv``.
+    """
+
+    def __init__(
+        self, invalid_tokens: Optional[Iterable[str]] = None, n_examples: int = 5
+    ):
+        if invalid_tokens is None:
+            invalid_tokens = DEFAULT_INVALID_TOKENS
+        self.invalid_tokens = tuple(invalid_tokens)
+        self.n_examples = n_examples
+        self.n_rows = 0
+        self.n_duplicates = 0
+        self.columns: Optional[pd.Index] = None
+        self._missing: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._invalid: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._examples: list[list[pd.Series]] = []
+        self._distinct: list[np.ndarray] = []
+        self._fingerprints = FingerprintStore()
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        chunksize: Optional[int] = None,
+        invalid_tokens: Optional[Iterable[str]] = None,
+    ) -> "DataProfiler":
+        """Profile an in-memory DataFrame, optionally in row chunks."""
+        profiler = cls(invalid_tokens=invalid_tokens)
+        if chunksize is None or len(df) <= chunksize:
+            return profiler.update(df)
+        for start in range(0, len(df), chunksize):
+            profiler.update(df.iloc[start : start + chunksize])
+        return profiler
+
+    @classmethod
+    def from_csv(
+        cls,
+        path,
+        chunksize: int = 100_000,
+        invalid_tokens: Optional[Iterable[str]] = None,
+        **read_csv_kwargs,
+    ) -> "DataProfiler":
+        """Profile a CSV file chunk-by-chunk without loading it whole."""
+        profiler = cls(invalid_tokens=invalid_tokens)
+        for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+            profiler.update(chunk)
+        return profiler
+
+    def update(self, chunk: pd.DataFrame) -> "DataProfiler":
+        """Fold one chunk of rows into the profile."""
+        if not isinstance(chunk, pd.DataFrame):
+            raise TypeError("Input must be a pandas DataFrame")
+
+        if self.columns is None:
+            self._start(chunk.columns)
+        elif not chunk.columns.equals(self.columns):
+            raise ValueError("All chunks must share the same columns.")
+
+        tokens = ["", *self.invalid_tokens]
+        for pos in range(chunk.shape[1]):
+            series = chunk.iloc[:, pos]
+            codes, uniques = pd.factorize(series)
+            self._missing[pos] += int(np.count_nonzero(codes == -1))
+
+            if len(uniques):
+                self._distinct[pos] = _merge_sorted(
+                    self._distinct[pos], np.unique(hash_values(uniques))
+                )
+
+            if _is_text_column(series) and len(uniques):
+                stripped = pd.Index(uniques).astype(str).str.strip()
+                invalid_uniques = np.asarray(stripped.isin(tokens))
+                if invalid_uniques.any():
+                    mask = np.zeros(len(codes), dtype=bool)
+                    valid = codes >= 0
+                    mask[valid] = invalid_uniques[codes[valid]]
+                    self._invalid[pos] += int(np.count_nonzero(mask))
+                    self._add_examples(pos, series[mask])
+
+        self._update_duplicates(chunk)
+        self.n_rows += len(chunk)
+        return self
+
+    def _start(self, columns: pd.Index):
+        self.columns = columns
+        n_cols = len(columns)
+        self._missing = np.zeros(n_cols, dtype=np.int64)
+        self._invalid = np.zeros(n_cols, dtype=np.int64)
+        self._examples = [[] for _ in range(n_cols)]
+        self._distinct = [np.empty(0, dtype=np.uint64) for _ in range(n_cols)]
+
+    def _add_examples(self, pos: int, values: pd.Series):
+        have = sum(len(part) for part in self._examples[pos])
+        if have < self.n_examples:
+            self._examples[pos].append(values.head(self.n_examples - have))
+
+    def _update_duplicates(self, chunk: pd.DataFrame):
+        if chunk.shape[1] == 0 or len(chunk) == 0:
+            return
+        duplicated = self._fingerprints.add_hashes(hash_rows(chunk))
+        self.n_duplicates += int(duplicated.sum())
+
+    def missing_counts(self) -> pd.Series:
+        """Number of missing values per column."""
+        return pd.Series(self._missing, index=self._index(), dtype="int64")
+
+    def distinct_counts(self) -> pd.Series:
+        """Number of distinct non-missing values per column."""
+        counts = [len(hashes) for hashes in self._distinct]
+        return pd.Series(counts, index=self._index(), dtype="int64")
+
+    def invalid_counts(self) -> pd.Series:
+        """Number of invalid tokens per text column."""
+        return pd.Series(self._invalid, index=self._index(), dtype="int64")
+
+    def invalid_examples(self, pos: int) -> pd.Series:
+        parts = self._examples[pos]
+        if not parts:
+            return pd.Series(dtype=object, name=self._index()[pos])
+        return pd.concat(parts)
+
+    def missing_summary(self) -> pd.DataFrame:
+        """Missing counts and percentages, most-missing first."""
+        missing_counts = self.missing_counts()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            missing_percent = (missing_counts / self.n_rows) * 100
+        return pd.DataFrame(
+            {
+                "#missing_values": missing_counts,
+                "percentage": missing_percent.map(lambda x: f"{x:.2f}%"),
+            }
+        ).sort_values(by="#missing_values", ascending=False)
+
+    def significant_missing(self, threshold: float = 5.0) -> pd.DataFrame:
+        """Columns whose missing percentage exceeds ``threshold``."""
+        missing_counts = self.missing_counts()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            missing_percent = (missing_counts / self.n_rows) * 100
+        significant = missing_percent[missing_percent > threshold]
+        return pd.DataFrame(
+            {
+                "#missing_values": missing_counts[significant.index],
+                "percentage": significant.apply(lambda x: f"{x:.2f}%"),
+            }
+        ).sort_values(by="#missing_values", ascending=False)
+
+    def invalid_values(self) -> dict:
+        """Invalid-token counts and example values keyed by column name."""
+        invalid_summary = {}
+        for pos, count in enumerate(self._invalid):
+            if count > 0:
+                invalid_summary[self._index()[pos]] = {
+                    "count": int(count),
+                    "examples": self.invalid_examples(pos),
+                }
+        return invalid_summary
+
+    def summary(self) -> pd.DataFrame:
+        """Per-column profile: missing, distinct and invalid counts."""
+        return pd.DataFrame(
+            {
+                "#missing_values": self.missing_counts(),
+                "#distinct_values": self.distinct_counts(),
+                "#invalid_values": self.invalid_counts(),
+            }
+        )
+
+    def _index(self) -> pd.Index:
+        return self.columns if self.columns is not None else pd.Index([])
@@ -1,13 +1,107 @@
+import logging
 from typing import Optional
 
 import pandas as pd
+from pandas.tseries.api import guess_datetime_format
+
+from .data_profiler import DEFAULT_INVALID_TOKENS, DataProfiler
+from .fingerprint_store import FingerprintStore
+from .frame_utils import analyzer_frame
+
+logger = logging.getLogger(__name__)
+
+INVALID_DATE_TOKENS = ["", "nan", "null", "None", "NaT", "N/A"]
+
+
+def parse_datetime_column(
+    series: pd.Series, format: Optional[str] = None, errors: str = "coerce"
+) -> pd.Series:
+    """
+    Parse a column to UTC datetimes by parsing its unique values only.
+
+    The column is factorized, the distinct strings are stripped and cleaned
+    of known bad tokens, parsed with ``format`` (or one inferred from the
+    first value), and the result is broadcast back to the rows with an
+    integer take. An explicit ``format`` is strict: other strings follow
+    ``errors``. With an inferred format, strings that do not match it,
+    such as mixed layouts, get a second vectorized ``format="mixed"``
+    pass; mixed timezone offsets are normalised to UTC. That pass reads
+    each string on its own, so an ambiguous date such as ``01/02/2020``
+    may be read month-first even when the inferred format was day-first;
+    pass ``format`` when a column's layout is known.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return pd.to_datetime(series, errors=errors, utc=True)
+
+    codes, uniques = pd.factorize(series)
+    strings = pd.Index(uniques).astype(str).str.strip()
+    strings = strings.where(~strings.isin(INVALID_DATE_TOKENS), None)
+
+    if format is not None:
+        parsed = pd.to_datetime(strings, format=format, errors=errors, utc=True).array
+    else:
+        valid = strings.notna()
+        if valid.any():
+            format = guess_datetime_format(strings[valid][0])
+        parsed = pd.to_datetime(strings, format=format, errors="coerce", utc=True)
+        parsed = parsed.array
+        retry = parsed.isna() & valid
+        if retry.any():
+            parsed = parsed.copy()
+            parsed[retry] = pd.to_datetime(
+                strings[retry], format="mixed", errors=errors, utc=True
+            )
+
+    values = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(values, index=series.index, name=series.name)
 
 
 class DataQualityUtils:
-    def __init__(self, df: pd.DataFrame):
+    def __init__(self, df: pd.DataFrame, copy: bool = True):
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Input must be a pandas DataFrame")
-        self.df = df.copy()
+        self._profiles: dict[tuple, DataProfiler] = {}
+        self._profiled_frame: Optional[tuple] = None
+        self.df = analyzer_frame(df, copy=copy)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        self._df = df
+        self._profiles.clear()
+
+    def _frame_token(self) -> tuple:
+        """Identity, shape, column names and dtypes of the internal frame."""
+        return (
+            id(self._df),
+            self._df.shape,
+            tuple(self._df.columns),
+            tuple(map(str, self._df.dtypes)),
+        )
+
+    def profile(
+        self, invalid_tokens: Optional[list[str]] = None, refresh: bool = False
+    ) -> DataProfiler:
+        """
+        Return the cached single-pass profile of the internal DataFrame.
+
+        The cache is dropped whenever ``df`` is reassigned or its shape,
+        columns or dtypes change. Pass ``refresh=True`` after editing
+        values in place.
+        """
+        key = tuple(
+            DEFAULT_INVALID_TOKENS if invalid_tokens is None else invalid_tokens
+        )
+        token = self._frame_token()
+        if token != self._profiled_frame:
+            self._profiles.clear()
+            self._profiled_frame = token
+        if refresh or key not in self._profiles:
+            self._profiles[key] = DataProfiler.from_frame(self.df, invalid_tokens=key)
+        return self._profiles[key]
 
     def clean_column_names(self):
         """
@@ -39,62 +133,60 @@ class DataQualityUtils:
     def columns_with_significant_missing_values(
         self, threshold: float = 5.0
     ) -> pd.DataFrame:
-        missing_counts = self.df.isna().sum()
-        missing_percent = (missing_counts / len(self.df)) * 100
-        significant = missing_percent[missing_percent > threshold]
-        return pd.DataFrame(
-            {
-                "#missing_values": missing_counts[significant.index],
-                "percentage": significant.apply(lambda x: f"{x:.2f}%"),
-            }
-        ).sort_values(by="#missing_values", ascending=False)
+        return self.profile().significant_missing(threshold)
 
     def check_duplicates(self):
         """
         Return the number of duplicate rows in the DataFrame.
         """
-        return self.df.duplicated().sum()
+        return self.profile().n_duplicates
+
+    def flag_duplicates(
+        self,
+        store: Optional[FingerprintStore] = None,
+        subset: Optional[list[str]] = None,
+        add: bool = True,
+    ) -> pd.Series:
+        """
+        Flag rows that duplicate an earlier row of this batch or a row
+        already recorded in ``store`` (e.g. previous daily batches).
+        New fingerprints are added to the store unless ``add`` is False.
+        ``subset`` only applies when no store is given; a store keeps the
+        key columns it was created with.
+        """
+        if store is None:
+            store = FingerprintStore(subset=subset)
+        return store.add(self.df) if add else store.check(self.df)
 
     def find_invalid_values(self, additional_invalids=None) -> dict:
         """
         Identifies and summarizes invalid values in object columns.
         """
-        if additional_invalids is None:
-            additional_invalids = ["NA", "null", "NULL", "-", "N/A"]
-
-        invalid_summary = {}
-        for col in self.df.select_dtypes(include="object").columns:
-            mask = self.df[col].astype(str).str.strip().isin(["", *additional_invalids])
-            count = mask.sum()
-            if count > 0:
-                invalid_summary[col] = {
-                    "count": count,
-                    "examples": self.df.loc[mask, col].head(5),
-                }
-        return invalid_summary
+        return self.profile(additional_invalids).invalid_values()
 
     def summary(self) -> pd.DataFrame:
         """
         Provide a concise summary of missing data in the entire DataFrame.
         """
-        missing_counts = self.df.isna().sum()
-        missing_percent = (missing_counts / len(self.df)) * 100
-        return pd.DataFrame(
-            {
-                "#missing_values": missing_counts,
-                "percentage": missing_percent.map(lambda x: f"{x:.2f}%"),
-            }
-        ).sort_values(by="#missing_values", ascending=False)
+        return self.profile().missing_summary()
 
     def count_duplicates(self) -> int:
         """
         Returns the number of duplicate rows in the DataFrame.
         """
-        return self.df.duplicated().sum()
+        return self.profile().n_duplicates
 
     def convert_columns_to_datetime(
-        self, columns: Optional[list[str]] = None, errors: str = "coerce"
+        self,
+        columns: Optional[list[str]] = None,
+        errors: str = "coerce",
+        formats: Optional[str | dict[str, str]] = None,
     ) -> pd.DataFrame:
+        """
+        Convert date-like columns to UTC datetimes, parsing each distinct
+        string only once. ``formats`` may be a single strftime format or a
+        mapping of column name to format; otherwise it is inferred.
+        """
         if columns is None:
             columns = [
                 col
@@ -105,23 +197,20 @@ class DataQualityUtils:
         for col in columns:
             if col in self.df.columns:
                 original_non_null = self.df[col].notna().sum()
+                fmt = formats.get(col) if isinstance(formats, dict) else formats
 
-                # Ensure strings and strip whitespaces
-                self.df[col] = self.df[col].astype(str).str.strip()
-
-                # Replace known bad values
-                self.df[col] = self.df[col].replace(
-                    ["", "nan", "null", "None", "NaT", "N/A"], pd.NA
+                self.df[col] = parse_datetime_column(
+                    self.df[col], format=fmt, errors=errors
                 )
 
-                # Convert datetime (handles timezone-aware strings too)
-                self.df[col] = pd.to_datetime(self.df[col], errors=errors, utc=True)
-
                 converted = self.df[col].notna().sum()
-                print(
-                    f"[{col}] Converted: {converted}/{original_non_null} "
-                    f"({original_non_null - converted} became NaT)"
+                logger.info(
+                    "[%s] Converted: %d/%d (%d became NaT)",
+                    col,
+                    converted,
+                    original_non_null,
+                    original_non_null - converted,
                 )
             else:
-                print(f"Warning: Column '{col}' not found.")
+                logger.warning("Column '%s' not found.", col)
         return self.df
@@ -0,0 +1,126 @@
+# src/eda/fingerprint_store.py
+
+import os
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+_MISSING_HASH = np.uint64(0x9E3779B97F4A7C15)
+_ROW_HASH_PRIME = np.uint64(0x100000001B3)
+
+
+def _canonical(series: pd.Series) -> pd.Series:
+    """
+    Numeric and boolean values as float64, so a column that pandas reads
+    as int64 in one batch and float64 (or bool) in another hashes alike.
+    """
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or (
+        pd.api.types.is_numeric_dtype(dtype)
+        and not pd.api.types.is_complex_dtype(dtype)
+    ):
+        return series.astype(np.float64)
+    return series
+
+
+def hash_values(values) -> np.ndarray:
+    """
+    64-bit hash per value of the canonical dtype; every missing value
+    (NaN, None, NA) gets the same hash whatever the column dtype.
+    """
+    series = _canonical(pd.Series(values))
+    hashes = pd.util.hash_pandas_object(series, index=False).to_numpy(dtype=np.uint64)
+    hashes[series.isna().to_numpy()] = _MISSING_HASH
+    return hashes
+
+
+def hash_rows(df: pd.DataFrame, subset: Optional[list[str]] = None) -> np.ndarray:
+    """
+    Return one 64-bit fingerprint per row (the index is ignored), combined
+    from the canonical per-column ``hash_values``, so a row fingerprints
+    the same whether a batch holds a column as int64 or as float64.
+    """
+    if subset is not None:
+        df = df[subset]
+    hashes = np.zeros(len(df), dtype=np.uint64)
+    for pos in range(df.shape[1]):
+        hashes = (hashes ^ hash_values(df.iloc[:, pos])) * _ROW_HASH_PRIME
+    return hashes
+
+
+class FingerprintStore:
+    """
+    Persistent set of 64-bit row fingerprints used to detect duplicates
+    across batches.
+
+    Fingerprints are kept as one sorted ``uint64`` array (8 bytes per
+    distinct row). Lookups are a binary search and inserts a linear merge,
+    so checking a batch of m rows against n stored rows costs
+    O(m log n + n) and never needs the earlier batches themselves.
+    """
+
+    def __init__(self, path=None, subset: Optional[list[str]] = None):
+        """
+        Parameters:
+            path (str or Path, optional): ``.npy`` file the fingerprints are
+                loaded from and saved to. Missing files start an empty store.
+            subset (list[str], optional): Key columns to fingerprint.
+                Defaults to all columns.
+        """
+        self.path = path
+        self.subset = subset
+        self._hashes = np.empty(0, dtype=np.uint64)
+        if path is not None and os.path.exists(path):
+            self._hashes = np.load(path, mmap_mode="r")
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def contains(self, hashes: np.ndarray) -> np.ndarray:
+        """Boolean mask of which fingerprints are already stored."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if len(self._hashes) == 0:
+            return np.zeros(len(hashes), dtype=bool)
+        pos = np.searchsorted(self._hashes, hashes)
+        pos[pos == len(self._hashes)] = 0
+        return self._hashes[pos] == hashes
+
+    def check_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """
+        Flag fingerprints that repeat an earlier one in the same batch or
+        one already in the store. The first occurrence is not flagged.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        _, first = np.unique(hashes, return_index=True)
+        duplicated = np.ones(len(hashes), dtype=bool)
+        duplicated[first] = False
+        return duplicated | self.contains(hashes)
+
+    def add_hashes(self, hashes: np.ndarray) -> np.ndarray:
+        """Flag duplicates like ``check_hashes`` and store the new fingerprints."""
+        duplicated = self.check_hashes(hashes)
+        fresh = np.unique(np.asarray(hashes, dtype=np.uint64)[~duplicated])
+        if len(fresh):
+            pos = np.searchsorted(self._hashes, fresh)
+            self._hashes = np.insert(self._hashes, pos, fresh)
+        return duplicated
+
+    def check(self, df: pd.DataFrame) -> pd.Series:
+        """Return a boolean Series flagging duplicate rows, without storing them."""
+        return pd.Series(self.check_hashes(hash_rows(df, self.subset)), index=df.index)
+
+    def add(self, df: pd.DataFrame) -> pd.Series:
+        """Flag duplicate rows of a batch and remember its new rows."""
+        return pd.Series(self.add_hashes(hash_rows(df, self.subset)), index=df.index)
+
+    def save(self, path=None):
+        """Write the fingerprints to ``path`` (defaults to the load path)."""
+        path = path if path is not None else self.path
+        if path is None:
+            raise ValueError("No path given to save the fingerprint store.")
+        tmp_path = f"{path}.tmp.npy"
+        np.save(tmp_path, np.asarray(self._hashes))
+        os.replace(tmp_path, path)
+        self.path = path
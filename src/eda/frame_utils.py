@@ -0,0 +1,28 @@
+# src/eda/frame_utils.py
+
+import pandas as pd
+
+
+def analyzer_frame(df: pd.DataFrame, copy: bool = True) -> pd.DataFrame:
+    """
+    Return the working frame for an analyzer.
+
+    With ``copy=True`` this is a deep copy of ``df`` (the historical
+    behaviour). With ``copy=False`` it is a shallow copy: it has all of
+    ``df``'s columns but shares their arrays. Analyzers only ever replace
+    whole columns or rows of their working frame, so the caller's data is
+    never modified and no column is materialized until an analyzer
+    rewrites it; outputs such as labelled frames keep every column either
+    way.
+    """
+    return df.copy(deep=copy)
+
+
+def text_lengths(series: pd.Series) -> pd.Series:
+    """
+    Character length of each value. Arrow-backed and other string dtypes
+    are measured directly instead of being converted to Python objects.
+    """
+    if isinstance(series.dtype, (pd.StringDtype, pd.ArrowDtype)):
+        return series.str.len()
+    return series.astype(str).str.len()
@@ -0,0 +1,175 @@
+# src/eda/heavy_hitters.py
+
+import heapq
+from typing import Hashable, Iterable, Optional
+
+import pandas as pd
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitter sketch with ``capacity`` counters.
+
+    Error bounds, for a stream of total weight N:
+      * every estimate overestimates: true <= estimate <= true + error;
+      * every per-item ``error`` is at most N / capacity;
+      * every item with true count > N / capacity is tracked.
+    The same bounds hold for sketches combined with ``merge``, so sketches
+    built on different workers or time buckets can be added together.
+    """
+
+    def __init__(self, capacity: int = 100):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: dict[Hashable, int] = {}
+        self._errors: dict[Hashable, int] = {}
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._tick = 0
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    @property
+    def error_bound(self) -> float:
+        """Worst-case overestimate of any count: N / capacity."""
+        return self.total / self.capacity
+
+    def _push(self, item: Hashable):
+        self._tick += 1
+        heapq.heappush(self._heap, (self._counts[item], self._tick, item))
+
+    def _pop_min(self) -> tuple[Hashable, int]:
+        # Heap entries go stale when a count grows; skip until a live one.
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self._counts.get(item) == count:
+                return item, count
+
+    def update(self, item: Hashable, count: int = 1) -> None:
+        """Add ``count`` occurrences of ``item``."""
+        self.total += count
+        if item in self._counts:
+            self._counts[item] += count
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = count
+            self._errors[item] = 0
+        else:
+            evicted, floor = self._pop_min()
+            del self._counts[evicted], self._errors[evicted]
+            self._counts[item] = floor + count
+            self._errors[item] = floor
+        self._push(item)
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i, k) for i, (k, c) in enumerate(self._counts.items())]
+            heapq.heapify(self._heap)
+
+    def update_many(self, items: Iterable[Hashable]) -> None:
+        """Add a batch of items, pre-aggregated with one ``value_counts``."""
+        batch = pd.Series(items, dtype=object).value_counts(sort=False)
+        for item, count in batch.items():
+            self.update(item, int(count))
+
+    def estimate(self, item: Hashable) -> int:
+        """Upper-bound estimate of the count of ``item``."""
+        if item in self._counts:
+            return self._counts[item]
+        return self._min_count()
+
+    def _min_count(self) -> int:
+        if len(self._counts) < self.capacity:
+            return 0
+        return min(self._counts.values())
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Combine two sketches into a new one with the smaller capacity.
+        Items missing from a full sketch are credited its minimum count.
+        """
+        capacity = min(self.capacity, other.capacity)
+        floor_a, floor_b = self._min_count(), other._min_count()
+        combined = []
+        for item in set(self._counts) | set(other._counts):
+            count = self._counts.get(item, floor_a) + other._counts.get(item, floor_b)
+            error = self._errors.get(item, floor_a) + other._errors.get(item, floor_b)
+            combined.append((count, error, item))
+        combined.sort(key=lambda entry: entry[0], reverse=True)
+
+        merged = SpaceSaving(capacity)
+        merged.total = self.total + other.total
+        for count, error, item in combined[:capacity]:
+            merged._counts[item] = count
+            merged._errors[item] = error
+            merged._push(item)
+        return merged
+
+    def top(self, n: int = 10) -> pd.DataFrame:
+        """
+        The ``n`` items with the largest estimates.
+
+        Returns:
+            pd.DataFrame: Columns 'count' (estimate), 'error' (maximum
+            overestimate) and 'guaranteed' (count - error, a lower bound).
+        """
+        table = pd.DataFrame(
+            {
+                "count": pd.Series(self._counts, dtype="int64"),
+                "error": pd.Series(self._errors, dtype="int64"),
+            }
+        )
+        table["guaranteed"] = table["count"] - table["error"]
+        return table.sort_values("count", ascending=False, kind="stable").head(n)
+
+
+class SlidingTopK:
+    """
+    Top-k over a sliding time window.
+
+    The window is split into buckets of ``bucket`` width, each with its own
+    ``SpaceSaving`` sketch. A bucket is dropped once its start is more than
+    ``window`` before the newest timestamp seen, so at most
+    window / bucket + 1 buckets are live (the extra one when the newest
+    timestamp falls exactly on a bucket boundary), and a query merges them.
+    Memory is bounded by (window / bucket + 1) * capacity counters.
+    """
+
+    def __init__(self, window: str = "24h", bucket: str = "1h", capacity: int = 100):
+        self.window = pd.Timedelta(window)
+        self.bucket = pd.Timedelta(bucket)
+        self.capacity = capacity
+        self._buckets: dict[pd.Timestamp, SpaceSaving] = {}
+        self._latest: Optional[pd.Timestamp] = None
+
+    def update(self, items, timestamps) -> None:
+        """Add items with their publication timestamps."""
+        frame = pd.DataFrame(
+            {"item": pd.Series(items, dtype=object).to_numpy(), "ts": timestamps}
+        )
+        frame["ts"] = pd.to_datetime(frame["ts"])
+        frame["bucket"] = frame["ts"].dt.floor(self.bucket)
+        for start, group in frame.groupby("bucket", sort=True):
+            sketch = self._buckets.setdefault(start, SpaceSaving(self.capacity))
+            sketch.update_many(group["item"])
+        newest = frame["ts"].max()
+        if self._latest is None or newest > self._latest:
+            self._latest = newest
+        self._expire()
+
+    def _expire(self):
+        if self._latest is None:
+            return
+        cutoff = self._latest - self.window
+        for start in [s for s in self._buckets if s < cutoff]:
+            del self._buckets[start]
+
+    def sketch(self) -> SpaceSaving:
+        """Merged sketch of all buckets in the current window."""
+        merged = SpaceSaving(self.capacity)
+        for sketch in self._buckets.values():
+            merged = merged.merge(sketch)
+        return merged
+
+    def top(self, n: int = 10) -> pd.DataFrame:
+        """Top ``n`` items in the current window, with error bounds."""
+        return self.sketch().top(n)
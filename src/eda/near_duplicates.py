@@ -0,0 +1,212 @@
+# src/eda/near_duplicates.py
+
+import numpy as np
+import pandas as pd
+
+_SHINGLE_BASE = np.uint64(1_000_003)
+_MAX_BATCH_CELLS = 8_000_000  # shingles x permutations per MinHash batch
+
+
+def normalize_headlines(texts: pd.Series) -> pd.Series:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return (
+        texts.astype(str)
+        .str.lower()
+        .str.replace(r"[^\w\s]", "", regex=True)
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def shingle_hashes(texts, k: int = 5) -> tuple[np.ndarray, np.ndarray]:
+    """
+    64-bit rolling hashes of the character k-shingles of each text.
+
+    All texts are concatenated into one code-point array and every window
+    is hashed at once; windows that straddle two texts are dropped. Texts
+    shorter than ``k`` are padded so they yield one shingle.
+
+    Returns:
+        tuple: (hashes, starts) where the shingles of text ``i`` are
+        ``hashes[starts[i]:starts[i + 1]]``.
+    """
+    texts = pd.Series(texts, dtype=object).str.pad(k, side="right", fillchar="\0")
+    lengths = texts.str.len().to_numpy(dtype=np.int64)
+    codes = np.frombuffer("".join(texts).encode("utf-32-le"), dtype=np.uint32)
+    codes = codes.astype(np.uint64)
+
+    n_windows = len(codes) - k + 1
+    hashes = np.zeros(max(n_windows, 0), dtype=np.uint64)
+    for j in range(k):
+        hashes = hashes * _SHINGLE_BASE + codes[j : j + n_windows]
+
+    offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    doc_ids = np.repeat(np.arange(len(texts)), lengths)[:n_windows]
+    position = np.arange(n_windows) - offsets[doc_ids]
+    hashes = hashes[position <= lengths[doc_ids] - k]
+
+    starts = np.concatenate([[0], np.cumsum(lengths - k + 1)])
+    return hashes, starts
+
+
+def minhash_signatures(
+    hashes: np.ndarray, starts: np.ndarray, num_perm: int = 128, seed: int = 0
+) -> np.ndarray:
+    """
+    MinHash signatures (``uint32``, one row per text) from shingle hashes.
+
+    Permutations are multiply-shift hashes ``(a * x + b) >> 32`` with odd
+    ``a``. They are applied to runs of whole texts and batches of
+    permutations of at most ``_MAX_BATCH_CELLS`` shingle x permutation
+    cells, so memory stays bounded however many texts there are; only a
+    single text with more shingles than that is processed on its own.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, 2**63, num_perm, dtype=np.uint64) | np.uint64(1)
+    b = rng.integers(0, 2**63, num_perm, dtype=np.uint64)
+    n_docs = len(starts) - 1
+    signatures = np.empty((n_docs, num_perm), dtype=np.uint32)
+    if n_docs == 0:
+        return signatures
+
+    first = 0
+    while first < n_docs:
+        # The next run of whole texts with at most _MAX_BATCH_CELLS shingles.
+        end = np.searchsorted(starts, starts[first] + _MAX_BATCH_CELLS, "right") - 1
+        last = min(max(end, first + 1), n_docs)
+        run = hashes[starts[first] : starts[last]]
+        offsets = starts[first:last] - starts[first]
+        batch = max(1, min(num_perm, _MAX_BATCH_CELLS // len(run)))
+        for lo in range(0, num_perm, batch):
+            hi = min(lo + batch, num_perm)
+            permuted = (run[:, None] * a[lo:hi] + b[lo:hi]) >> np.uint64(32)
+            signatures[first:last, lo:hi] = np.minimum.reduceat(
+                permuted, offsets, axis=0
+            )
+        first = last
+    return signatures
+
+
+def lsh_bands(num_perm: int, threshold: float, recall: float = 0.95) -> tuple[int, int]:
+    """
+    (bands, rows) with ``bands * rows == num_perm``: the most selective
+    banding (largest ``rows``) under which a pair with Jaccard similarity
+    ``threshold`` still becomes a candidate with probability ``recall``,
+    i.e. ``1 - (1 - threshold ** rows) ** bands >= recall``.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= recall:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateDetector:
+    """
+    Clusters near-duplicate texts with MinHash and LSH banding.
+
+    Texts are normalized, exact duplicates collapse to one entry, and
+    each distinct text gets a MinHash signature over its character
+    shingles. Signatures are cut into bands (chosen by ``lsh_bands``);
+    texts sharing any band become candidates. Buckets are processed one at
+    a time with a union-find: each member is compared only with one
+    representative of every cluster already present in its bucket, and
+    joins each cluster whose estimated Jaccard similarity with it is at
+    least ``threshold``. A large syndicated story therefore costs about one
+    comparison per copy rather than one per pair, and memory is bounded by
+    the signatures plus one bucket's representatives.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+        seed: int = 0,
+    ):
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1].")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.seed = seed
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+
+    def signatures(self, texts) -> np.ndarray:
+        """MinHash signatures of already normalized texts."""
+        hashes, starts = shingle_hashes(texts, self.shingle_size)
+        return minhash_signatures(hashes, starts, self.num_perm, self.seed)
+
+    def _buckets(self, signatures: np.ndarray, band: int):
+        """Member indices of each band bucket with more than one member."""
+        block = np.ascontiguousarray(
+            signatures[:, band * self.rows : (band + 1) * self.rows]
+        )
+        keys = block.view(np.dtype((np.void, block.dtype.itemsize * self.rows)))
+        inverse = np.unique(keys.ravel(), return_inverse=True)[1].ravel()
+        order = np.argsort(inverse, kind="stable")
+        bounds = np.flatnonzero(np.diff(inverse[order])) + 1
+        starts = np.r_[0, bounds]
+        ends = np.r_[bounds, len(order)]
+        for lo, hi in zip(starts[ends - starts > 1], ends[ends - starts > 1]):
+            yield order[lo:hi]
+
+    def _link(self, signatures: np.ndarray) -> np.ndarray:
+        parent = list(range(len(signatures)))
+
+        def find(i: int) -> int:
+            root = i
+            while parent[root] != root:
+                root = parent[root]
+            while parent[i] != root:
+                parent[i], i = root, parent[i]
+            return root
+
+        for band in range(self.bands):
+            for members in self._buckets(signatures, band):
+                # One representative per component met so far in this
+                # bucket; a member already in one of them is skipped, so a
+                # bucket costs members x components comparisons.
+                reps: list[int] = []
+                for member in members.tolist():
+                    root = find(member)
+                    if any(find(rep) == root for rep in reps):
+                        continue
+                    if reps:
+                        agreement = (signatures[reps] == signatures[member]).mean(
+                            axis=1
+                        )
+                        for j in np.flatnonzero(agreement >= self.threshold):
+                            parent[find(reps[j])] = root
+                        reps = [rep for rep in reps if find(rep) != root]
+                    reps.append(member)
+        return np.array([find(i) for i in range(len(parent))], dtype=np.int64)
+
+    def cluster(self, texts) -> pd.Series:
+        """
+        Cluster id per text.
+
+        Ids are numbered in order of first appearance; rows whose text is
+        missing or empty after normalization get -1.
+
+        Returns:
+            pd.Series: ``int64`` cluster ids aligned with ``texts``.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        normalized = normalize_headlines(texts).where(texts.notna(), "")
+        codes, uniques = pd.factorize(normalized)
+        uniques = pd.Series(np.asarray(uniques, dtype=object))
+
+        labels = np.full(len(uniques), -1, dtype=np.int64)
+        present = np.flatnonzero(uniques.str.len().to_numpy() > 0)
+        if len(present):
+            labels[present] = self._link(self.signatures(uniques.iloc[present]))
+
+        row_labels = labels[codes]
+        valid = row_labels >= 0
+        cluster_ids = np.full(len(texts), -1, dtype=np.int64)
+        cluster_ids[valid] = pd.factorize(row_labels[valid])[0]
+        return pd.Series(cluster_ids, index=texts.index, name="cluster_id")
@@ -0,0 +1,149 @@
+# src/eda/ngram_counter.py
+
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from nlp.text_utils import TokenizedCorpus
+
+_NGRAM_BASE = np.uint64(0x100000001B3)
+
+
+def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Concatenation of ``range(start, start + length)`` for each pair."""
+    total = int(lengths.sum())
+    shift = np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+    return np.arange(total, dtype=np.int64) + shift
+
+
+class NGramCounter:
+    """
+    Out-of-core n-gram counts per group (e.g. per ticker or per day).
+
+    Each chunk is tokenized once per distinct headline, and every n-gram is
+    reduced to a 64-bit hash of its tokens, computed with array operations
+    over the whole chunk. Counts are kept per (n, group, hash) in a sparse
+    table that chunk counts are merged into. When the table grows past
+    ``max_entries`` the rarest entries are pruned, so memory stays bounded.
+    Counts are exact until the first prune; after that an n-gram that was
+    pruned and seen again is undercounted by what it had when pruned
+    (``max_pruned_count`` is the largest count ever discarded). The text of
+    an n-gram is recorded the first time its hash is seen.
+    """
+
+    def __init__(self, ngram_range=(1, 3), max_entries: int = 1_000_000):
+        self.ngram_range = ngram_range
+        self.max_entries = max_entries
+        self.max_pruned_count = 0
+        self._counts = pd.Series(
+            dtype=np.int64,
+            index=pd.MultiIndex.from_arrays(
+                [[], [], np.array([], dtype=np.uint64)], names=["n", "group", "hash"]
+            ),
+        )
+        self._names: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def update(self, texts, groups=None) -> None:
+        """
+        Count the n-grams of one chunk.
+
+        Parameters:
+            texts (iterable of str or pd.Series): Headlines.
+            groups (iterable, optional): Group key per headline (missing
+                keys are skipped). Defaults to a single group ``"all"``.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        if groups is None:
+            groups = np.zeros(len(texts), dtype=np.int64)
+            group_keys = pd.Index(["all"])
+        else:
+            groups, group_keys = pd.factorize(pd.Series(groups).to_numpy())
+        corpus = TokenizedCorpus.from_texts(texts.reset_index(drop=True))
+
+        # Collapse rows to weighted (group, document) pairs.
+        pairs = pd.Series(groups * corpus.n_documents + corpus.codes)
+        pairs = pairs[groups >= 0].value_counts(sort=False)
+        pair_groups = pairs.index.to_numpy() // corpus.n_documents
+        pair_docs = pairs.index.to_numpy() % corpus.n_documents
+        weights = pairs.to_numpy()
+
+        token_hashes = pd.util.hash_array(corpus.vocabulary.astype(object))
+        flat = token_hashes[corpus.token_ids]
+        doc_lengths = np.diff(corpus.offsets)
+
+        frames = []
+        window_hashes = flat
+        min_n, max_n = self.ngram_range
+        for n in range(1, max_n + 1):
+            # Hash of tokens [p, p + n) for every start position p.
+            if n > 1:
+                window_hashes = window_hashes[:-1] * _NGRAM_BASE + flat[n - 1 :]
+            if n < min_n:
+                continue
+            n_windows = np.maximum(doc_lengths[pair_docs] - n + 1, 0)
+            positions = _expand_ranges(corpus.offsets[pair_docs], n_windows)
+            if len(positions) == 0:
+                continue
+            chunk = pd.DataFrame(
+                {
+                    "n": n,
+                    "group": np.repeat(group_keys[pair_groups], n_windows),
+                    "hash": window_hashes[positions],
+                    "count": np.repeat(weights, n_windows),
+                }
+            )
+            chunk = chunk.groupby(["n", "group", "hash"], sort=False)["count"].sum()
+            self._record_names(chunk, corpus, positions, window_hashes, n)
+            frames.append(chunk)
+
+        if frames:
+            merged = pd.concat([self._counts, *frames])
+            self._counts = merged.groupby(level=[0, 1, 2], sort=False).sum()
+            self._prune()
+
+    def _record_names(self, chunk, corpus, positions, window_hashes, n):
+        hashes = chunk.index.get_level_values("hash").to_numpy()
+        known = np.fromiter(self._names, dtype=np.uint64, count=len(self._names))
+        missing = np.unique(hashes[~np.isin(hashes, known)])
+        if len(missing) == 0:
+            return
+        chunk_hashes = window_hashes[positions]
+        sorter = np.argsort(chunk_hashes, kind="stable")
+        first = sorter[np.searchsorted(chunk_hashes[sorter], missing)]
+        for h, start in zip(missing.tolist(), positions[first].tolist()):
+            ids = corpus.token_ids[start : start + n]
+            self._names[h] = " ".join(corpus.vocabulary[ids])
+
+    def _prune(self):
+        if len(self._counts) <= self.max_entries:
+            return
+        counts = self._counts.to_numpy()
+        keep = np.argpartition(-counts, self.max_entries - 1)[: self.max_entries]
+        dropped = np.ones(len(counts), dtype=bool)
+        dropped[keep] = False
+        self.max_pruned_count = max(self.max_pruned_count, int(counts[dropped].max()))
+        self._counts = self._counts.iloc[np.sort(keep)]
+        live = set(self._counts.index.get_level_values("hash").tolist())
+        self._names = {h: name for h, name in self._names.items() if h in live}
+
+    def top(self, k: int = 10, n: Optional[Iterable[int]] = None) -> pd.DataFrame:
+        """
+        The ``k`` most frequent n-grams per group and n-gram size.
+
+        Returns:
+            pd.DataFrame: Columns 'group', 'n', 'ngram' and 'count', sorted
+            by group, n and descending count.
+        """
+        table = self._counts.rename("count").reset_index()
+        if n is not None:
+            table = table[table["n"].isin(list(n))]
+        table = table.sort_values(
+            ["group", "n", "count", "hash"], ascending=[True, True, False, True]
+        )
+        table = table.groupby(["group", "n"], sort=False).head(k)
+        table["ngram"] = table["hash"].map(self._names)
+        return table[["group", "n", "ngram", "count"]].reset_index(drop=True)
@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import seaborn as sns
 
+from .frame_utils import analyzer_frame
+from .heavy_hitters import SlidingTopK, SpaceSaving
+
 
 class PublisherAnalyzer:
     """
@@ -8,7 +13,15 @@ class PublisherAnalyzer:
     including frequency, domain patterns, and sentiment trends.
     """
 
-    def __init__(self, df, publisher_col="publisher", sentiment_col="sentiment_score"):
+    def __init__(
+        self,
+        df,
+        publisher_col="publisher",
+        sentiment_col="sentiment_score",
+        copy=True,
+        ticker_col="stock",
+        date_col="date",
+    ):
         """
         Initialize the analyzer with dataset and column names.
 
@@ -16,11 +29,76 @@ class PublisherAnalyzer:
             df (pd.DataFrame): The input dataset.
             publisher_col (str): Column containing publisher identifiers.
             sentiment_col (str): Column containing sentiment scores (if available).
+            copy (bool): If False, share the caller's column arrays instead
+                of copying the whole frame.
+            ticker_col (str): Column containing tickers (for heavy hitters).
+            date_col (str): Publication date column (for sliding windows).
         """
-        self.df = df.copy()
+        self.df = analyzer_frame(df, copy)
         self.publisher_col = publisher_col
         self.sentiment_col = sentiment_col
+        self.ticker_col = ticker_col
+        self.date_col = date_col
         self.results = {}
+        self._aggregate = None
+        self._codes = None
+
+    def aggregate(self):
+        """
+        Aggregate the dataset per publisher in a single pass.
+
+        Publishers are encoded once (categorical codes, or factorize codes in
+        order of first appearance), and article counts, first row position
+        and sentiment sum/count all come from ``bincount`` over those codes.
+        The domain regex runs on the unique publisher names only.
+
+        Returns:
+            pd.DataFrame: One row per publisher with columns 'count',
+            'first_row', 'sentiment_sum', 'sentiment_count' and 'domain'.
+        """
+        if self._aggregate is not None:
+            return self._aggregate
+
+        publishers = self.df[self.publisher_col]
+        if isinstance(publishers.dtype, pd.CategoricalDtype):
+            codes = publishers.cat.codes.to_numpy()
+            uniques = publishers.cat.categories
+            index = pd.CategoricalIndex(
+                uniques, dtype=publishers.dtype, name=self.publisher_col
+            )
+        else:
+            codes, uniques = pd.factorize(publishers)
+            index = pd.Index(uniques, name=self.publisher_col)
+
+        n_publishers = len(uniques)
+        valid = codes >= 0
+        valid_codes = codes[valid]
+        first_row = np.full(n_publishers, len(codes), dtype=np.int64)
+        np.minimum.at(first_row, valid_codes, np.flatnonzero(valid))
+
+        table = pd.DataFrame(
+            {
+                "count": np.bincount(valid_codes, minlength=n_publishers),
+                "first_row": first_row,
+            },
+            index=index,
+        )
+        if self.sentiment_col in self.df.columns:
+            scores = self.df[self.sentiment_col].to_numpy(dtype=float, na_value=np.nan)
+            scored = valid & ~np.isnan(scores)
+            table["sentiment_sum"] = np.bincount(
+                codes[scored], weights=scores[scored], minlength=n_publishers
+            )
+            table["sentiment_count"] = np.bincount(
+                codes[scored], minlength=n_publishers
+            )
+        table["domain"] = (
+            pd.Index(uniques).astype(str).str.extract(r"@([\w\.-]+)")[0].to_numpy()
+        )
+
+        self._codes = codes
+        self._aggregate = table
+        return table
 
     def analyze_top_publishers(self, top_n=10, plot=True):
         """
@@ -33,13 +111,16 @@ class PublisherAnalyzer:
         Returns:
             pd.Series: Publisher counts for the top N publishers.
         """
-        top_publishers = self.df[self.publisher_col].value_counts().head(top_n)
+        counts = self.aggregate()["count"].rename("count")
+        top_publishers = counts.sort_values(ascending=False).head(top_n)
         self.results["top_publishers"] = top_publishers
 
         if plot:
             plt.figure(figsize=(8, 5))
             sns.barplot(
-                x=top_publishers.values, y=top_publishers.index, palette="viridis"
+                x=top_publishers.values,
+                y=top_publishers.index.astype(str),
+                palette="viridis",
             )
             plt.title("Top Publishers")
             plt.xlabel("Article Count")
@@ -59,10 +140,23 @@ class PublisherAnalyzer:
         Returns:
             pd.Series: Domain counts for the top N domains.
         """
-        self.df["publisher_domain"] = self.df[self.publisher_col].str.extract(
-            r"@([\w\.-]+)"
+        table = self.aggregate()
+        domains = table["domain"].to_numpy()
+        self.df["publisher_domain"] = np.append(domains, np.nan)[self._codes]
+
+        # Count domains in order of first appearance, like value_counts.
+        present = table[(table["count"] > 0) & table["domain"].notna()]
+        present = present.sort_values("first_row", kind="stable")
+        domain_codes, domain_names = pd.factorize(present["domain"])
+        domain_counts = (
+            pd.Series(
+                np.bincount(domain_codes, weights=present["count"]).astype(np.int64),
+                index=pd.Index(domain_names, name="publisher_domain"),
+                name="count",
+            )
+            .sort_values(ascending=False)
+            .head(top_n)
         )
-        domain_counts = self.df["publisher_domain"].value_counts().head(top_n)
         self.results["domain_counts"] = domain_counts
 
         if plot:
@@ -92,9 +186,15 @@ class PublisherAnalyzer:
             print("⚠️ Sentiment column not found. Skipping sentiment analysis.")
             return None
 
+        table = self.aggregate()
+        table = table[table["count"] > 0]
+        if not isinstance(table.index, pd.CategoricalIndex):
+            table = table.sort_index()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            means = table["sentiment_sum"] / table["sentiment_count"]
         sentiment_by_pub = (
-            self.df.groupby(self.publisher_col)[self.sentiment_col]
-            .mean()
+            means.where(table["sentiment_count"] > 0)
+            .rename(self.sentiment_col)
             .sort_values(ascending=False)
             .head(top_n)
         )
@@ -103,7 +203,9 @@ class PublisherAnalyzer:
         if plot:
             plt.figure(figsize=(8, 5))
             sns.barplot(
-                x=sentiment_by_pub.values, y=sentiment_by_pub.index, palette="crest"
+                x=sentiment_by_pub.values,
+                y=sentiment_by_pub.index.astype(str),
+                palette="crest",
             )
             plt.title("Top Publishers by Average Sentiment")
             plt.xlabel("Avg Sentiment Score")
@@ -112,6 +214,62 @@ class PublisherAnalyzer:
 
         return sentiment_by_pub
 
+    def track_heavy_hitters(
+        self, column=None, capacity=100, window=None, bucket="1h", chunksize=100_000
+    ):
+        """
+        Build a bounded-memory top-k sketch of a column, chunk by chunk.
+
+        The returned sketch can be merged with sketches built on other
+        workers (``SpaceSaving.merge``) or fed further batches from a live
+        feed. Each estimate overestimates the true count by at most
+        N / capacity, and every value seen more than N / capacity times is
+        tracked.
+
+        Parameters:
+            column (str): Column to track; defaults to the publisher column.
+            capacity (int): Number of counters kept.
+            window (str, optional): Sliding window such as ``"6h"``. When
+                given, a ``SlidingTopK`` over the date column is returned.
+            bucket (str): Bucket width of the sliding window.
+            chunksize (int): Rows fed to the sketch per batch.
+
+        Returns:
+            SpaceSaving or SlidingTopK: The sketch.
+        """
+        column = column or self.publisher_col
+        if column not in self.df.columns:
+            raise ValueError(f"Column '{column}' not found.")
+        if window is not None and self.date_col not in self.df.columns:
+            raise ValueError(f"Column '{self.date_col}' not found.")
+
+        if window is None:
+            sketch = SpaceSaving(capacity)
+        else:
+            sketch = SlidingTopK(window=window, bucket=bucket, capacity=capacity)
+        for start in range(0, len(self.df), chunksize):
+            chunk = self.df.iloc[start : start + chunksize]
+            values = chunk[column].dropna()
+            if window is None:
+                sketch.update_many(values)
+            else:
+                sketch.update(values, chunk.loc[values.index, self.date_col])
+        return sketch
+
+    def analyze_heavy_hitters(self, column=None, top_n=10, capacity=100, window=None):
+        """
+        Approximate top values of a column (publishers or tickers) with
+        their error bounds, optionally over the last ``window`` of data.
+
+        Returns:
+            pd.DataFrame: Columns 'count', 'error' and 'guaranteed'.
+        """
+        column = column or self.publisher_col
+        sketch = self.track_heavy_hitters(column, capacity=capacity, window=window)
+        top = sketch.top(top_n)
+        self.results[f"heavy_hitters_{column}"] = top
+        return top
+
     def run_all(self, top_n=10, plot=True):
         """
         Run all analyses: top publishers, domain extraction, and sentiment scores.
@@ -0,0 +1,192 @@
+# src/eda/quantile_sketch.py
+
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+DESCRIBE_PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class QuantileSketch:
+    """
+    Mergeable KLL quantile sketch with exact count, mean, std, min and max.
+
+    Values are kept in a stack of compactors; an item at level ``h``
+    stands for ``2 ** h`` input values. When a level outgrows its
+    capacity it is sorted and every other item (random offset) is promoted
+    to the next level. Capacities shrink geometrically below the top
+    level, so the sketch holds about ``3 * k`` items however many values
+    are added. The rank error of a quantile is about ``1.7 / k`` of the
+    count (k=200: under 1%), and quantiles are exact until the first
+    compaction. Sketches built per chunk or per worker combine with
+    ``merge``; moments are merged exactly.
+    """
+
+    def __init__(self, k: int = 200, seed: Optional[int] = 0):
+        if k < 8:
+            raise ValueError("k must be at least 8.")
+        self.k = k
+        self._rng = np.random.default_rng(seed)
+        self._levels = [np.empty(0, dtype=np.float64)]
+        self.count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self._levels) - 1 - level
+        return max(int(np.ceil(self.k * (2 / 3) ** depth)), 2)
+
+    def _add_moments(self, count: int, mean: float, m2: float, lo, hi) -> None:
+        # Chan et al. pairwise update of count, mean and sum of squares.
+        total = self.count + count
+        delta = mean - self._mean
+        self._mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.min = np.fmin(self.min, lo)
+        self.max = np.fmax(self.max, hi)
+
+    def update(self, values) -> "QuantileSketch":
+        """Add an array of values; NaNs are ignored."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return self
+        mean = values.mean()
+        self._add_moments(
+            len(values),
+            mean,
+            float(((values - mean) ** 2).sum()),
+            values.min(),
+            values.max(),
+        )
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """Fold ``other`` into this sketch (in place) and return it."""
+        if other.count == 0:
+            return self
+        self._add_moments(other.count, other._mean, other._m2, other.min, other.max)
+        for level, items in enumerate(other._levels):
+            if level == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            self._levels[level] = np.concatenate([self._levels[level], items])
+        self._compress()
+        return self
+
+    def _compress(self) -> None:
+        # Lazy compaction: only while the sketch as a whole is over budget,
+        # and always at the lowest level that is over its own capacity.
+        while sum(map(len, self._levels)) > sum(
+            self._capacity(level) for level in range(len(self._levels))
+        ):
+            level = next(
+                h
+                for h, items in enumerate(self._levels)
+                if len(items) > self._capacity(h)
+            )
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+            items = np.sort(self._levels[level])
+            # An odd item out stays behind so the total weight is kept.
+            held, items = items[: len(items) % 2], items[len(items) % 2 :]
+            promoted = items[self._rng.integers(2) :: 2]
+            self._levels[level] = held
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], promoted]
+            )
+
+    def _weighted_items(self) -> tuple[np.ndarray, np.ndarray]:
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(len(values), 2.0**h) for h, values in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        return items[order], weights[order]
+
+    @property
+    def exact(self) -> bool:
+        """Whether no compaction has happened yet (quantiles are exact)."""
+        return len(self._levels) == 1
+
+    def quantile(self, q):
+        """
+        Approximate quantile(s) ``q`` in [0, 1]. While the sketch is exact
+        this matches ``pd.Series.quantile`` (linear interpolation).
+        """
+        scalar = np.ndim(q) == 0
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if self.count == 0:
+            result = np.full(len(q), np.nan)
+        elif self.exact:
+            result = np.quantile(self._levels[0], q)
+        else:
+            items, weights = self._weighted_items()
+            ranks = np.cumsum(weights)
+            position = np.searchsorted(ranks, q * ranks[-1], side="left")
+            result = items[np.minimum(position, len(items) - 1)]
+            result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+        return float(result[0]) if scalar else result
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self.count else np.nan
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (``ddof=1``), as in ``describe``."""
+        return np.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else np.nan
+
+    def describe(self, name=None, percentiles=DESCRIBE_PERCENTILES) -> pd.Series:
+        """
+        Summary in the layout of ``pd.Series.describe`` for numeric data.
+        Count, mean, std, min and max are exact; percentiles come from the
+        sketch.
+        """
+        labels = [f"{p * 100:g}%" for p in percentiles]
+        values = [self.count, self.mean, self.std, self.min]
+        values += list(self.quantile(list(percentiles))) + [self.max]
+        return pd.Series(
+            values,
+            index=["count", "mean", "std", "min", *labels, "max"],
+            dtype=np.float64,
+            name=name,
+        )
+
+    def histogram(self, bins=30, range=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate histogram, like ``np.histogram``: (counts, bin_edges).
+        Counts are the sketch weights per bin and sum to ``count``.
+        """
+        if range is None and self.count:
+            range = (self.min, self.max)
+        items, weights = self._weighted_items()
+        return np.histogram(items, bins=bins, range=range, weights=weights)
+
+
+def sketch_series(
+    values: pd.Series,
+    chunksize: int = 100_000,
+    k: int = 200,
+    transform: Optional[Callable[[pd.Series], pd.Series]] = None,
+) -> QuantileSketch:
+    """
+    Build a ``QuantileSketch`` of a Series chunk by chunk, applying
+    ``transform`` (e.g. ``text_lengths``) to each chunk first. Values that
+    are not numeric are ignored.
+    """
+    sketch = QuantileSketch(k=k)
+    for start in range(0, len(values), chunksize):
+        chunk = values.iloc[start : start + chunksize]
+        if transform is not None:
+            chunk = transform(chunk)
+        sketch.update(pd.to_numeric(chunk, errors="coerce").to_numpy(np.float64))
+    return sketch
@@ -0,0 +1,143 @@
+# src/eda/spike_detector.py
+
+import json
+from typing import Hashable, Iterable
+
+import numpy as np
+
+
+class StreamingSpikeDetector:
+    """
+    Online spike detector for per-bin article counts.
+
+    Each key (e.g. a ticker, or a single key for the whole feed) keeps an
+    exponentially weighted mean and variance that are updated in O(1) per
+    bin. A count is a spike when it exceeds ``mean + threshold * std`` of
+    the state *before* the update, once the key has seen ``min_periods``
+    bins. The std in that limit is at least ``min_std``, so a key whose
+    warm-up was constant (variance 0) is not flagged on every small rise.
+    With ``clip=True`` the value folded into the state is capped at that
+    limit, so a burst does not inflate the baseline it is judged against.
+    The state can be checkpointed with ``save``/``load``.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.1,
+        threshold: float = 3.0,
+        min_periods: int = 5,
+        clip: bool = True,
+        min_std: float = 1.0,
+    ):
+        if not 0 < alpha <= 1:
+            raise ValueError("alpha must be in (0, 1].")
+        self.alpha = alpha
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self.clip = clip
+        self.min_std = min_std
+        self._slots: dict[Hashable, int] = {}
+        self._mean = np.zeros(16)
+        self._var = np.zeros(16)
+        self._n = np.zeros(16, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def _slot_array(self, keys: Iterable[Hashable]) -> np.ndarray:
+        slots = []
+        for key in keys:
+            slot = self._slots.get(key)
+            if slot is None:
+                slot = self._slots[key] = len(self._slots)
+            slots.append(slot)
+        if len(self._slots) > len(self._n):
+            size = max(len(self._slots), 2 * len(self._n))
+            self._mean = np.resize(self._mean, size)
+            self._var = np.resize(self._var, size)
+            self._n = np.resize(self._n, size)
+            self._n[len(self._slots) :] = 0
+        return np.asarray(slots, dtype=np.int64)
+
+    def update_many(self, keys, counts) -> np.ndarray:
+        """
+        Feed one bin for several distinct keys at once.
+
+        Returns:
+            np.ndarray: Boolean spike flag per key.
+        """
+        slots = self._slot_array(keys)
+        if len(np.unique(slots)) != len(slots):
+            raise ValueError("Keys in one update must be distinct.")
+        counts = np.asarray(counts, dtype=float)
+
+        mean, var, n = self._mean[slots], self._var[slots], self._n[slots]
+        limit = mean + self.threshold * np.maximum(np.sqrt(var), self.min_std)
+        warm = n >= self.min_periods
+        is_spike = warm & (counts > limit)
+
+        value = np.where(warm & self.clip, np.minimum(counts, limit), counts)
+        diff = value - mean
+        increment = self.alpha * diff
+        new_mean = np.where(n == 0, value, mean + increment)
+        new_var = np.where(n == 0, 0.0, (1 - self.alpha) * (var + diff * increment))
+
+        self._mean[slots] = new_mean
+        self._var[slots] = new_var
+        self._n[slots] = n + 1
+        return is_spike
+
+    def update(self, key: Hashable, count: float) -> bool:
+        """Feed the count of the next bin for ``key``; return its spike flag."""
+        return bool(self.update_many([key], [count])[0])
+
+    def scan(self, counts, key: Hashable = None) -> np.ndarray:
+        """Feed a whole series of bins for one key and return all spike flags."""
+        return np.array([self.update(key, count) for count in counts], dtype=bool)
+
+    def state(self, key: Hashable) -> dict:
+        """Current mean, standard deviation and bin count of ``key``."""
+        slot = self._slots[key]
+        return {
+            "mean": float(self._mean[slot]),
+            "std": float(np.sqrt(self._var[slot])),
+            "n": int(self._n[slot]),
+        }
+
+    def save(self, path) -> None:
+        """Checkpoint parameters and per-key state to an ``.npz`` file."""
+        size = len(self._slots)
+        params = {
+            "alpha": self.alpha,
+            "threshold": self.threshold,
+            "min_periods": self.min_periods,
+            "clip": self.clip,
+            "min_std": self.min_std,
+        }
+        # Keys may be any hashable (numpy ints, tuples), so they are
+        # pickled as an object array rather than written to JSON.
+        keys = np.empty(size, dtype=object)
+        keys[:] = list(self._slots)
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                mean=self._mean[:size],
+                var=self._var[:size],
+                n=self._n[:size],
+                keys=keys,
+                params=np.array(json.dumps(params)),
+            )
+
+    @classmethod
+    def load(cls, path) -> "StreamingSpikeDetector":
+        """Restore a detector saved with ``save``."""
+        with np.load(path, allow_pickle=True) as data:
+            params = json.loads(str(data["params"]))
+            keys = data["keys"].tolist()
+            detector = cls(**params)
+            detector._slot_array(keys)
+            size = len(keys)
+            detector._mean[:size] = data["mean"]
+            detector._var[:size] = data["var"]
+            detector._n[:size] = data["n"]
+        return detector
@@ -1,7 +1,15 @@
 import difflib
+from typing import Optional
 
 import pandas as pd
 
+from .data_quality_utils import parse_datetime_column
+from .frame_utils import analyzer_frame, text_lengths
+from .near_duplicates import NearDuplicateDetector
+from .ngram_counter import NGramCounter
+from .quantile_sketch import QuantileSketch, sketch_series
+from .time_buckets import TimeBuckets
+
 
 class TextualEDA:
     def __init__(
@@ -10,36 +18,132 @@ class TextualEDA:
         headline_col: str = "headline",
         source_col: str = "source",
         date_col: str = "date",
+        copy: bool = True,
+        ticker_col: str = "stock",
+        score_col: str = "sentiment_score",
     ):
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Input must be a pandas DataFrame")
-        self.df = df.copy()
+        self.df = analyzer_frame(df, copy)
+        self.source_columns = df.columns
         self.headline_col = headline_col
         self.source_col = source_col
         self.date_col = date_col
+        self.ticker_col = ticker_col
+        self.score_col = score_col
+
+    def length_sketch(self, chunksize: int = 100_000, k: int = 200) -> QuantileSketch:
+        """Quantile sketch of headline lengths, built chunk by chunk."""
+        return sketch_series(self.df[self.headline_col], chunksize, k, text_lengths)
 
-    def headline_length_stats(self) -> pd.Series:
+    def headline_length_stats(
+        self, chunksize: int = 100_000, k: int = 200
+    ) -> pd.Series:
         """
         Compute basic statistics (count, mean, std, min, max, etc.)
         for headline lengths.
+
+        Lengths are summarized with a ``QuantileSketch`` instead of being
+        materialized: count, mean, std, min and max are exact and the
+        quartiles are within about ``1.7 / k`` in rank (exact for fewer
+        than ``k`` headlines).
+
+        Parameters:
+            chunksize (int): Headlines measured at a time.
+            k (int): Sketch size; larger is more accurate.
+        """
+        return self.length_sketch(chunksize, k).describe("headline_length")
+
+    def sentiment_score_stats(
+        self, chunksize: int = 100_000, k: int = 200
+    ) -> pd.Series:
         """
-        self.df["headline_length"] = self.df[self.headline_col].astype(str).str.len()
-        return self.df["headline_length"].describe()
+        ``describe()``-style statistics of the sentiment score column,
+        summarized with a ``QuantileSketch`` like ``headline_length_stats``.
+        """
+        if self.score_col not in self.df.columns:
+            raise KeyError(f"Column '{self.score_col}' not found.")
+        sketch = sketch_series(self.df[self.score_col], chunksize, k)
+        return sketch.describe(self.score_col)
+
+    def cluster_near_duplicates(self, threshold: float = 0.8, **kwargs) -> pd.Series:
+        """
+        Assign each headline a near-duplicate cluster id (MinHash LSH),
+        stored in the 'cluster_id' column. Missing headlines get -1.
 
-    def articles_per_publisher(self) -> pd.Series:
+        Parameters:
+            threshold (float): Estimated Jaccard similarity of character
+                shingles above which two headlines are linked.
+            **kwargs: Passed to ``NearDuplicateDetector``.
+        """
+        detector = NearDuplicateDetector(threshold=threshold, **kwargs)
+        self.df["cluster_id"] = detector.cluster(self.df[self.headline_col])
+        return self.df["cluster_id"]
+
+    def top_ngrams(
+        self,
+        ngram_range=(1, 3),
+        k: int = 10,
+        by: Optional[str] = None,
+        chunksize: int = 100_000,
+        max_entries: int = 1_000_000,
+    ) -> pd.DataFrame:
+        """
+        Most frequent unigrams, bigrams and trigrams, overall or per group.
+
+        Headlines are counted chunk by chunk with ``NGramCounter``, which
+        keeps at most ``max_entries`` (n, group, n-gram) counts in memory.
+
+        Parameters:
+            ngram_range (tuple): Smallest and largest n-gram size.
+            k (int): N-grams to return per group and size.
+            by (str, optional): "ticker", "day" (UTC calendar day of the
+                date column) or any column name; None counts overall.
+            chunksize (int): Rows per chunk.
+            max_entries (int): Bound on the number of counts kept.
+
+        Returns:
+            pd.DataFrame: Columns 'group', 'n', 'ngram' and 'count'.
+        """
+        counter = NGramCounter(ngram_range=ngram_range, max_entries=max_entries)
+        for start in range(0, len(self.df), chunksize):
+            chunk = self.df.iloc[start : start + chunksize]
+            counter.update(chunk[self.headline_col], self._ngram_groups(chunk, by))
+        return counter.top(k)
+
+    def _ngram_groups(self, chunk: pd.DataFrame, by):
+        if by is None:
+            return None
+        if by == "day":
+            return parse_datetime_column(chunk[self.date_col]).dt.floor("D")
+        column = self.ticker_col if by == "ticker" else by
+        if column not in chunk.columns:
+            raise KeyError(f"Column '{column}' not found.")
+        return chunk[column]
+
+    def articles_per_publisher(self, dedupe: bool = False) -> pd.Series:
         """
         Count the number of articles per publisher,
         with a helpful suggestion if missing.
+
+        With ``dedupe=True`` each near-duplicate cluster counts once, for
+        the publisher of its first row (see ``cluster_near_duplicates``).
         """
         if self.source_col not in self.df.columns:
             suggestion = difflib.get_close_matches(
-                self.source_col, self.df.columns, n=1
+                self.source_col, self.source_columns, n=1
             )
             message = f"Column '{self.source_col}' not found."
             if suggestion:
                 message += f" Did you mean '{suggestion[0]}'?"
             raise KeyError(message)
-        return self.df[self.source_col].value_counts()
+        if not dedupe:
+            return self.df[self.source_col].value_counts()
+        if "cluster_id" not in self.df.columns:
+            self.cluster_near_duplicates()
+        clusters = self.df["cluster_id"]
+        first = ~clusters.duplicated() | (clusters < 0)
+        return self.df.loc[first, self.source_col].value_counts()
 
     def publication_trends(self) -> tuple[pd.Series, pd.Series]:
         """
@@ -52,8 +156,17 @@ class TextualEDA:
         self.df[self.date_col] = pd.to_datetime(self.df[self.date_col], errors="coerce")
         self.df = self.df.dropna(subset=[self.date_col])
 
-        daily_counts = self.df[self.date_col].dt.date.value_counts().sort_index()
-        weekday_distribution = self.df[self.date_col].dt.day_name().value_counts()
+        buckets = TimeBuckets(self.df[self.date_col])
+        daily_counts = buckets.counts("day")
+        daily_counts.index = pd.Index(daily_counts.index.date, name=self.date_col)
+        # Most frequent first; ties keep their order of first appearance,
+        # as value_counts() does.
+        seen = pd.unique(buckets.weekday)
+        weekday_distribution = (
+            buckets.counts("weekday", fill=True)
+            .iloc[seen]
+            .sort_values(ascending=False, kind="stable")
+        )
 
         return daily_counts, weekday_distribution
 
@@ -66,7 +179,4 @@ class TextualEDA:
                 f"Column '{self.date_col}' could not be converted to datetime."
             )
 
-        weekdays = self.df[self.date_col].dt.day_name()
-        return weekdays.value_counts().sort_index(
-            key=lambda x: pd.to_datetime(x, format="%A").dayofweek
-        )
+        return TimeBuckets(self.df[self.date_col]).counts("weekday")
@@ -0,0 +1,97 @@
+# src/eda/time_buckets.py
+
+import numpy as np
+import pandas as pd
+
+WEEKDAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+UNITS = ("day", "weekday", "hour")
+
+_NS_PER_HOUR = 3_600 * 10**9
+_NS_PER_DAY = 24 * _NS_PER_HOUR
+_EPOCH_WEEKDAY = 3  # 1970-01-01 was a Thursday
+
+
+class TimeBuckets:
+    """
+    Integer day, weekday and hour codes of a datetime column.
+
+    The column is converted once to int64 nanoseconds of wall-clock time
+    (timezone-aware values keep their local time, as ``.dt.date`` does);
+    day codes are days since the epoch, weekday codes 0 (Monday) to 6 and
+    hour codes 0 to 23. Counts and means per bucket are ``np.bincount``
+    reductions over these codes, with no per-row Python objects.
+    Missing timestamps belong to no bucket.
+    """
+
+    def __init__(self, dates: pd.Series):
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            raise TypeError("TimeBuckets needs a datetime column.")
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+        self.name = dates.name
+        self.valid = dates.notna().to_numpy()
+        nanos = dates.to_numpy(dtype="datetime64[ns]").view(np.int64)[self.valid]
+        self.day = nanos // _NS_PER_DAY
+        self.weekday = (self.day + _EPOCH_WEEKDAY) % 7
+        self.hour = (nanos // _NS_PER_HOUR) % 24
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    def _codes(self, unit: str) -> tuple[np.ndarray, int, int]:
+        """Codes shifted to start at 0, their offset and the bucket count."""
+        if unit == "weekday":
+            return self.weekday, 0, 7
+        if unit == "hour":
+            return self.hour, 0, 24
+        if unit != "day":
+            raise ValueError(f"unit must be one of {UNITS}.")
+        if len(self.day) == 0:
+            return self.day, 0, 0
+        first = int(self.day.min())
+        return self.day - first, first, int(self.day.max()) - first + 1
+
+    def _labels(self, unit: str, offset: int, size: int) -> pd.Index:
+        if unit == "weekday":
+            labels = pd.Index(WEEKDAY_NAMES)
+        elif unit == "hour":
+            labels = pd.RangeIndex(24)
+        else:
+            days = np.arange(offset, offset + size, dtype=np.int64)
+            labels = pd.DatetimeIndex(days.astype("datetime64[D]").astype("M8[ns]"))
+        return labels.rename(self.name)
+
+    def counts(self, unit: str = "day", fill: bool = False) -> pd.Series:
+        """
+        Rows per bucket, as a Series named 'count'.
+
+        Buckets are in time order (Monday first for weekdays); only
+        non-empty buckets are kept unless ``fill`` is set. Day buckets are
+        labelled by midnight timestamps.
+        """
+        codes, offset, size = self._codes(unit)
+        counts = np.bincount(codes, minlength=size)
+        result = pd.Series(counts, index=self._labels(unit, offset, size), name="count")
+        return result if fill else result[counts > 0]
+
+    def means(self, values, unit: str = "day") -> pd.Series:
+        """
+        Mean of ``values`` (aligned with the dates) per non-empty bucket;
+        missing values are ignored.
+        """
+        values = np.asarray(values, dtype=np.float64)[self.valid]
+        present = ~np.isnan(values)
+        codes, offset, size = self._codes(unit)
+        counts = np.bincount(codes[present], minlength=size)
+        sums = np.bincount(codes[present], weights=values[present], minlength=size)
+        keep = counts > 0
+        labels = self._labels(unit, offset, size)[keep]
+        return pd.Series(sums[keep] / counts[keep], index=labels)
@@ -1,27 +1,337 @@
 # src/eda/time_series_analyzer.py
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
+from pandas.tseries.frequencies import to_offset
+from scipy import sparse as sp
+
+from .frame_utils import analyzer_frame
+from .spike_detector import StreamingSpikeDetector
+
+
+class GroupedCounts:
+    """
+    Article counts for many groups on one shared time axis.
+
+    ``matrix`` has one row per group and one column per time bin; it is a
+    dense ``int64`` array or a ``scipy.sparse`` CSR matrix.
+    """
+
+    def __init__(self, matrix, groups: pd.Index, index: pd.DatetimeIndex):
+        self.matrix = matrix
+        self.groups = groups
+        self.index = index
+
+    @property
+    def is_sparse(self) -> bool:
+        return sp.issparse(self.matrix)
+
+    def row(self, position: int) -> np.ndarray:
+        row = self.matrix[position]
+        return row.toarray().ravel() if self.is_sparse else np.asarray(row)
+
+    def series(self, group) -> pd.Series:
+        """Counts of one group over the shared time axis."""
+        return pd.Series(
+            self.row(self.groups.get_loc(group)), index=self.index, name=group
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """Dense time x group frame."""
+        dense = self.matrix.toarray() if self.is_sparse else self.matrix
+        return pd.DataFrame(dense.T, index=self.index, columns=self.groups)
+
+    def active_spans(self) -> tuple[np.ndarray, np.ndarray]:
+        """First and last non-empty time bin of every group."""
+        if self.is_sparse:
+            coo = self.matrix.tocoo()
+            rows, cols = coo.row, coo.col
+        else:
+            rows, cols = np.nonzero(self.matrix)
+        n_groups = len(self.groups)
+        first = np.full(n_groups, len(self.index), dtype=np.int64)
+        last = np.full(n_groups, -1, dtype=np.int64)
+        np.minimum.at(first, rows, cols)
+        np.maximum.at(last, rows, cols)
+        return first, last
 
 
 class TimeSeriesAnalyzer:
-    def __init__(self, df: pd.DataFrame, date_col: str = "date"):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        date_col: str = "date",
+        copy: bool = True,
+        cube_freq: str = "h",
+    ):
         if date_col not in df.columns:
             raise KeyError(f"Column '{date_col}' not found in DataFrame.")
-        self.df = df.copy()
+        self.df = analyzer_frame(df, copy)
         self.date_col = date_col
+        self.cube_freq = cube_freq
+        self._count_cube: pd.Series | None = None
+        self._row_bins: np.ndarray | None = None
+        self._frequency_cache: dict[str, pd.Series] = {}
         self._prepare_date_index()
 
+    @classmethod
+    def from_store(
+        cls,
+        store_root: str,
+        tickers: list[str] | None = None,
+        start=None,
+        end=None,
+        period=None,
+        date_col: str = "date",
+        group_cols: list[str] | None = None,
+    ) -> "TimeSeriesAnalyzer":
+        """
+        Build an analyzer from a news store query. Only the date column and
+        any ``group_cols`` are read.
+        """
+        # Imported here: utils imports eda, so a module-level import would
+        # make the two packages import each other.
+        from utils.news_store import read_news_store
+
+        df = read_news_store(
+            store_root,
+            tickers=tickers,
+            start=start,
+            end=end,
+            period=period,
+            columns=[date_col, *(group_cols or [])],
+        )
+        return cls(df, date_col=date_col, copy=False)
+
     def _prepare_date_index(self):
         """Ensure datetime index for time series operations."""
         self.df[self.date_col] = pd.to_datetime(self.df[self.date_col], errors="coerce")
         self.df.dropna(subset=[self.date_col], inplace=True)
         self.df.set_index(self.date_col, inplace=True)
 
+    def count_cube(self) -> pd.Series:
+        """
+        Article counts per ``cube_freq`` bin (int32), built once from the raw
+        rows with a single ``bincount`` and cached. Coarser frequencies are
+        rolled up from this cube instead of rescanning the rows.
+        """
+        if self._count_cube is None:
+            step = pd.Timedelta(to_offset(self.cube_freq)).value
+            stamps = self.df.index.asi8
+            first = (stamps.min() // step) * step
+            bins = (stamps - first) // step
+            counts = np.bincount(bins).astype(np.int32)
+
+            index = pd.DatetimeIndex(
+                first + np.arange(len(counts), dtype=np.int64) * step,
+                name=self.date_col,
+            )
+            tz = self.df.index.tz
+            if tz is not None:
+                index = index.tz_localize("UTC").tz_convert(tz)
+            self._row_bins = bins
+            self._count_cube = pd.Series(counts, index=index)
+        return self._count_cube
+
+    def _rolls_up(self, freq: str) -> bool:
+        """
+        Whether ``freq`` bins are unions of whole cube bins: ``freq`` is a
+        fixed duration that the cube step divides, and every UTC offset of
+        the index is a multiple of the step, so local bin edges fall on the
+        UTC-aligned cube edges (not so in e.g. Asia/Kolkata, +05:30, with an
+        hourly cube). Calendar frequencies such as 'W', 'ME' or 'B' are
+        resampled from the rows.
+        """
+        if len(self.df) == 0:
+            return False
+        offset = to_offset(freq)
+        step = to_offset(self.cube_freq).nanos
+        if not isinstance(offset, pd.offsets.Tick) or offset.nanos % step:
+            return False
+        index = self.df.index
+        if index.tz is None:
+            return True
+        utc_offsets = index.tz_localize(None).asi8 - index.asi8
+        return not (utc_offsets % step).any()
+
     def get_publication_frequency(self, freq: str = "D") -> pd.Series:
         """Return article counts aggregated by given frequency (e.g. 'D', 'W', 'M')."""
-        return self.df.resample(freq).size()
+        if freq not in self._frequency_cache:
+            if self._rolls_up(freq):
+                counts = self.count_cube().resample(freq).sum().astype("int64")
+            else:
+                counts = self.df.resample(freq).size()
+            self._frequency_cache[freq] = counts
+        return self._frequency_cache[freq].copy()
+
+    def _time_codes(self, freq: str) -> tuple[np.ndarray, pd.DatetimeIndex]:
+        """Time-bin code of every row for ``freq``, plus the bin labels."""
+        labels = self.get_publication_frequency(freq).index
+        if self._rolls_up(freq):
+            cube = self.count_cube()
+            # First cube bin of each coarse bin; every coarse bin has one
+            # because the cube is dense.
+            starts = (
+                pd.Series(np.arange(len(cube)), index=cube.index)
+                .resample(freq)
+                .min()
+                .to_numpy()
+            )
+            cube_to_bin = np.searchsorted(starts, np.arange(len(cube)), "right") - 1
+            return cube_to_bin[self._row_bins], labels
+        # Bin numbers (empty bins included) in time order, scattered back to
+        # the row order.
+        order = np.argsort(self.df.index.asi8, kind="stable")
+        rows = pd.Series(order, index=self.df.index[order])
+        codes = np.empty(len(order), dtype=np.int64)
+        codes[order] = rows.groupby(pd.Grouper(freq=freq)).ngroup().to_numpy()
+        return codes, labels
+
+    def get_grouped_frequency(
+        self, group_col: str, freq: str = "D", sparse: bool = False
+    ) -> GroupedCounts:
+        """
+        Article counts per group (e.g. ticker or publisher) and time bin,
+        computed for all groups with a single ``bincount`` over
+        (group code, time bin).
+
+        Parameters:
+            group_col (str): Column to group by. For an analyzer built with
+                ``from_store`` it must be listed in ``group_cols``.
+            freq (str): Time-bin frequency.
+            sparse (bool): Return a CSR matrix instead of a dense array.
+        """
+        if group_col not in self.df.columns:
+            raise KeyError(
+                f"Column '{group_col}' not found in DataFrame. "
+                "Pass it in group_cols when reading from a store."
+            )
+        time_codes, labels = self._time_codes(freq)
+        group_codes, groups = pd.factorize(self.df[group_col], sort=True)
+        valid = group_codes >= 0
+        group_codes, time_codes = group_codes[valid], time_codes[valid]
+        shape = (len(groups), len(labels))
+
+        if sparse:
+            matrix = sp.csr_matrix(
+                (np.ones(len(group_codes), dtype=np.int64), (group_codes, time_codes)),
+                shape=shape,
+            )
+            matrix.sum_duplicates()
+        else:
+            flat = group_codes.astype(np.int64) * shape[1] + time_codes
+            matrix = np.bincount(flat, minlength=shape[0] * shape[1]).reshape(shape)
+        return GroupedCounts(matrix, pd.Index(groups, name=group_col), labels)
+
+    def detect_grouped_spikes(
+        self,
+        group_col: str,
+        freq: str = "D",
+        threshold: float = 3.0,
+        sparse: bool = False,
+        method: str = "std",
+        alpha: float = 0.1,
+        min_periods: int = 5,
+    ) -> pd.DataFrame:
+        """
+        Apply ``detect_spikes`` to every group at once. Each group is judged
+        over its own active span (first to last non-empty bin), as if the
+        group had its own analyzer; ``method`` works as in ``detect_spikes``.
+
+        Returns:
+            pd.DataFrame: Columns ``group_col``, ``date_col`` and
+            ``article_count``, one row per spike.
+        """
+        grouped = self.get_grouped_frequency(group_col, freq, sparse)
+        if method == "ewma":
+            return self._ewma_grouped_spikes(
+                grouped, group_col, threshold, alpha, min_periods
+            )
+        if method != "std":
+            raise ValueError(f"Unknown spike detection method: {method}")
+
+        matrix = grouped.matrix
+        first, last = grouped.active_spans()
+        n_bins = (last - first + 1).astype(float)
+        totals = np.asarray(matrix.sum(axis=1)).ravel()
+        squares = matrix.multiply(matrix) if grouped.is_sparse else matrix**2
+        sum_squares = np.asarray(squares.sum(axis=1)).ravel()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = totals / n_bins
+            variance = (sum_squares - n_bins * mean**2) / (n_bins - 1)
+            std = np.sqrt(np.maximum(variance, 0.0))
+        limit = mean + threshold * std
+
+        if grouped.is_sparse:
+            coo = matrix.tocoo()
+            rows, cols, counts = coo.row, coo.col, coo.data
+        else:
+            rows, cols = np.nonzero(matrix)
+            counts = matrix[rows, cols]
+        is_spike = counts > limit[rows]
+        spikes = pd.DataFrame(
+            {
+                group_col: grouped.groups.take(rows[is_spike]),
+                self.date_col: grouped.index.take(cols[is_spike]),
+                "article_count": counts[is_spike].astype(np.int64),
+            }
+        )
+        return spikes.sort_values([group_col, self.date_col], ignore_index=True)
+
+    def _ewma_grouped_spikes(
+        self,
+        grouped: GroupedCounts,
+        group_col: str,
+        threshold: float,
+        alpha: float,
+        min_periods: int,
+    ) -> pd.DataFrame:
+        """Replay all groups bin by bin through one keyed streaming detector."""
+        detector = StreamingSpikeDetector(alpha, threshold, min_periods)
+        first, last = grouped.active_spans()
+        columns = grouped.matrix.tocsc() if grouped.is_sparse else grouped.matrix
+        groups, dates, counts = [], [], []
+        for t in range(len(grouped.index)):
+            active = np.flatnonzero((first <= t) & (t <= last))
+            if len(active) == 0:
+                continue
+            column = columns[:, t]
+            column = column.toarray().ravel() if grouped.is_sparse else column
+            values = column[active]
+            flags = detector.update_many(active, values)
+            groups.append(active[flags])
+            dates.append(np.full(flags.sum(), t))
+            counts.append(values[flags])
+        rows = np.concatenate(groups) if groups else np.empty(0, dtype=np.int64)
+        cols = np.concatenate(dates) if dates else np.empty(0, dtype=np.int64)
+        spikes = pd.DataFrame(
+            {
+                group_col: grouped.groups.take(rows),
+                self.date_col: grouped.index.take(cols),
+                "article_count": (
+                    np.concatenate(counts) if counts else np.empty(0)
+                ).astype(np.int64),
+            }
+        )
+        return spikes.sort_values([group_col, self.date_col], ignore_index=True)
+
+    def plot_grouped_trend(
+        self, group_col: str, groups: list, freq: str = "D", sparse: bool = False
+    ):
+        """Plot publication counts of selected groups on one chart."""
+        grouped = self.get_grouped_frequency(group_col, freq, sparse)
+        plt.figure(figsize=(14, 5))
+        for group in groups:
+            sns.lineplot(data=grouped.series(group), label=str(group))
+        plt.title(f"Publication Frequency by {group_col} ({freq})")
+        plt.xlabel("Date")
+        plt.ylabel("Number of Articles")
+        plt.legend()
+        plt.tight_layout()
+        plt.show()
 
     def plot_publication_trend(self, freq: str = "D", rolling: int | None = None):
         """Visualize publication trend with optional rolling average."""
@@ -38,15 +348,33 @@ class TimeSeriesAnalyzer:
         plt.tight_layout()
         plt.show()
 
-    def detect_spikes(self, freq: str = "D", threshold: float = 3.0) -> pd.DataFrame:
+    def detect_spikes(
+        self,
+        freq: str = "D",
+        threshold: float = 3.0,
+        method: str = "std",
+        alpha: float = 0.1,
+        min_periods: int = 5,
+    ) -> pd.DataFrame:
         """
-        Detect dates with spike in article counts using standard deviation method.
+        Detect dates with spike in article counts.
+
+        ``method="std"`` flags counts above the global mean + threshold * std.
+        ``method="ewma"`` replays the series through a StreamingSpikeDetector,
+        giving the same flags a live feed would have produced.
         Returns DataFrame with spike dates and counts.
         """
         series = self.get_publication_frequency(freq)
-        mean = series.mean()
-        std = series.std()
-        spike_dates = series[series > mean + threshold * std]
+        if method == "ewma":
+            detector = StreamingSpikeDetector(alpha, threshold, min_periods)
+            is_spike = detector.scan(series.to_numpy())
+        elif method == "std":
+            mean = series.mean()
+            std = series.std()
+            is_spike = series > mean + threshold * std
+        else:
+            raise ValueError(f"Unknown spike detection method: {method}")
+        spike_dates = series[is_spike]
         return spike_dates.reset_index().rename(columns={0: "article_count"})
 
     def plot_spikes(self, freq: str = "D", threshold: float = 3.0):
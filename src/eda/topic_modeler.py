@@ -1,69 +1,419 @@
-import re
+import os
+import tempfile
+import time
+from typing import Optional
 
+import joblib
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import seaborn as sns
+from joblib import Parallel, delayed
+from scipy import sparse
 from sklearn.base import BaseEstimator, TransformerMixin
-from sklearn.decomposition import LatentDirichletAllocation
-from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.decomposition import NMF, LatentDirichletAllocation, MiniBatchNMF
+from sklearn.exceptions import NotFittedError
+from sklearn.feature_extraction.text import (
+    CountVectorizer,
+    HashingVectorizer,
+    TfidfVectorizer,
+)
 from sklearn.pipeline import Pipeline
 
+from nlp.text_utils import TokenizedCorpus, clean_text_series, fit_vectorizer
+
+from .frame_utils import analyzer_frame
+
 
 class TextCleaner(BaseEstimator, TransformerMixin):
-    def __init__(self):
-        self.pattern = re.compile(r"[^\w\s]")  # Remove punctuation
+    """
+    Text normalizer for the TF-IDF pipeline.
+
+    Each distinct text is cleaned once and the results are broadcast back,
+    so repeated headlines cost nothing. With ``n_jobs != 1`` and more than
+    ``chunksize`` distinct texts, the chunks are cleaned in parallel
+    processes.
+    """
+
+    def __init__(self, n_jobs: int = 1, chunksize: int = 50_000):
+        self.n_jobs = n_jobs
+        self.chunksize = chunksize
 
     def fit(self, X, y=None):
         return self
 
     def transform(self, X):
-        return X.fillna("").apply(self._clean_text)
+        X = pd.Series(X) if not isinstance(X, pd.Series) else X
+        codes, uniques = pd.factorize(X)
+        uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+        if self.n_jobs == 1 or len(uniques) <= self.chunksize:
+            cleaned = clean_text_series(uniques)
+        else:
+            chunks = [
+                uniques.iloc[start : start + self.chunksize]
+                for start in range(0, len(uniques), self.chunksize)
+            ]
+            cleaned = pd.concat(
+                Parallel(n_jobs=self.n_jobs)(
+                    delayed(clean_text_series)(chunk) for chunk in chunks
+                )
+            )
+        # Missing texts (code -1) map to the trailing empty string.
+        values = np.append(cleaned.to_numpy(dtype=object), "")[codes]
+        return pd.Series(values, index=X.index, name=X.name, dtype=object)
 
-    def _clean_text(self, text):
-        text = text.lower()
-        text = re.sub(r"http\S+", "", text)  # Remove URLs
-        text = self.pattern.sub("", text)
-        text = re.sub(r"\s+", " ", text).strip()
-        return text
+
+ENGINES = ("lda", "nmf", "minibatch_nmf")
+
+
+def make_topic_model(
+    engine: str,
+    n_topics: int,
+    random_state: int = 42,
+    online: bool = False,
+    total_samples: int = 1_000_000,
+):
+    """
+    Build the topic model for ``engine``.
+
+    'lda' is scikit-learn's LatentDirichletAllocation (batch, or online
+    when ``online=True``); 'nmf' is coordinate-descent NMF; 'minibatch_nmf'
+    is MiniBatchNMF, usually the fastest on large corpora. NMF topics are
+    read the same way as LDA topics (``components_`` and ``transform``).
+    """
+    if engine == "lda":
+        return LatentDirichletAllocation(
+            n_components=n_topics,
+            learning_method="online" if online else "batch",
+            total_samples=total_samples,
+            random_state=random_state,
+        )
+    if engine == "nmf":
+        if online:
+            raise ValueError("Engine 'nmf' cannot be fitted online.")
+        return NMF(n_components=n_topics, init="nndsvda", random_state=random_state)
+    if engine == "minibatch_nmf":
+        return MiniBatchNMF(
+            n_components=n_topics, init="nndsvda", random_state=random_state
+        )
+    raise ValueError(f"Unknown engine '{engine}'. Choose from {ENGINES}.")
+
+
+def umass_coherence(X, components: np.ndarray, n_top_words: int = 10) -> float:
+    """
+    Mean UMass coherence of the topics in ``components`` over the
+    document-term matrix ``X``. Higher (closer to 0) is better.
+    """
+    scores = []
+    for topic in components:
+        top = topic.argsort()[: -n_top_words - 1 : -1]
+        present = (X[:, top] > 0).astype(np.float64)
+        co_docs = (present.T @ present).toarray()
+        doc_freq = np.diag(co_docs)
+        score = 0.0
+        for i in range(1, len(top)):
+            for j in range(i):
+                if doc_freq[j] > 0:
+                    score += np.log((co_docs[i, j] + 1.0) / doc_freq[j])
+        scores.append(score)
+    return float(np.mean(scores))
+
+
+def _fit_candidate(arrays_dir, shape, engine, n_topics, n_top_words, random_state):
+    """
+    Fit one candidate model on the memory-mapped CSR matrix in
+    ``arrays_dir``; runs in a worker process.
+    """
+    data, indices, indptr = (
+        np.load(os.path.join(arrays_dir, f"{name}.npy"), mmap_mode="r")
+        for name in ("data", "indices", "indptr")
+    )
+    X = sparse.csr_matrix((data, indices, indptr), shape=shape, copy=False)
+    model = make_topic_model(engine, n_topics, random_state)
+    start = time.perf_counter()
+    model.fit(X)
+    fit_time = time.perf_counter() - start
+    return {
+        "n_topics": n_topics,
+        "perplexity": model.perplexity(X) if engine == "lda" else np.nan,
+        "coherence": umass_coherence(X, model.components_, n_top_words),
+        "fit_time": fit_time,
+    }
 
 
 class TopicModeler:
-    def __init__(self, df: pd.DataFrame, text_col: str = "headline", n_topics: int = 5):
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        text_col: str = "headline",
+        n_topics: int = 5,
+        copy: bool = True,
+        n_jobs: int = 1,
+        engine: str = "lda",
+    ):
         if text_col not in df.columns:
             raise KeyError(f"Column '{text_col}' not found in DataFrame.")
-        self.df = df.copy()
+        self.df = analyzer_frame(df, copy)
         self.text_col = text_col
         self.n_topics = n_topics
+        self.engine = engine
         self.vectorizer = TfidfVectorizer(max_df=0.95, min_df=2, stop_words="english")
-        self.lda_model = LatentDirichletAllocation(
-            n_components=self.n_topics, random_state=42
-        )
+        self.model = make_topic_model(engine, self.n_topics)
         self.pipeline = Pipeline(
-            [("cleaner", TextCleaner()), ("tfidf", self.vectorizer)]
+            [("cleaner", TextCleaner(n_jobs=n_jobs)), ("tfidf", self.vectorizer)]
         )
         self.topic_keywords: dict[str, list[str]] = {}
+        self._corpus = None
+        self._tfidf_matrix = None
+        self._doc_topics: Optional[np.ndarray] = None
+        self._hash_vocab: Optional[dict[int, str]] = None
+
+    @property
+    def lda_model(self):
+        """The fitted topic model (kept under its historical name)."""
+        return self.model
+
+    @lda_model.setter
+    def lda_model(self, model):
+        self.model = model
+
+    def corpus(self) -> TokenizedCorpus:
+        """
+        Cleaned and tokenized text column, computed once and cached. The
+        cleaner runs once per distinct text, and the vectorizer is fitted
+        from the corpus tokens instead of re-tokenizing the text.
+        """
+        if self._corpus is None:
+            self._corpus = TokenizedCorpus.from_texts(
+                self.df[self.text_col],
+                cleaner=self.pipeline.named_steps["cleaner"].transform,
+            )
+        return self._corpus
+
+    def cleaned_text(self) -> pd.Series:
+        """
+        Cleaned text column, from the cached corpus.
+        """
+        return self.corpus().cleaned_text()
+
+    def tfidf_matrix(self):
+        """
+        TF-IDF matrix of the cleaned text, cached by ``fit``.
+        """
+        if self._tfidf_matrix is None:
+            self._tfidf_matrix = self.vectorizer.transform(self.cleaned_text())
+        return self._tfidf_matrix
+
+    def document_topics(self) -> np.ndarray:
+        """
+        Document-topic distribution of the fitted model, cached.
+        """
+        doc_topics = self._doc_topics
+        if doc_topics is None:
+            doc_topics = self._doc_topics = self.model.transform(self.tfidf_matrix())
+        return doc_topics
+
+    def _document_term_matrix(self):
+        if self._tfidf_matrix is None:
+            try:
+                self._tfidf_matrix = self.vectorizer.transform(self.cleaned_text())
+            except NotFittedError:
+                self._tfidf_matrix = fit_vectorizer(self.vectorizer, self.corpus())
+        return self._tfidf_matrix
+
+    def select_n_topics(
+        self,
+        candidates=(2, 5, 10, 15, 20),
+        n_jobs: int = -1,
+        n_top_words: int = 10,
+        workdir=None,
+    ) -> pd.DataFrame:
+        """
+        Fit one model of the configured engine per candidate topic count
+        and score each.
+
+        The document-term matrix is built once and its CSR arrays are saved
+        as ``.npy`` files that every worker process memory-maps, so the
+        matrix is shared rather than copied into each worker.
+
+        Parameters:
+            candidates (iterable of int): Topic counts to try.
+            n_jobs (int): Worker processes (-1 for all cores).
+            n_top_words (int): Words per topic used for coherence.
+            workdir (str or Path, optional): Directory for the matrix files.
+                Defaults to a temporary directory removed afterwards.
+
+        Returns:
+            pd.DataFrame: Indexed by 'n_topics', with 'perplexity' (LDA only;
+            lower is better, on the fitted corpus), 'coherence' (UMass,
+            higher is better) and 'fit_time' in seconds.
+        """
+        X = sparse.csr_matrix(self._document_term_matrix())
+        # Workers cannot sort the read-only arrays in place, so sort here.
+        X.sort_indices()
+        with tempfile.TemporaryDirectory(dir=workdir) as arrays_dir:
+            for name in ("data", "indices", "indptr"):
+                np.save(os.path.join(arrays_dir, f"{name}.npy"), getattr(X, name))
+            rows = Parallel(n_jobs=n_jobs)(
+                delayed(_fit_candidate)(
+                    arrays_dir,
+                    X.shape,
+                    self.engine,
+                    n_topics,
+                    n_top_words,
+                    self.model.random_state,
+                )
+                for n_topics in candidates
+            )
+        return pd.DataFrame(rows).set_index("n_topics")
 
     def fit(self):
         """
-        Fit the LDA model to the cleaned text data.
+        Fit the topic model to the cleaned text data.
         """
-        cleaned_text = self.pipeline.named_steps["cleaner"].transform(
-            self.df[self.text_col]
+        self._tfidf_matrix = fit_vectorizer(self.vectorizer, self.corpus())
+        self._doc_topics = None
+        self.model.fit(self._tfidf_matrix)
+        self._extract_topic_keywords()
+        return self
+
+    def _iter_text_chunks(self, source, chunksize, read_csv_kwargs):
+        if isinstance(source, (str, os.PathLike)):
+            source = pd.read_csv(
+                source, usecols=[self.text_col], chunksize=chunksize, **read_csv_kwargs
+            )
+        for chunk in source:
+            yield chunk[self.text_col] if isinstance(chunk, pd.DataFrame) else chunk
+
+    def fit_streaming(
+        self,
+        source,
+        chunksize: int = 50_000,
+        n_features: int = 2**18,
+        total_samples: int = 1_000_000,
+        vocab_docs: int = 100_000,
+        checkpoint_path=None,
+        checkpoint_every: int = 10,
+        resume: bool = False,
+        **read_csv_kwargs,
+    ):
+        """
+        Fit an online topic model (LDA, or MiniBatchNMF with
+        ``engine="minibatch_nmf"``) over text chunks that never need to be
+        in memory together.
+
+        Chunks are vectorized with a stateless ``HashingVectorizer`` (term
+        counts, no fitted vocabulary) and folded in with ``partial_fit``. The first ``vocab_docs``
+        documents are kept as a vocabulary sample: their terms are hashed
+        to recover a readable word for each feature, which is what
+        ``get_keywords`` reports.
+
+        Parameters:
+            source (str, Path or iterable): CSV path read in ``chunksize``
+                rows, or an iterable of DataFrames/Series of text.
+            chunksize (int): Rows per chunk when reading a CSV.
+            n_features (int): Number of hashed features.
+            total_samples (int): Approximate corpus size, used by online LDA
+                to scale each update.
+            vocab_docs (int): Documents sampled for the hash vocabulary.
+            checkpoint_path (str or Path, optional): File the model state
+                is saved to every ``checkpoint_every`` chunks and at the end.
+            resume (bool): Load ``checkpoint_path`` if it exists and skip the
+                chunks it already covers.
+            **read_csv_kwargs: Passed to ``pd.read_csv``.
+        """
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            stop_words="english",
+            alternate_sign=False,
+            norm=None,
         )
-        tfidf_matrix = self.pipeline.named_steps["tfidf"].fit_transform(cleaned_text)
-        self.lda_model.fit(tfidf_matrix)
+        self.pipeline.steps[-1] = ("tfidf", self.vectorizer)
+        self.model = make_topic_model(
+            self.engine, self.n_topics, online=True, total_samples=total_samples
+        )
+        vocab_sample: list[pd.Series] = []
+        n_sampled = 0
+        chunks_done = 0
+        if resume and checkpoint_path is not None and os.path.exists(checkpoint_path):
+            state = joblib.load(checkpoint_path)
+            self.model = state["model"]
+            vocab_sample = state["vocab_sample"]
+            n_sampled = sum(len(texts) for texts in vocab_sample)
+            chunks_done = state["chunks_done"]
+
+        cleaner = self.pipeline.named_steps["cleaner"]
+        for i, texts in enumerate(
+            self._iter_text_chunks(source, chunksize, read_csv_kwargs)
+        ):
+            if i < chunks_done:
+                continue
+            cleaned = cleaner.transform(texts)
+            if n_sampled < vocab_docs:
+                vocab_sample.append(cleaned.iloc[: vocab_docs - n_sampled])
+                n_sampled += len(vocab_sample[-1])
+            self.model.partial_fit(self.vectorizer.transform(cleaned))
+            chunks_done = i + 1
+            if checkpoint_path is not None and chunks_done % checkpoint_every == 0:
+                self._save_checkpoint(checkpoint_path, chunks_done, vocab_sample)
+
+        if not hasattr(self.model, "components_"):
+            raise ValueError("No text chunks to fit.")
+        if checkpoint_path is not None:
+            self._save_checkpoint(checkpoint_path, chunks_done, vocab_sample)
+
+        self._hash_vocab = self._build_hash_vocab(vocab_sample)
+        self._tfidf_matrix = None
+        self._doc_topics = None
         self._extract_topic_keywords()
         return self
 
+    def _save_checkpoint(self, path, chunks_done, vocab_sample):
+        tmp_path = f"{path}.tmp"
+        joblib.dump(
+            {
+                "model": self.model,
+                "vocab_sample": vocab_sample,
+                "chunks_done": chunks_done,
+            },
+            tmp_path,
+        )
+        os.replace(tmp_path, path)
+
+    def _build_hash_vocab(self, vocab_sample) -> dict[int, str]:
+        """
+        Map hashed feature indices back to the most frequent sampled term
+        that hashes to them.
+        """
+        texts = pd.concat(vocab_sample) if vocab_sample else pd.Series(dtype=object)
+        counter = CountVectorizer(stop_words="english")
+        try:
+            counts = np.asarray(counter.fit_transform(texts).sum(axis=0)).ravel()
+        except ValueError:  # empty sample or only stop words
+            return {}
+        terms = counter.get_feature_names_out()
+        columns = np.asarray(self.vectorizer.transform(terms).argmax(axis=1)).ravel()
+        # Most frequent term last, so it wins collisions in the dict.
+        order = np.argsort(counts, kind="stable")
+        return {int(columns[i]): str(terms[i]) for i in order}
+
     def _extract_topic_keywords(self, n_top_words: int = 10):
         """
         Extract top keywords per topic.
         """
-        feature_names = self.vectorizer.get_feature_names_out()
-        for topic_idx, topic in enumerate(self.lda_model.components_):
-            top_features = topic.argsort()[: -n_top_words - 1 : -1]
+        if self._hash_vocab is None:
+            feature_names = self.vectorizer.get_feature_names_out()
+        else:
+            feature_names = np.full(self.vectorizer.n_features, None, dtype=object)
+            for column, term in self._hash_vocab.items():
+                feature_names[column] = term
+        for topic_idx, topic in enumerate(self.model.components_):
+            order = topic.argsort()[::-1]
+            if self._hash_vocab is not None:
+                # Skip hashed features with no term in the vocabulary sample.
+                order = order[pd.notna(feature_names[order])]
             self.topic_keywords[f"Topic {topic_idx + 1}"] = [
-                feature_names[i] for i in top_features
+                feature_names[i] for i in order[:n_top_words]
             ]
 
     def display_topics(self):
@@ -78,14 +428,7 @@ class TopicModeler:
         """
         Plot number of articles per topic.
         """
-        cleaned_text = self.pipeline.named_steps["cleaner"].transform(
-            self.df[self.text_col]
-        )
-        tfidf_matrix = self.pipeline.named_steps["tfidf"].transform(cleaned_text)
-        topic_distribution = self.lda_model.transform(tfidf_matrix).argmax(axis=1)
-
-        topic_labels = [f"Topic {i + 1}" for i in topic_distribution]
-        self.df["Predicted Topic"] = topic_labels
+        self.assign_topics()
 
         plt.figure(figsize=(8, 5))
         sns.countplot(x="Predicted Topic", data=self.df, palette="cubehelix")
@@ -95,6 +438,91 @@ class TopicModeler:
         plt.tight_layout()
         plt.show()
 
+    def assign_topics(self) -> pd.Series:
+        """
+        Label each article with its most likely topic, stored in the
+        'Predicted Topic' column.
+        """
+        topic_distribution = self.document_topics().argmax(axis=1)
+        self.df["Predicted Topic"] = [f"Topic {i + 1}" for i in topic_distribution]
+        return self.df["Predicted Topic"]
+
+    def predict_topics(self, texts, return_proba: bool = False):
+        """
+        Topic labels for a batch of new texts, without touching the
+        modeler's frame or caches.
+
+        Parameters:
+            texts (iterable of str or pd.Series): Raw texts.
+            return_proba (bool): Return the topic distribution instead.
+
+        Returns:
+            pd.Series or pd.DataFrame: 'Topic N' labels, or one column per
+            topic, aligned with ``texts``.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        cleaned = self.pipeline.named_steps["cleaner"].transform(texts)
+        doc_topics = self.model.transform(self.vectorizer.transform(cleaned))
+        names = [f"Topic {i + 1}" for i in range(doc_topics.shape[1])]
+        if return_proba:
+            return pd.DataFrame(doc_topics, index=texts.index, columns=names)
+        labels = np.asarray(names, dtype=object)[doc_topics.argmax(axis=1)]
+        return pd.Series(labels, index=texts.index, name="Predicted Topic")
+
+    def save(self, path):
+        """
+        Save the fitted cleaner, vectorizer and topic model to ``path``.
+
+        The file is an uncompressed joblib pickle, so ``load`` can
+        memory-map its large arrays (topic-word matrix, IDF weights)
+        instead of reading them into memory.
+        """
+        if not hasattr(self.model, "components_"):
+            raise ValueError("Fit the model before saving it.")
+        state = {
+            "text_col": self.text_col,
+            "n_topics": self.n_topics,
+            "engine": self.engine,
+            "cleaner": self.pipeline.named_steps["cleaner"],
+            "vectorizer": self.vectorizer,
+            "model": self.model,
+            "topic_keywords": self.topic_keywords,
+            "hash_vocab": self._hash_vocab,
+        }
+        tmp_path = f"{path}.tmp"
+        joblib.dump(state, tmp_path)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, df: pd.DataFrame = None, mmap_mode="r") -> "TopicModeler":
+        """
+        Load a modeler saved with ``save``, ready for ``predict_topics``.
+
+        Parameters:
+            path (str or Path): File written by ``save``.
+            df (pd.DataFrame, optional): Frame to label with the loaded
+                model. Defaults to an empty frame.
+            mmap_mode (str or None): Passed to ``joblib.load``; ``"r"``
+                memory-maps the model arrays read-only.
+        """
+        state = joblib.load(path, mmap_mode=mmap_mode)
+        if df is None:
+            df = pd.DataFrame({state["text_col"]: pd.Series(dtype=object)})
+        modeler = cls(
+            df,
+            text_col=state["text_col"],
+            n_topics=state["n_topics"],
+            engine=state["engine"],
+        )
+        modeler.vectorizer = state["vectorizer"]
+        modeler.pipeline = Pipeline(
+            [("cleaner", state["cleaner"]), ("tfidf", modeler.vectorizer)]
+        )
+        modeler.model = state["model"]
+        modeler.topic_keywords = state["topic_keywords"]
+        modeler._hash_vocab = state["hash_vocab"]
+        return modeler
+
     def get_keywords(self):
         return self.topic_keywords
 
@@ -4,6 +4,10 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 
+from .frame_utils import analyzer_frame, text_lengths
+from .quantile_sketch import sketch_series
+from .time_buckets import TimeBuckets
+
 
 class DataVisualizer:
     def __init__(
@@ -12,27 +16,43 @@ class DataVisualizer:
         headline_col: str = "headline",
         publisher_col: str = "publisher",
         date_col: str = "date",
+        copy: bool = True,
     ):
-        self.df = df.copy()
+        self.df = analyzer_frame(df, copy)
         self.headline_col = headline_col
         self.publisher_col = publisher_col
         self.date_col = date_col
 
-    def plot_headline_length_distribution(self, bins: int = 30):
+    def plot_headline_length_distribution(
+        self, bins: int = 30, chunksize: int = 100_000, k: int = 200
+    ):
         """
         Visualizes distribution of headline lengths with histogram
         and prints summary stats.
+
+        Statistics and histogram come from one ``QuantileSketch`` of the
+        lengths (see ``TextualEDA.headline_length_stats``), so the lengths
+        are never materialized.
         """
         if self.headline_col not in self.df.columns:
             raise KeyError(f"Column '{self.headline_col}' not found in DataFrame.")
 
-        lengths = self.df[self.headline_col].dropna().astype(str).apply(len)
+        headlines = self.df[self.headline_col].dropna()
+        sketch = sketch_series(headlines, chunksize, k, text_lengths)
 
         print("Headline Length Statistics:")
-        print(lengths.describe())
+        print(sketch.describe("headline_length"))
 
+        counts, edges = sketch.histogram(bins)
         plt.figure(figsize=(10, 6))
-        sns.histplot(lengths, bins=bins, kde=True, color="skyblue")
+        sns.histplot(
+            x=(edges[:-1] + edges[1:]) / 2,
+            weights=counts,
+            bins=len(counts),
+            binrange=(edges[0], edges[-1]),
+            kde=True,
+            color="skyblue",
+        )
         plt.title("Headline Length Distribution")
         plt.xlabel("Headline Length (characters)")
         plt.ylabel("Frequency")
@@ -49,7 +69,7 @@ class DataVisualizer:
         counts = self.df[self.publisher_col].value_counts().head(top_n)
 
         plt.figure(figsize=(12, 6))
-        sns.barplot(x=counts.values, y=counts.index, palette="viridis")
+        sns.barplot(x=counts.values, y=counts.index.astype(str), palette="viridis")
         plt.title(f"Top {top_n} Publishers by Article Count")
         plt.xlabel("Number of Articles")
         plt.ylabel("Publisher")
@@ -67,22 +87,7 @@ class DataVisualizer:
         if not pd.api.types.is_datetime64_any_dtype(self.df[self.date_col]):
             raise TypeError(f"Column '{self.date_col}' must be datetime dtype.")
 
-        weekdays = self.df[self.date_col].dt.day_name()
-        counts = (
-            weekdays.value_counts()
-            .reindex(
-                [
-                    "Monday",
-                    "Tuesday",
-                    "Wednesday",
-                    "Thursday",
-                    "Friday",
-                    "Saturday",
-                    "Sunday",
-                ]
-            )
-            .fillna(0)
-        )
+        counts = TimeBuckets(self.df[self.date_col]).counts("weekday", fill=True)
 
         plt.figure(figsize=(10, 5))
         sns.barplot(x=counts.index, y=counts.values, palette="magma")
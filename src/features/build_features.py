@@ -0,0 +1,348 @@
+"""
+Daily Feature Store Module
+------------------------
+Materializes a per-(ticker, trading day) feature table from scored news
+and daily prices, and persists it as Parquet partitioned by ticker.
+
+Features per row:
+    - sentiment_mean / sentiment_count / sentiment_std of the headlines
+      assigned to that trading day: news up to the market close (16:00
+      New York time by default) counts towards that day's session, later
+      news and news on non-trading days towards the next trading day, so
+      a row only sees news published before its close. News before a
+      ticker's first price row is dropped, since the session it belongs
+      to is not in the table.
+    - close, return_1d and the indicators momentum_rsi, trend_macd_diff
+      and volatility (rolling std of daily returns)
+    - forward_return_{h}d for each horizon (the prediction targets)
+    - {column}_lag{k} for the lagged columns
+
+Every feature of a ticker depends only on that ticker's news and prices,
+so each ticker is one partition. Partitions are not split further by
+period: RSI and MACD are exponentially weighted over the whole price
+history, so a row's indicators depend on every earlier price and a new
+price row changes only the last rows' values, but a bounded look-back
+window could not reproduce them exactly. A ticker's partition is
+therefore rewritten in full when any of its inputs change. A manifest
+records a content hash of each partition's inputs and of the feature
+configuration; ``update`` recomputes and rewrites only partitions whose
+hash changed and drops partitions of tickers that disappeared.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Iterable, Optional
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+from ta.momentum import rsi
+from ta.trend import macd_diff
+
+from eda.fingerprint_store import hash_rows
+
+MANIFEST_FILE = "_manifest.json"
+FEATURE_VERSION = 2
+
+
+def _utc_days(dates: pd.Series) -> pd.Series:
+    """UTC midnight of each timestamp (naive values are taken as UTC)."""
+    return pd.to_datetime(dates, utc=True, errors="coerce").dt.floor("D")
+
+
+def _session_days(dates: pd.Series, timezone: str, close: str) -> pd.Series:
+    """
+    Session date of each news timestamp, as UTC midnight: its local date in
+    ``timezone`` if published before the ``close`` time ("HH:MM"), else
+    the next date. Naive values are taken as UTC.
+    """
+    local = pd.to_datetime(dates, utc=True, errors="coerce").dt.tz_convert(timezone)
+    after_close = pd.Timedelta(days=1) - pd.Timedelta(f"{close}:00")
+    shifted = local.dt.tz_localize(None) + after_close
+    return shifted.dt.floor("D").dt.tz_localize("UTC")
+
+
+def partition_digests(frame: pd.DataFrame, key_col: str, columns: list) -> dict:
+    """
+    Content hash of the rows of each ``key_col`` value, independent of row
+    order. Rows are fingerprinted in one vectorized pass and sorted by key
+    and fingerprint before each key's fingerprints are digested.
+    """
+    if frame.empty:
+        return {}
+    keys = frame[key_col].astype(str).to_numpy()
+    hashes = hash_rows(frame, columns)
+    order = np.lexsort((hashes, keys))
+    keys, hashes = keys[order], hashes[order]
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)]
+    return {
+        keys[lo]: hashlib.blake2b(hashes[lo:hi].tobytes(), digest_size=16).hexdigest()
+        for lo, hi in zip(starts, ends)
+    }
+
+
+class DailyFeatureStore:
+    """
+    Incrementally maintained per-(ticker, day) feature table on disk.
+    """
+
+    def __init__(
+        self,
+        root,
+        horizons: Iterable[int] = (1, 5),
+        lags: Iterable[int] = (1, 2, 3),
+        lag_columns: Iterable[str] = ("sentiment_mean", "return_1d"),
+        rsi_window: int = 14,
+        volatility_window: int = 20,
+        market_timezone: str = "America/New_York",
+        market_close: str = "16:00",
+    ):
+        """
+        Args:
+            root (str or Path): Store directory; created on first update.
+            horizons (iterable of int): Forward-return horizons in trading
+                days.
+            lags (iterable of int): Lags, in trading days, of the
+                ``lag_columns``.
+            lag_columns (iterable of str): Feature columns to lag.
+            rsi_window (int): RSI window.
+            volatility_window (int): Window of the return volatility.
+            market_timezone (str): Timezone of the market's trading days.
+            market_close (str): Local close time ("HH:MM"); news at or
+                after it counts towards the next trading day.
+        """
+        self.root = root
+        self.horizons: list[int] = sorted(int(h) for h in horizons)
+        self.lags: list[int] = sorted(int(k) for k in lags)
+        self.lag_columns: list[str] = list(lag_columns)
+        self.rsi_window = int(rsi_window)
+        self.volatility_window = int(volatility_window)
+        self.market_timezone = market_timezone
+        self.market_close = market_close
+
+    def config(self) -> dict:
+        """Feature settings, hashed into every partition digest."""
+        return {
+            "version": FEATURE_VERSION,
+            "horizons": self.horizons,
+            "lags": self.lags,
+            "lag_columns": self.lag_columns,
+            "rsi_window": self.rsi_window,
+            "volatility_window": self.volatility_window,
+            "market_timezone": self.market_timezone,
+            "market_close": self.market_close,
+        }
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_FILE)
+
+    def manifest(self) -> dict:
+        """Ticker -> input digest of every stored partition."""
+        if not os.path.exists(self.manifest_path):
+            return {}
+        with open(self.manifest_path) as f:
+            return json.load(f)["partitions"]
+
+    def partition_path(self, ticker: str) -> str:
+        # Percent-encoded, so tickers such as "BRK/B" stay one directory.
+        return os.path.join(
+            self.root, f"ticker={quote(str(ticker), safe='')}", "part.parquet"
+        )
+
+    def ticker_features(
+        self, news: pd.DataFrame, prices: pd.DataFrame, ticker: str
+    ) -> pd.DataFrame:
+        """
+        Feature rows of one ticker.
+
+        Args:
+            news (pd.DataFrame): That ticker's news with columns 'day'
+                (session date as UTC midnight) and 'score'.
+            prices (pd.DataFrame): That ticker's prices with columns 'day'
+                and 'close'.
+            ticker (str): Ticker stored in the 'ticker' column.
+        """
+        prices = prices.dropna(subset=["day", "close"])
+        prices = prices.drop_duplicates("day", keep="last").sort_values("day")
+        days = pd.DatetimeIndex(prices["day"])
+        close = pd.Series(prices["close"].to_numpy(np.float64), index=days)
+        features = pd.DataFrame(index=days)
+
+        news = news.dropna(subset=["day", "score"])
+        news_days = pd.DatetimeIndex(news["day"]).asi8
+        slot = np.searchsorted(days.asi8, news_days)
+        # Before the first price row the news' trading day is unknown.
+        first = days.asi8[0] if len(days) else np.iinfo(np.int64).max
+        in_range = (news_days >= first) & (slot < len(days))
+        scores = news["score"].to_numpy(np.float64)[in_range]
+        grouped = pd.Series(scores).groupby(slot[in_range])
+        stats = grouped.agg(["mean", "count", "std"]).reindex(range(len(days)))
+        features["sentiment_mean"] = stats["mean"].to_numpy()
+        features["sentiment_count"] = stats["count"].fillna(0).to_numpy(np.int64)
+        features["sentiment_std"] = stats["std"].to_numpy()
+
+        returns = close.pct_change()
+        features["close"] = close
+        features["return_1d"] = returns
+        features["momentum_rsi"] = rsi(close, window=self.rsi_window)
+        features["trend_macd_diff"] = macd_diff(close)
+        features["volatility"] = returns.rolling(self.volatility_window).std()
+        for horizon in self.horizons:
+            features[f"forward_return_{horizon}d"] = close.shift(-horizon) / close - 1
+        for column in self.lag_columns:
+            for lag in self.lags:
+                features[f"{column}_lag{lag}"] = features[column].shift(lag)
+
+        features.insert(0, "ticker", ticker)
+        return features.rename_axis("date").reset_index()
+
+    def update(
+        self,
+        news: pd.DataFrame,
+        prices: pd.DataFrame,
+        ticker_col: str = "stock",
+        date_col: str = "date",
+        score_col: str = "sentiment_score",
+        price_date_col: str = "Date",
+        close_col: str = "Close",
+    ) -> dict:
+        """
+        Bring the store up to date with the full current inputs.
+
+        Args:
+            news (pd.DataFrame): Scored news of all tickers.
+            prices (pd.DataFrame): Daily prices of all tickers, with a
+                ``ticker_col`` column.
+            ticker_col (str): Ticker column of both frames.
+            date_col (str): News timestamp column.
+            score_col (str): News sentiment score column.
+            price_date_col (str): Price date column.
+            close_col (str): Closing price column.
+
+        Returns:
+            dict: Tickers 'recomputed', 'unchanged' and 'removed'.
+        """
+        for frame, columns in (
+            (news, [ticker_col, date_col, score_col]),
+            (prices, [ticker_col, price_date_col, close_col]),
+        ):
+            missing = [col for col in columns if col not in frame.columns]
+            if missing:
+                raise ValueError(f"Missing columns: {missing}")
+
+        news = pd.DataFrame(
+            {
+                "ticker": news[ticker_col].astype(str).to_numpy(),
+                "day": _session_days(
+                    news[date_col],
+                    self.market_timezone,
+                    self.market_close,
+                ).array,
+                "score": pd.to_numeric(news[score_col], errors="coerce").to_numpy(),
+            }
+        )
+        prices = pd.DataFrame(
+            {
+                "ticker": prices[ticker_col].astype(str).to_numpy(),
+                "day": _utc_days(prices[price_date_col]).array,
+                "close": pd.to_numeric(prices[close_col], errors="coerce").to_numpy(),
+            }
+        )
+
+        config_digest = json.dumps(self.config(), sort_keys=True)
+        news_digests = partition_digests(news, "ticker", ["ticker", "day", "score"])
+        price_digests = partition_digests(prices, "ticker", ["ticker", "day", "close"])
+        digests = {
+            ticker: hashlib.blake2b(
+                f"{config_digest}|{news_digests.get(ticker, '')}|{digest}".encode(),
+                digest_size=16,
+            ).hexdigest()
+            for ticker, digest in price_digests.items()
+        }
+
+        previous = self.manifest()
+        changed = sorted(t for t, d in digests.items() if previous.get(t) != d)
+        removed = sorted(set(previous) - set(digests))
+
+        os.makedirs(self.root, exist_ok=True)
+        if changed:
+            news_groups = news[news["ticker"].isin(changed)].groupby("ticker")
+            price_groups = prices[prices["ticker"].isin(changed)].groupby("ticker")
+            empty_news = news.iloc[:0]
+            for ticker in changed:
+                ticker_news = (
+                    news_groups.get_group(ticker)
+                    if ticker in news_groups.groups
+                    else empty_news
+                )
+                table = self.ticker_features(
+                    ticker_news, price_groups.get_group(ticker), ticker
+                )
+                self._write_partition(ticker, table)
+        for ticker in removed:
+            # Removes any leftover temporary file along with the partition.
+            shutil.rmtree(os.path.dirname(self.partition_path(ticker)), True)
+
+        self._write_manifest(digests)
+        unchanged = sorted(set(digests) - set(changed))
+        return {"recomputed": changed, "unchanged": unchanged, "removed": removed}
+
+    def _write_partition(self, ticker: str, table: pd.DataFrame) -> None:
+        path = self.partition_path(ticker)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp"
+        table.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+
+    def _write_manifest(self, digests: dict) -> None:
+        tmp = f"{self.manifest_path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"config": self.config(), "partitions": digests}, f, indent=1)
+        os.replace(tmp, self.manifest_path)
+
+    def load(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        start=None,
+        end=None,
+        columns: Optional[list[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Read the feature table, only opening the requested tickers'
+        partitions.
+
+        Args:
+            tickers (iterable of str, optional): Tickers to read.
+            start, end (optional): Date range ``[start, end)``; naive
+                values are taken as UTC.
+            columns (list[str], optional): Feature columns to return
+                ('ticker' and 'date' are always included).
+
+        Returns:
+            pd.DataFrame: Rows sorted by ticker and date.
+        """
+        stored = self.manifest()
+        tickers = sorted(stored) if tickers is None else [str(t) for t in tickers]
+        if columns is not None:
+            columns = ["ticker", "date"] + [
+                c for c in columns if c not in ("ticker", "date")
+            ]
+        filters = []
+        if start is not None:
+            filters.append(("date", ">=", pd.to_datetime(start, utc=True)))
+        if end is not None:
+            filters.append(("date", "<", pd.to_datetime(end, utc=True)))
+        frames = [
+            pd.read_parquet(
+                self.partition_path(ticker), columns=columns, filters=filters or None
+            )
+            for ticker in tickers
+            if ticker in stored
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns or ["ticker", "date"])
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,364 @@
+"""
+Model Training Module
+------------------------
+Walk-forward training of next-day return (regression) or direction
+(classification) models on the daily feature table written by
+``features.build_features.DailyFeatureStore``.
+
+Folds use an expanding training window over trading days, with a gap of
+``gap`` days before each test window so forward-return targets cannot
+leak into training. The feature matrix is saved once as ``.npy`` files
+that every worker process memory-maps. Folds are split into contiguous
+chains, one per worker; inside a chain each fold warm-starts from the
+previous fold's model when the estimator allows it (a full fit for the
+chain's first fold, then ``partial_fit`` on the rows added since the
+previous fold, or a ``warm_start`` refit for linear models), so ``n_jobs=1`` gives one fully warm chain and
+``n_jobs >= n_splits`` fully parallel cold folds. Results and fitted
+models are cached under a hash of the data and the configuration.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import time
+from typing import Iterable, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from joblib.parallel import effective_n_jobs
+from sklearn.base import clone, is_classifier
+from sklearn.linear_model import LogisticRegression, Ridge
+from sklearn.metrics import (
+    accuracy_score,
+    f1_score,
+    mean_absolute_error,
+    mean_squared_error,
+    r2_score,
+)
+
+from eda.fingerprint_store import hash_rows
+
+TASKS = ("regression", "classification")
+# ``warm_start`` only means "start from the previous solution" for these;
+# for ensembles it means "add more trees" and must not be used across folds.
+WARM_START_MODULES = ("sklearn.linear_model", "sklearn.neural_network")
+ARTIFACT_FILE = "artifacts.joblib"
+
+
+def walk_forward_splits(
+    dates, n_splits: int = 5, gap: int = 1, min_train_days: Optional[int] = None
+) -> list[tuple[np.ndarray, np.ndarray]]:
+    """
+    Expanding-window splits over the distinct days of ``dates``.
+
+    The days after the first ``min_train_days`` (default: one test
+    window) are cut into ``n_splits`` consecutive test windows; fold ``k``
+    trains on every day before its test window minus the last ``gap``
+    days. All rows of a day land on the same side of a split.
+
+    Returns:
+        list: (train_rows, test_rows) integer positions into ``dates``.
+    """
+    days, codes = np.unique(np.asarray(dates), return_inverse=True)
+    if min_train_days is None:
+        test_days = len(days) // (n_splits + 1)
+    else:
+        test_days = (len(days) - min_train_days) // n_splits
+    if test_days < 1:
+        raise ValueError(f"Not enough days ({len(days)}) for {n_splits} splits.")
+    first_test = len(days) - n_splits * test_days
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(days) + 1))
+
+    splits = []
+    for fold in range(n_splits):
+        test_start = first_test + fold * test_days
+        train_end = test_start - gap
+        if train_end < 1:
+            raise ValueError("gap leaves no training days for the first fold.")
+        train = order[: bounds[train_end]]
+        test = order[bounds[test_start] : bounds[test_start + test_days]]
+        splits.append((np.sort(train), np.sort(test)))
+    return splits
+
+
+def warm_start_mode(estimator) -> Optional[str]:
+    """'partial_fit', 'warm_start' or None for estimators that refit cold."""
+    if hasattr(estimator, "partial_fit"):
+        return "partial_fit"
+    if "warm_start" in estimator.get_params() and type(estimator).__module__.startswith(
+        WARM_START_MODULES
+    ):
+        return "warm_start"
+    return None
+
+
+def _score(task: str, y_true: np.ndarray, y_pred: np.ndarray) -> dict:
+    if task == "classification":
+        return {
+            "accuracy": accuracy_score(y_true, y_pred),
+            "f1": f1_score(y_true, y_pred, zero_division=0),
+        }
+    return {
+        "mae": mean_absolute_error(y_true, y_pred),
+        "rmse": np.sqrt(mean_squared_error(y_true, y_pred)),
+        "r2": r2_score(y_true, y_pred) if len(y_true) > 1 else np.nan,
+        "direction_accuracy": np.mean(np.sign(y_true) == np.sign(y_pred)),
+    }
+
+
+def _run_chain(arrays_dir, estimator, task, folds, warm) -> list[dict]:
+    """
+    Fit and score a contiguous run of folds on the memory-mapped arrays in
+    ``arrays_dir``; runs in a worker process.
+    """
+    X = np.load(os.path.join(arrays_dir, "X.npy"), mmap_mode="r")
+    y = np.load(os.path.join(arrays_dir, "y.npy"), mmap_mode="r")
+    mode = warm_start_mode(estimator) if warm else None
+    model, seen = None, 0
+    results = []
+    for fold, (train, test) in folds:
+        start = time.perf_counter()
+        if model is None or mode is None:
+            model = clone(estimator)
+            if mode == "warm_start":
+                model.set_params(warm_start=True)
+            new = train
+        else:
+            # Training windows are nested, so only the rows after the
+            # previous window's end are new.
+            new = train[seen:]
+        if mode == "partial_fit" and len(new) < len(train):
+            model.partial_fit(X[new], y[new])
+        else:
+            # A chain's first fold (and every cold fold) is a full fit, so
+            # its scores describe the same kind of model as the final fit.
+            model.fit(X[train], y[train])
+        fit_time = time.perf_counter() - start
+        seen = len(train)
+
+        start = time.perf_counter()
+        predictions = model.predict(X[test])
+        predict_time = time.perf_counter() - start
+        results.append(
+            {
+                "fold": fold,
+                "n_train": len(train),
+                "n_test": len(test),
+                "warm": mode is not None and len(new) < len(train),
+                "fit_time": fit_time,
+                "predict_time": predict_time,
+                **_score(task, y[test], predictions),
+                "test_rows": test,
+                "predictions": predictions,
+                # The next fold keeps updating a warm model, so snapshot it.
+                "model": model if mode is None else copy.deepcopy(model),
+            }
+        )
+    return results
+
+
+class WalkForwardTrainer:
+    """
+    Walk-forward cross-validation and final fit of a next-day model.
+    """
+
+    def __init__(
+        self,
+        estimator=None,
+        target: str = "forward_return_1d",
+        features: Optional[Iterable[str]] = None,
+        task: str = "regression",
+        n_splits: int = 5,
+        gap: int = 1,
+        min_train_days: Optional[int] = None,
+        warm_start: bool = True,
+        n_jobs: int = -1,
+        fill_value: Optional[float] = 0.0,
+        cache_dir=None,
+        date_col: str = "date",
+    ):
+        """
+        Args:
+            estimator: scikit-learn estimator. Defaults to ``Ridge()`` for
+                regression and ``LogisticRegression`` for classification.
+            target (str): Target column; for classification the label is
+                ``target > 0`` (next-day direction).
+            features (iterable of str, optional): Feature columns.
+                Defaults to every numeric column except forward returns.
+            task (str): "regression" or "classification".
+            n_splits (int): Number of walk-forward folds.
+            gap (int): Trading days left out between training and test
+                windows; at least the target horizon.
+            min_train_days (int, optional): Days before the first test
+                window. Defaults to one test window.
+            warm_start (bool): Warm-start folds within a chain when the
+                estimator supports it.
+            n_jobs (int): Worker processes (-1 for all cores).
+            fill_value (float, optional): Replaces missing feature values
+                (e.g. no-news days); None keeps NaN for estimators that
+                handle it.
+            cache_dir (str or Path, optional): Directory for cached
+                artifacts; None disables caching.
+            date_col (str): Date column used to order and split rows.
+        """
+        if task not in TASKS:
+            raise ValueError(f"task must be one of {TASKS}.")
+        if estimator is None:
+            estimator = (
+                LogisticRegression(max_iter=1000)
+                if task == "classification"
+                else Ridge()
+            )
+        if is_classifier(estimator) != (task == "classification"):
+            raise ValueError(f"Estimator does not match task '{task}'.")
+        self.estimator = estimator
+        self.target = target
+        self.features = None if features is None else list(features)
+        self.task = task
+        self.n_splits = n_splits
+        self.gap = gap
+        self.min_train_days = min_train_days
+        self.warm_start = warm_start
+        self.n_jobs = n_jobs
+        self.fill_value = fill_value
+        self.cache_dir = cache_dir
+        self.date_col = date_col
+
+    def feature_columns(self, frame: pd.DataFrame) -> list[str]:
+        if self.features is not None:
+            return self.features
+        numeric = frame.select_dtypes("number").columns
+        return [col for col in numeric if not col.startswith("forward_return")]
+
+    def chains(self) -> list[list[int]]:
+        """
+        Folds grouped into the contiguous chains that warm-start within
+        one worker; every fold is its own chain when nothing warm-starts.
+        """
+        warm = self.warm_start and warm_start_mode(self.estimator) is not None
+        n_chains = min(effective_n_jobs(self.n_jobs), self.n_splits) if warm else 0
+        folds = np.arange(self.n_splits)
+        return [c.tolist() for c in np.array_split(folds, n_chains or self.n_splits)]
+
+    def config(self, features: list[str]) -> dict:
+        """
+        Everything besides the data that determines the results, including
+        the chain layout (which depends on ``n_jobs`` when warm-starting).
+        """
+        params = {
+            key: repr(value)
+            for key, value in sorted(self.estimator.get_params(deep=True).items())
+        }
+        return {
+            "estimator": type(self.estimator).__qualname__,
+            "params": params,
+            "target": self.target,
+            "features": features,
+            "task": self.task,
+            "n_splits": self.n_splits,
+            "gap": self.gap,
+            "min_train_days": self.min_train_days,
+            "warm_start": self.warm_start,
+            "fill_value": self.fill_value,
+            "chains": self.chains(),
+        }
+
+    def cache_key(self, features: list[str], row_hashes: np.ndarray) -> str:
+        """Hash of ``config`` and of the training rows' fingerprints."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps(self.config(features), sort_keys=True).encode())
+        digest.update(np.ascontiguousarray(row_hashes).tobytes())
+        return digest.hexdigest()
+
+    def _prepare(self, frame: pd.DataFrame, features: list[str]):
+        frame = frame[frame[self.target].notna()]
+        # Order rows by date, then by content, so the folds, the models and
+        # the cache key do not depend on the input row order.
+        row_hashes = hash_rows(frame, [self.date_col, *features, self.target])
+        dates = pd.to_datetime(frame[self.date_col], utc=True)
+        dates = dates.to_numpy(dtype="datetime64[ns]")
+        order = np.lexsort((row_hashes, dates))
+        frame, dates, row_hashes = frame.iloc[order], dates[order], row_hashes[order]
+        X = frame[features].to_numpy(np.float64)
+        if self.fill_value is not None:
+            X = np.where(np.isnan(X), self.fill_value, X)
+        y = frame[self.target].to_numpy(np.float64)
+        if self.task == "classification":
+            y = (y > 0).astype(np.int64)
+        return frame, dates, np.ascontiguousarray(X), y, row_hashes
+
+    def run(self, frame: pd.DataFrame) -> dict:
+        """
+        Cross-validate walk-forward, then fit the final model on all rows.
+
+        Args:
+            frame (pd.DataFrame): Feature table, e.g. from
+                ``DailyFeatureStore.load``. Rows with a missing target are
+                dropped.
+
+        Returns:
+            dict: 'folds' (per-fold metrics, 'fit_time' and
+            'predict_time' in seconds), 'predictions' (out-of-fold
+            predictions indexed like ``frame``), 'fold_models', 'model'
+            (fitted on all rows), 'key' (cache key) and 'cached'.
+        """
+        features = self.feature_columns(frame)
+        missing = [c for c in [self.date_col, self.target, *features] if c not in frame]
+        if missing:
+            raise ValueError(f"Missing columns: {missing}")
+        frame, dates, X, y, row_hashes = self._prepare(frame, features)
+        key = self.cache_key(features, row_hashes)
+
+        path = None
+        if self.cache_dir is not None:
+            path = os.path.join(self.cache_dir, key, ARTIFACT_FILE)
+            if os.path.exists(path):
+                return {**joblib.load(path), "cached": True}
+
+        splits = walk_forward_splits(
+            dates, self.n_splits, self.gap, self.min_train_days
+        )
+        warm = self.warm_start and warm_start_mode(self.estimator) is not None
+
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        with tempfile.TemporaryDirectory(dir=self.cache_dir) as arrays_dir:
+            np.save(os.path.join(arrays_dir, "X.npy"), X)
+            np.save(os.path.join(arrays_dir, "y.npy"), y)
+            chain_results = Parallel(n_jobs=self.n_jobs)(
+                delayed(_run_chain)(
+                    arrays_dir,
+                    self.estimator,
+                    self.task,
+                    [(fold, splits[fold]) for fold in chain],
+                    warm,
+                )
+                for chain in self.chains()
+            )
+        results = [row for chain in chain_results for row in chain]
+
+        predictions = pd.Series(np.nan, index=frame.index, name="prediction")
+        for row in results:
+            predictions.iloc[row.pop("test_rows")] = row.pop("predictions")
+        fold_models = [row.pop("model") for row in results]
+
+        model = clone(self.estimator).fit(X, y)
+        artifacts = {
+            "folds": pd.DataFrame(results).set_index("fold"),
+            "predictions": predictions.dropna(),
+            "fold_models": fold_models,
+            "model": model,
+            "features": features,
+            "key": key,
+        }
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            joblib.dump(artifacts, tmp_path)
+            os.replace(tmp_path, path)
+        return {**artifacts, "cached": False}
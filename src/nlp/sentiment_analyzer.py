@@ -1,9 +1,16 @@
 # sentiment_analyzer.py
 
+from typing import Optional
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from eda.time_buckets import TimeBuckets
+
+from .text_utils import TokenizedCorpus
+
 
 class SentimentAnalyzer:
     """
@@ -65,10 +72,43 @@ class SentimentAnalyzer:
         Returns:
             pd.DataFrame: Updated DataFrame with sentiment score and label columns.
         """
-        df[self.score_col] = df[self.text_col].astype(str).apply(self.analyze_text)
+        # Score each distinct text once and broadcast the scores back.
+        codes, uniques = pd.factorize(df[self.text_col].astype(str))
+        scores = np.array([self.analyze_text(text) for text in uniques], dtype=float)
+        df[self.score_col] = scores[codes]
         df[self.label_col] = df[self.score_col].apply(self.score_to_label)
         return df
 
+    def lexicon_scores(
+        self, texts=None, corpus: Optional[TokenizedCorpus] = None
+    ) -> pd.Series:
+        """
+        Fast approximate compound scores from the VADER lexicon alone.
+
+        The valences of each text's tokens are summed and normalized like
+        VADER's compound score (x / sqrt(x^2 + 15)). VADER's negation,
+        booster, capitalization and punctuation rules are not applied, so
+        use this for bulk screening and ``apply_to_dataframe`` for exact
+        scores.
+
+        Parameters:
+            texts (iterable of str, optional): Texts to score.
+            corpus (TokenizedCorpus, optional): Already tokenized texts
+                (e.g. ``TopicModeler.corpus()``); reused instead of
+                tokenizing ``texts``.
+
+        Returns:
+            pd.Series: Scores between -1 and 1, aligned with the texts.
+        """
+        if corpus is None:
+            if texts is None:
+                raise ValueError("Pass texts or a corpus.")
+            corpus = TokenizedCorpus.from_texts(texts)
+        total = corpus.lexicon_scores(self.analyzer.lexicon)
+        return pd.Series(
+            total / np.sqrt(total * total + 15), index=corpus.index, name=self.score_col
+        )
+
     def plot_sentiment_distribution(self, df):
         """
         Plot bar chart of sentiment label counts.
@@ -85,7 +125,8 @@ class SentimentAnalyzer:
 
     def plot_sentiment_over_time(self, df, date_col="date"):
         """
-        Plot average sentiment score over time.
+        Plot average sentiment score over time, one point per calendar
+        day. ``df`` is not modified.
 
         Args:
             df (pd.DataFrame): DataFrame containing a datetime column.
@@ -94,8 +135,8 @@ class SentimentAnalyzer:
         if date_col not in df.columns:
             print(f"Column '{date_col}' not found in DataFrame.")
             return
-        df[date_col] = pd.to_datetime(df[date_col])
-        daily_sentiment = df.groupby(date_col)[self.score_col].mean()
+        buckets = TimeBuckets(pd.to_datetime(df[date_col]))
+        daily_sentiment = buckets.means(df[self.score_col], "day")
         daily_sentiment.plot(figsize=(12, 6), marker="o")
         plt.title("Average Daily Sentiment Over Time")
         plt.xlabel("Date")
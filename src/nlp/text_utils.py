@@ -0,0 +1,417 @@
+# text_utils.py
+
+import numbers
+from collections import deque
+from itertools import chain
+from typing import Callable, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from scipy import sparse
+from sklearn.feature_extraction.text import (
+    CountVectorizer,
+    TfidfTransformer,
+    TfidfVectorizer,
+)
+
+# scikit-learn's default word pattern, so corpus tokens match its vectorizers.
+TOKEN_PATTERN = r"(?u)\b\w\w+\b"
+
+
+def clean_text_series(texts: pd.Series) -> pd.Series:
+    """
+    Lowercase, strip URLs and punctuation and collapse whitespace, using
+    vectorized string operations.
+    """
+    return (
+        texts.astype(str)
+        .str.lower()
+        .str.replace(r"http\S+", "", regex=True)  # Remove URLs
+        .str.replace(r"[^\w\s]", "", regex=True)  # Remove punctuation
+        .str.replace(r"\s+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _lower_same_length(text: str) -> str:
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    # A few characters (e.g. "İ") lowercase to two; keep offsets aligned.
+    return "".join(c.lower() if len(c.lower()) == 1 else c for c in text)
+
+
+class EntityTagger:
+    """
+    Dictionary-based ticker and company mention tagger.
+
+    All patterns (tickers, company names, aliases) are compiled into one
+    Aho-Corasick automaton, so a text is scanned once, character by
+    character, whatever the dictionary size. Matching runs on lowercased
+    text; tickers are then checked case-sensitively (so "ON" matches but
+    "on" does not) while names and aliases match in any case. A match must
+    start and end on a word boundary, and overlapping matches resolve to
+    the leftmost-longest one.
+    """
+
+    def __init__(
+        self,
+        entities: Mapping[str, Iterable[str]],
+        match_tickers: bool = True,
+    ):
+        """
+        Build the automaton.
+
+        Parameters:
+            entities (dict): Maps each ticker to its company names and
+                aliases, e.g. ``{"AAPL": ["Apple", "Apple Inc"]}``.
+            match_tickers (bool): Also match the ticker symbols themselves
+                (case-sensitive).
+        """
+        self.entities = {ticker: list(aliases) for ticker, aliases in entities.items()}
+        self.match_tickers = match_tickers
+
+        # Per pattern: (ticker, length, exact text or None if case-insensitive)
+        self._patterns: list[tuple[str, int, object]] = []
+        keys = []
+        for ticker, aliases in self.entities.items():
+            if match_tickers:
+                self._patterns.append((ticker, len(ticker), ticker))
+                keys.append(ticker)
+            for alias in aliases:
+                if alias:
+                    self._patterns.append((ticker, len(alias), None))
+                    keys.append(alias)
+        self._build([_lower_same_length(key) for key in keys])
+
+    def _build(self, keys: list[str]):
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[list[int]] = [[]]
+        for pattern_id, key in enumerate(keys):
+            state = 0
+            for ch in key:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = goto[state][ch] = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                state = nxt
+            outputs[state].append(pattern_id)
+
+        # Breadth-first: failure links, merged outputs and DFA transitions.
+        # Root transitions are not copied into every state; ``tag_text`` falls
+        # back to them, which keeps the tables small.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [{} for _ in goto]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            inherited = delta[fail[state]] if fail[state] else {}
+            delta[state] = {**inherited, **goto[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for ch, child in goto[state].items():
+                target = inherited.get(ch)
+                fail[child] = goto[0].get(ch, 0) if target is None else target
+                queue.append(child)
+        self._root = goto[0]
+        self._delta = delta
+        self._outputs = [tuple(out) for out in outputs]
+
+    def tag_text(self, text) -> list[tuple[int, int, str]]:
+        """
+        Tag one text.
+
+        Returns:
+            list: ``(start, end, ticker)`` spans, ``text[start:end]`` being
+            the matched mention, in order of position.
+        """
+        if not isinstance(text, str) or not text:
+            return []
+        root, delta, outputs = self._root, self._delta, self._outputs
+        lowered = _lower_same_length(text)
+        state = 0
+        candidates = []
+        for end, ch in enumerate(lowered, start=1):
+            nxt = delta[state].get(ch)
+            state = root.get(ch, 0) if nxt is None else nxt
+            if outputs[state]:
+                candidates.append((end, state))
+        if not candidates:
+            return []
+
+        matches = []
+        for end, state in candidates:
+            for pattern_id in outputs[state]:
+                ticker, length, exact = self._patterns[pattern_id]
+                start = end - length
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end < len(text) and _is_word_char(text[end]):
+                    continue
+                if exact is not None and text[start:end] != exact:
+                    continue
+                matches.append((start, end, ticker))
+
+        matches.sort(key=lambda m: (m[0], m[0] - m[1]))
+        spans, last_end = [], 0
+        for start, end, ticker in matches:
+            if start >= last_end:
+                spans.append((start, end, ticker))
+                last_end = end
+        return spans
+
+    def _tag_many(self, texts) -> list[list[tuple[int, int, str]]]:
+        return [self.tag_text(text) for text in texts]
+
+    def tag(self, texts, n_jobs: int = 1, chunksize: int = 20_000) -> pd.DataFrame:
+        """
+        Tag a batch of texts.
+
+        Each distinct text is scanned once. With ``n_jobs != 1`` and more
+        than ``chunksize`` distinct texts, chunks are tagged in a process
+        pool.
+
+        Parameters:
+            texts (iterable of str or pd.Series): Texts to tag.
+            n_jobs (int): Worker processes (-1 for all cores).
+            chunksize (int): Distinct texts per worker task.
+
+        Returns:
+            pd.DataFrame: Aligned with ``texts``; 'tickers' holds the
+            distinct tickers mentioned (in order of first mention) and
+            'spans' the ``(start, end, ticker)`` spans.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        codes, uniques = pd.factorize(texts)
+        uniques = list(uniques)
+        if n_jobs == 1 or len(uniques) <= chunksize:
+            spans = self._tag_many(uniques)
+        else:
+            parts = Parallel(n_jobs=n_jobs)(
+                delayed(self._tag_many)(uniques[start : start + chunksize])
+                for start in range(0, len(uniques), chunksize)
+            )
+            spans = [row for part in parts for row in part]
+        tickers = [list(dict.fromkeys(t for _, _, t in row)) for row in spans]
+
+        # Missing texts (code -1) map to the trailing empty entry.
+        spans = pd.Series(spans + [[]], dtype=object).to_numpy()
+        tickers = pd.Series(tickers + [[]], dtype=object).to_numpy()
+        return pd.DataFrame(
+            {"tickers": tickers[codes], "spans": spans[codes]}, index=texts.index
+        )
+
+
+class TokenizedCorpus:
+    """
+    Texts normalized and tokenized once per distinct text.
+
+    Tokens are interned: ``vocabulary`` holds each distinct token once and
+    the documents are a flat ``int32`` array of token ids, with document
+    ``i`` spanning ``token_ids[offsets[i]:offsets[i + 1]]``. ``codes`` maps
+    every input row to its distinct document, so count matrices, cleaned
+    text and lexicon scores for all rows are gathered from the per-document
+    results instead of re-tokenizing duplicates.
+    """
+
+    def __init__(
+        self,
+        codes: np.ndarray,
+        documents: np.ndarray,
+        vocabulary: np.ndarray,
+        token_ids: np.ndarray,
+        offsets: np.ndarray,
+        index: Optional[pd.Index] = None,
+        token_pattern: str = TOKEN_PATTERN,
+    ):
+        self.codes = codes
+        self.documents = documents
+        self.vocabulary = vocabulary
+        self.token_ids = token_ids
+        self.offsets = offsets
+        self.index = pd.RangeIndex(len(codes)) if index is None else index
+        self.token_pattern = token_pattern
+
+    @classmethod
+    def from_texts(
+        cls,
+        texts,
+        cleaner: Callable[[pd.Series], pd.Series] = clean_text_series,
+        token_pattern: str = TOKEN_PATTERN,
+    ) -> "TokenizedCorpus":
+        """
+        Normalize and tokenize ``texts``.
+
+        Parameters:
+            texts (iterable of str or pd.Series): Raw texts; missing values
+                become empty documents.
+            cleaner (callable): Normalizer applied to the distinct texts,
+                e.g. ``TextCleaner().transform``.
+            token_pattern (str): Regex for tokens in the cleaned text.
+        """
+        texts = texts if isinstance(texts, pd.Series) else pd.Series(texts)
+        codes, uniques = pd.factorize(texts)
+        # Missing texts (code -1) share a trailing empty document.
+        codes = np.where(codes < 0, len(uniques), codes)
+        uniques = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+        documents = np.append(cleaner(uniques).to_numpy(dtype=object), "")
+
+        tokens = pd.Series(documents, dtype=object).str.findall(token_pattern)
+        lengths = tokens.str.len().to_numpy(dtype=np.int64)
+        flat = pd.Series(list(chain.from_iterable(tokens)), dtype=object)
+        token_ids, vocabulary = pd.factorize(flat)
+        return cls(
+            codes=codes,
+            documents=documents,
+            vocabulary=np.asarray(vocabulary, dtype=object),
+            token_ids=token_ids.astype(np.int32),
+            offsets=np.concatenate([[0], np.cumsum(lengths)]),
+            index=texts.index,
+            token_pattern=token_pattern,
+        )
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def n_documents(self) -> int:
+        """Number of distinct documents."""
+        return len(self.documents)
+
+    def tokens(self, row: int) -> list[str]:
+        """Tokens of input row ``row``."""
+        doc = self.codes[row]
+        ids = self.token_ids[self.offsets[doc] : self.offsets[doc + 1]]
+        return self.vocabulary[ids].tolist()
+
+    def cleaned_text(self) -> pd.Series:
+        """Cleaned text of every input row."""
+        return pd.Series(self.documents[self.codes], index=self.index, dtype=object)
+
+    def _document_of_token(self) -> np.ndarray:
+        return np.repeat(np.arange(self.n_documents), np.diff(self.offsets))
+
+    def document_count_matrix(self) -> sparse.csr_matrix:
+        """Token counts per distinct document (documents x vocabulary)."""
+        counts = sparse.csr_matrix(
+            (
+                np.ones(len(self.token_ids), dtype=np.int64),
+                (self._document_of_token(), self.token_ids),
+            ),
+            shape=(self.n_documents, len(self.vocabulary)),
+        )
+        counts.sum_duplicates()
+        return counts
+
+    def count_matrix(self) -> sparse.csr_matrix:
+        """Token counts per input row (rows x vocabulary)."""
+        return self.document_count_matrix()[self.codes]
+
+    def lexicon_scores(self, lexicon: Mapping[str, float]) -> np.ndarray:
+        """
+        Sum of the lexicon values of each row's tokens (0 for rows with no
+        lexicon token). The lexicon is looked up once per vocabulary entry.
+        """
+        values = np.array(
+            [lexicon.get(token, 0.0) for token in self.vocabulary], dtype=np.float64
+        )
+        per_document = np.bincount(
+            self._document_of_token(),
+            weights=values[self.token_ids],
+            minlength=self.n_documents,
+        )
+        return per_document[self.codes]
+
+
+def _corpus_compatible(vectorizer, corpus: TokenizedCorpus) -> bool:
+    is_tfidf = isinstance(vectorizer, TfidfVectorizer)
+    return (
+        isinstance(vectorizer, CountVectorizer)
+        and vectorizer.analyzer == "word"
+        and tuple(vectorizer.ngram_range) == (1, 1)
+        and vectorizer.tokenizer is None
+        and vectorizer.preprocessor is None
+        and vectorizer.strip_accents is None
+        and vectorizer.vocabulary is None
+        and vectorizer.max_features is None
+        and vectorizer.token_pattern == corpus.token_pattern
+        and (not is_tfidf or vectorizer.use_idf)
+        # TF-IDF weights and idf_ are only reproduced in float64.
+        and (not is_tfidf or np.dtype(vectorizer.dtype) == np.float64)
+        # Lowercasing is a no-op only if the cleaner already lowercased.
+        and (
+            not vectorizer.lowercase
+            or bool(
+                (pd.Index(corpus.vocabulary).str.lower() == corpus.vocabulary).all()
+            )
+        )
+    )
+
+
+def fit_vectorizer(vectorizer: CountVectorizer, corpus: TokenizedCorpus):
+    """
+    Fit a ``CountVectorizer``/``TfidfVectorizer`` from a tokenized corpus
+    and return the document-term matrix, as ``fit_transform`` on the
+    corpus' cleaned text would, without tokenizing it again.
+
+    Vectorizers whose settings the corpus cannot reproduce (custom
+    analyzers or tokenizers, n-grams, ``strip_accents``, ``lowercase`` on a
+    corpus that is not lowercased, fixed vocabularies, ``max_features``,
+    ``use_idf=False``, a non-float64 TF-IDF ``dtype``) are fitted with
+    ``fit_transform`` on the cleaned text instead.
+
+    The fitted attributes (``vocabulary_``, ``fixed_vocabulary_``,
+    ``stop_words_``, ``idf_``) are set directly, as scikit-learn's own
+    ``fit`` sets them; this relies on the pinned scikit-learn version and
+    is checked against ``fit_transform`` in the tests.
+    """
+    if not _corpus_compatible(vectorizer, corpus):
+        return vectorizer.fit_transform(corpus.cleaned_text())
+
+    counts = corpus.count_matrix()
+    n_rows = counts.shape[0]
+    doc_freq = np.bincount(counts.indices, minlength=len(corpus.vocabulary))
+    max_df, min_df = vectorizer.max_df, vectorizer.min_df
+    # Integers are document counts, floats proportions of the documents.
+    max_doc = int(max_df) if isinstance(max_df, numbers.Integral) else max_df * n_rows
+    min_doc = int(min_df) if isinstance(min_df, numbers.Integral) else min_df * n_rows
+    if max_doc < min_doc:
+        raise ValueError("max_df corresponds to < documents than min_df")
+
+    stop_words = vectorizer.get_stop_words() or frozenset()
+    allowed = ~np.isin(corpus.vocabulary, list(stop_words))
+    if not allowed.any():
+        raise ValueError(
+            "empty vocabulary; perhaps the documents only contain stop words"
+        )
+    keep = allowed & (doc_freq <= max_doc) & (doc_freq >= min_doc)
+    if not keep.any():
+        raise ValueError(
+            "After pruning, no terms remain. Try a lower min_df or a higher max_df."
+        )
+
+    kept = np.flatnonzero(keep)
+    kept = kept[np.argsort(corpus.vocabulary[kept], kind="stable")]
+    terms = corpus.vocabulary[kept].tolist()
+    X = counts[:, kept].astype(vectorizer.dtype)
+    if vectorizer.binary:
+        X.data.fill(1)
+    vectorizer.vocabulary_ = dict(zip(terms, range(len(terms))))
+    vectorizer.fixed_vocabulary_ = False
+    vectorizer.stop_words_ = set(corpus.vocabulary[allowed & ~keep].tolist())
+
+    if isinstance(vectorizer, TfidfVectorizer):
+        transformer = TfidfTransformer(
+            norm=vectorizer.norm,
+            use_idf=vectorizer.use_idf,
+            smooth_idf=vectorizer.smooth_idf,
+            sublinear_tf=vectorizer.sublinear_tf,
+        ).fit(X)
+        vectorizer.idf_ = transformer.idf_
+        X = transformer.transform(X)
+    return X
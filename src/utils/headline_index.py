@@ -0,0 +1,287 @@
+"""
+Headline Index Module
+------------------------
+On-disk inverted index over news headlines, with ticker and date
+secondary indexes.
+
+Headlines are cleaned and tokenized once per distinct headline
+(``TokenizedCorpus``). For each term, the ids (row positions) of the
+headlines that contain it are stored in ascending order, delta-encoded
+and packed as LEB128 varints into one postings file. Term and ticker
+dictionaries are sorted arrays that are memory-mapped and binary
+searched, and the date index is a sorted array of timestamps with their
+row ids. A query decodes only the posting lists it touches, and
+AND/OR combine sorted id arrays, so results take milliseconds. The
+returned row ids select rows with ``df.iloc``.
+"""
+
+import json
+import os
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from eda.data_quality_utils import parse_datetime_column
+from nlp.text_utils import TokenizedCorpus, clean_text_series
+
+META_FILE = "_index.json"
+
+
+def _varint_lengths(values: np.ndarray) -> np.ndarray:
+    n_bytes = np.ones(len(values), dtype=np.int64)
+    for k in range(1, 10):
+        n_bytes += values >= (np.uint64(1) << np.uint64(7 * k))
+    return n_bytes
+
+
+def encode_varints(values: np.ndarray) -> np.ndarray:
+    """
+    LEB128-encode non-negative integers: 7 bits per byte, low bits first,
+    high bit set on every byte but the last of each value.
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    if len(values) == 0:
+        return np.empty(0, dtype=np.uint8)
+    n_bytes = _varint_lengths(values)
+    starts = np.cumsum(n_bytes) - n_bytes
+    out = np.empty(int(n_bytes.sum()), dtype=np.uint8)
+    for k in range(int(n_bytes.max())):
+        has = n_bytes > k
+        byte = (values[has] >> np.uint64(7 * k)) & np.uint64(0x7F)
+        more = (n_bytes[has] > k + 1).astype(np.uint64) << np.uint64(7)
+        out[starts[has] + k] = (byte | more).astype(np.uint8)
+    return out
+
+
+def decode_varints(data: np.ndarray) -> np.ndarray:
+    """Decode a LEB128 byte array produced by ``encode_varints``."""
+    data = np.asarray(data, dtype=np.uint8)
+    if len(data) == 0:
+        return np.empty(0, dtype=np.uint64)
+    last = (data & 0x80) == 0
+    value_starts = np.concatenate([[0], np.flatnonzero(last)[:-1] + 1])
+    value_of_byte = np.cumsum(np.concatenate([[0], last[:-1]]))
+    shift = (np.arange(len(data)) - value_starts[value_of_byte]) * 7
+    parts = (data & 0x7F).astype(np.uint64) << shift.astype(np.uint64)
+    return np.add.reduceat(parts, value_starts)
+
+
+def _write_postings(root, name: str, keys: np.ndarray, matrix: sparse.csc_matrix):
+    """
+    Write one dictionary (sorted ``keys``) and the delta-varint postings of
+    the matching ``matrix`` columns, all columns encoded in one pass.
+    """
+    order = np.argsort(keys, kind="stable")
+    matrix = matrix[:, order]
+    matrix.sort_indices()
+    rows = matrix.indices.astype(np.int64)
+    indptr = matrix.indptr.astype(np.int64)
+    gaps = np.diff(rows, prepend=0)
+    # Each posting list starts from row 0, not from the previous list.
+    first = indptr[:-1][np.diff(indptr) > 0]
+    gaps[first] = rows[first]
+
+    gaps = gaps.astype(np.uint64)
+    value_offsets = np.concatenate([[0], np.cumsum(_varint_lengths(gaps))])
+    np.save(os.path.join(root, f"{name}.npy"), keys[order].astype(str))
+    np.save(os.path.join(root, f"{name}_offsets.npy"), value_offsets[indptr])
+    encode_varints(gaps).tofile(os.path.join(root, f"{name}.bin"))
+
+
+def _membership_matrix(codes: np.ndarray, n_keys: int) -> sparse.csc_matrix:
+    """Rows x keys boolean matrix from one key code per row (-1 = none)."""
+    rows = np.flatnonzero(codes >= 0)
+    return sparse.csc_matrix(
+        (np.ones(len(rows), dtype=np.int8), (rows, codes[rows])),
+        shape=(len(codes), n_keys),
+    )
+
+
+def build_headline_index(
+    df: pd.DataFrame,
+    root,
+    headline_col: str = "headline",
+    ticker_col: Optional[str] = "stock",
+    date_col: Optional[str] = "date",
+) -> "HeadlineIndex":
+    """
+    Build the index for ``df`` in directory ``root``.
+
+    Row ids are positions in ``df`` (use ``df.iloc``), so keep the frame
+    (or the file it was loaded from) unchanged while the index is in use.
+
+    Args:
+        df (pd.DataFrame): News rows.
+        root (str or Path): Index directory; created if missing, existing
+            index files are overwritten.
+        headline_col (str): Headline column.
+        ticker_col (str, optional): Ticker column for the ticker index.
+        date_col (str, optional): Date column for the date index.
+
+    Returns:
+        HeadlineIndex: The opened index.
+    """
+    os.makedirs(root, exist_ok=True)
+
+    corpus = TokenizedCorpus.from_texts(df[headline_col])
+    _write_postings(root, "terms", corpus.vocabulary, corpus.count_matrix().tocsc())
+
+    if ticker_col is not None and ticker_col in df.columns:
+        codes, tickers = pd.factorize(df[ticker_col].astype(object))
+        matrix = _membership_matrix(codes, len(tickers))
+        _write_postings(root, "tickers", np.asarray(tickers, dtype=str), matrix)
+
+    if date_col is not None and date_col in df.columns:
+        dates = parse_datetime_column(df[date_col])
+        values = dates.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        rows = np.flatnonzero(dates.notna().to_numpy())
+        order = rows[np.argsort(values[rows], kind="stable")]
+        np.save(os.path.join(root, "dates.npy"), values[order])
+        np.save(os.path.join(root, "date_rows.npy"), order.astype(np.int64))
+
+    with open(os.path.join(root, META_FILE), "w") as f:
+        json.dump({"n_rows": len(df), "headline_col": headline_col}, f)
+    return HeadlineIndex(root)
+
+
+def intersect(*row_sets: np.ndarray) -> np.ndarray:
+    """Row ids present in every sorted array (AND)."""
+    result = row_sets[0]
+    for rows in row_sets[1:]:
+        result = np.intersect1d(result, rows, assume_unique=True)
+    return result
+
+
+def union(*row_sets: np.ndarray) -> np.ndarray:
+    """Row ids present in any sorted array (OR)."""
+    if not row_sets:
+        return np.empty(0, dtype=np.int64)
+    return np.unique(np.concatenate(row_sets))
+
+
+def _utc_nanoseconds(value) -> int:
+    stamp = pd.Timestamp(value)
+    stamp = stamp.tz_localize("UTC") if stamp.tz is None else stamp
+    return stamp.value
+
+
+class HeadlineIndex:
+    """
+    Read-only view of an index written by ``build_headline_index``.
+
+    All arrays are memory-mapped, so opening the index is cheap and only
+    the posting lists a query touches are read.
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root (str or Path): Index directory.
+        """
+        self.root = root
+        with open(os.path.join(root, META_FILE)) as f:
+            self.meta = json.load(f)
+        self.n_rows = self.meta["n_rows"]
+        self._dictionaries = {
+            name: self._open_dictionary(name)
+            for name in ("terms", "tickers")
+            if os.path.exists(os.path.join(root, f"{name}.npy"))
+        }
+        self._dates = self._date_rows = None
+        if os.path.exists(os.path.join(root, "dates.npy")):
+            self._dates = np.load(os.path.join(root, "dates.npy"), mmap_mode="r")
+            self._date_rows = np.load(
+                os.path.join(root, "date_rows.npy"), mmap_mode="r"
+            )
+
+    def _open_dictionary(self, name: str):
+        path = os.path.join(self.root, name)
+        keys = np.load(f"{path}.npy", mmap_mode="r")
+        offsets = np.load(f"{path}_offsets.npy", mmap_mode="r")
+        if os.path.getsize(f"{path}.bin") == 0:  # empty files cannot be mapped
+            postings = np.empty(0, dtype=np.uint8)
+        else:
+            postings = np.memmap(f"{path}.bin", dtype=np.uint8, mode="r")
+        return keys, offsets, postings
+
+    def _postings(self, name: str, key: str) -> np.ndarray:
+        if name not in self._dictionaries:
+            raise ValueError(f"The index has no {name} dictionary.")
+        keys, offsets, postings = self._dictionaries[name]
+        position = np.searchsorted(keys, key)
+        if position == len(keys) or keys[position] != key:
+            return np.empty(0, dtype=np.int64)
+        data = postings[offsets[position] : offsets[position + 1]]
+        return np.cumsum(decode_varints(data)).astype(np.int64)
+
+    def term(self, term: str) -> np.ndarray:
+        """
+        Row ids of headlines containing ``term``. The term is cleaned like
+        the headlines; several words must all occur (in any order).
+        """
+        words = clean_text_series(pd.Series([term])).iloc[0].split()
+        if not words:
+            return np.empty(0, dtype=np.int64)
+        return intersect(*(self._postings("terms", word) for word in words))
+
+    def ticker(self, ticker: str) -> np.ndarray:
+        """Row ids of the rows for ``ticker`` (exact match)."""
+        return self._postings("tickers", str(ticker))
+
+    def date_range(self, start=None, end=None) -> np.ndarray:
+        """Row ids published in ``[start, end)``; naive bounds are UTC."""
+        if self._dates is None:
+            raise ValueError("The index has no date index.")
+        lo = (
+            0
+            if start is None
+            else np.searchsorted(self._dates, _utc_nanoseconds(start))
+        )
+        hi = (
+            len(self._dates)
+            if end is None
+            else np.searchsorted(self._dates, _utc_nanoseconds(end))
+        )
+        return np.sort(np.asarray(self._date_rows[lo:hi]))
+
+    def search(
+        self,
+        all_terms: Optional[Iterable[str]] = None,
+        any_terms: Optional[Iterable[str]] = None,
+        tickers: Optional[Iterable[str]] = None,
+        start=None,
+        end=None,
+    ) -> np.ndarray:
+        """
+        Boolean query: every one of ``all_terms`` AND at least one of
+        ``any_terms`` AND one of ``tickers`` AND published in
+        ``[start, end)``. Omitted clauses match every row. Use ``term``,
+        ``ticker``, ``date_range`` with ``intersect``/``union`` for other
+        combinations.
+
+        Returns:
+            np.ndarray: Sorted row ids, usable with ``df.iloc``.
+        """
+        clauses: list[np.ndarray] = []
+        if all_terms is not None:
+            clauses.extend(self.term(term) for term in all_terms)
+        if any_terms is not None:
+            clauses.append(union(*(self.term(term) for term in any_terms)))
+        if tickers is not None:
+            clauses.append(union(*(self.ticker(ticker) for ticker in tickers)))
+        if start is not None or end is not None:
+            clauses.append(self.date_range(start, end))
+        if not clauses:
+            return np.arange(self.n_rows, dtype=np.int64)
+        # Intersect the smallest lists first.
+        return intersect(*sorted(clauses, key=len))
+
+    def select(self, df: pd.DataFrame, rows: np.ndarray) -> pd.DataFrame:
+        """Rows of the indexed frame ``df`` for query results ``rows``."""
+        if len(df) != self.n_rows:
+            raise ValueError(
+                f"Index covers {self.n_rows} rows but the frame has {len(df)}."
+            )
+        return df.iloc[rows]
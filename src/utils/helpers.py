@@ -0,0 +1,105 @@
+"""
+Helpers Module
+------------------------
+Canonical loader for the financial news dataset and memory reporting
+helpers.
+
+The loader keeps the news frame compact: ``publisher`` and ``stock`` are
+categoricals, ``headline`` and ``url`` are Arrow-backed strings and
+``date`` is a UTC ``datetime64[ns]`` column (int64 nanoseconds under the
+hood). All EDA analyzers accept its output as-is.
+"""
+
+import logging
+import os
+from typing import Optional
+
+import pandas as pd
+
+from eda.data_quality_utils import parse_datetime_column
+
+logger = logging.getLogger(__name__)
+
+NEWS_COLUMNS = ["headline", "url", "publisher", "date", "stock"]
+CATEGORY_COLUMNS = ["publisher", "stock"]
+TEXT_COLUMNS = ["headline", "url"]
+TEXT_DTYPE = "string[pyarrow]"
+DATE_DTYPE = "datetime64[ns, UTC]"
+
+
+def compact_news_dtypes(df: pd.DataFrame, date_col: str = "date") -> pd.DataFrame:
+    """
+    Convert news columns to their compact dtypes in place and return ``df``.
+
+    Args:
+        df (pd.DataFrame): News frame with any subset of the news columns.
+        date_col (str): Name of the publication date column.
+    """
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    for col in TEXT_COLUMNS:
+        if col in df.columns and df[col].dtype != TEXT_DTYPE:
+            df[col] = df[col].astype(TEXT_DTYPE)
+    if date_col in df.columns:
+        dates = df[date_col]
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            dates = parse_datetime_column(dates)
+        elif dates.dt.tz is None:
+            dates = dates.dt.tz_localize("UTC")
+        df[date_col] = dates.astype(DATE_DTYPE)
+    return df
+
+
+def load_news_frame(
+    path,
+    columns: Optional[list[str]] = None,
+    date_col: str = "date",
+    report_memory: bool = False,
+) -> pd.DataFrame:
+    """
+    Load the news dataset from CSV or Parquet with compact dtypes.
+
+    Args:
+        path (str or Path): ``.csv`` or ``.parquet`` file.
+        columns (list[str], optional): Columns to read. Defaults to the
+            standard news columns; other columns in the file are skipped.
+        date_col (str): Name of the publication date column.
+        report_memory (bool): Log per-column memory usage after loading.
+
+    Returns:
+        pd.DataFrame: The news frame.
+    """
+    if columns is None:
+        columns = NEWS_COLUMNS
+
+    suffix = os.path.splitext(str(path))[1].lower()
+    if suffix in (".parquet", ".pq"):
+        df = pd.read_parquet(path, columns=columns)
+    else:
+        dtypes = {col: "category" for col in CATEGORY_COLUMNS if col in columns}
+        dtypes.update({col: TEXT_DTYPE for col in TEXT_COLUMNS if col in columns})
+        if date_col in columns:
+            dtypes[date_col] = TEXT_DTYPE
+        df = pd.read_csv(path, usecols=columns, dtype=dtypes, engine="pyarrow")
+
+    df = compact_news_dtypes(df, date_col=date_col)
+    if report_memory:
+        logger.info("Loaded %s:\n%s", path, memory_usage_report(df).to_string())
+    return df
+
+
+def memory_usage_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return deep memory usage per column, largest first, with a total row.
+
+    Returns:
+        pd.DataFrame: Columns ``dtype``, ``bytes`` and ``MB``.
+    """
+    usage = df.memory_usage(deep=True, index=False)
+    report = pd.DataFrame({"dtype": df.dtypes.astype(str), "bytes": usage}).sort_values(
+        "bytes", ascending=False
+    )
+    report.loc["total"] = ["", int(usage.sum())]
+    report["MB"] = (report["bytes"] / 1024**2).round(3)
+    return report
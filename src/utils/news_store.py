@@ -0,0 +1,193 @@
+"""
+News Store Module
+------------------------
+Partitioned Parquet store for scored news.
+
+Rows are partitioned by publication month and by a stable hash bucket of
+the ticker (``month=2020-01/ticker_bucket=7/...``), and sorted by ticker
+and date inside each file so Parquet row-group statistics are selective.
+A query such as "NVDA headlines in 2020-Q1" only opens the matching
+partitions and lets Arrow skip row groups through filter pushdown.
+"""
+
+import json
+import os
+import uuid
+import zlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+
+from utils.helpers import CATEGORY_COLUMNS, compact_news_dtypes
+
+PARTITION_COLUMNS = ["month", "ticker_bucket"]
+PARTITION_SCHEMA = pa.schema([("month", pa.string()), ("ticker_bucket", pa.int32())])
+METADATA_FILE = "_store.json"
+
+
+def ticker_bucket(tickers, n_buckets: int) -> np.ndarray:
+    """Stable (process-independent) hash bucket for each ticker."""
+    tickers = pd.Series(tickers, dtype=object)
+    uniques, codes = np.unique(tickers.astype(str).to_numpy(), return_inverse=True)
+    buckets = np.array(
+        [zlib.crc32(ticker.encode()) % n_buckets for ticker in uniques],
+        dtype=np.int32,
+    )
+    return buckets[codes]
+
+
+def _read_metadata(root) -> dict:
+    with open(os.path.join(root, METADATA_FILE)) as f:
+        return json.load(f)
+
+
+def write_news_store(
+    df: pd.DataFrame,
+    root,
+    date_col: str = "date",
+    ticker_col: str = "stock",
+    n_buckets: int = 16,
+    max_rows_per_group: int = 64_000,
+) -> None:
+    """
+    Append scored news rows to the partitioned store at ``root``.
+
+    Args:
+        df (pd.DataFrame): News rows with a datetime ``date_col`` and a
+            ``ticker_col``. Any other columns (e.g. sentiment) are stored too.
+        root (str or Path): Store directory; created if missing.
+        date_col (str): Publication date column.
+        ticker_col (str): Ticker column.
+        n_buckets (int): Number of ticker hash buckets. Must match the
+            value used when the store was created.
+        max_rows_per_group (int): Parquet row-group size.
+    """
+    if date_col not in df.columns or ticker_col not in df.columns:
+        raise ValueError(f"df must contain '{date_col}' and '{ticker_col}' columns.")
+
+    os.makedirs(root, exist_ok=True)
+    meta_path = os.path.join(root, METADATA_FILE)
+    if os.path.exists(meta_path):
+        meta = _read_metadata(root)
+        if meta["n_buckets"] != n_buckets:
+            raise ValueError(
+                f"Store at {root} uses {meta['n_buckets']} ticker buckets, "
+                f"not {n_buckets}."
+            )
+    else:
+        meta = {"n_buckets": n_buckets, "date_col": date_col, "ticker_col": ticker_col}
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+    dates = pd.to_datetime(df[date_col], utc=True)
+    frame = df.assign(**{date_col: dates}).dropna(subset=[date_col, ticker_col])
+    # Categoricals are stored as plain strings so filters compare directly.
+    frame = frame.astype(
+        {col: "string[pyarrow]" for col in CATEGORY_COLUMNS if col in frame.columns}
+    )
+    frame["month"] = frame[date_col].dt.strftime("%Y-%m")
+    frame["ticker_bucket"] = ticker_bucket(frame[ticker_col], n_buckets)
+    frame = frame.sort_values([ticker_col, date_col], kind="stable")
+
+    table = pa.Table.from_pandas(frame, preserve_index=False)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+        basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        max_rows_per_group=max_rows_per_group,
+        min_rows_per_group=min(max_rows_per_group, 1024),
+    )
+
+
+def _period_bounds(period) -> tuple[pd.Timestamp, pd.Timestamp]:
+    period = pd.Period(period)
+    return period.start_time, period.end_time + pd.Timedelta(1, "ns")
+
+
+def build_filter(
+    n_buckets: int,
+    tickers: Optional[list[str]] = None,
+    start=None,
+    end=None,
+    date_col: str = "date",
+    ticker_col: str = "stock",
+) -> Optional[ds.Expression]:
+    """Arrow filter expression on partitions, ticker and date ``[start, end)``."""
+    conditions = []
+    if tickers is not None:
+        tickers = [str(t) for t in tickers]
+        buckets = sorted(set(ticker_bucket(tickers, n_buckets).tolist()))
+        conditions.append(ds.field("ticker_bucket").isin(buckets))
+        conditions.append(ds.field(ticker_col).isin(tickers))
+    if start is not None:
+        start = pd.Timestamp(start)
+        # Partitions are UTC months, so convert before taking the month.
+        start = start.tz_localize("UTC") if start.tz is None else start
+        start = start.tz_convert("UTC")
+        conditions.append(ds.field("month") >= start.strftime("%Y-%m"))
+        conditions.append(ds.field(date_col) >= pa.scalar(start.to_pydatetime()))
+    if end is not None:
+        end = pd.Timestamp(end)
+        end = end.tz_localize("UTC") if end.tz is None else end
+        end = end.tz_convert("UTC")
+        conditions.append(ds.field("month") <= end.strftime("%Y-%m"))
+        conditions.append(ds.field(date_col) < pa.scalar(end.to_pydatetime()))
+
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+
+def read_news_store(
+    root,
+    tickers: Optional[list[str]] = None,
+    start=None,
+    end=None,
+    period=None,
+    columns: Optional[list[str]] = None,
+) -> pd.DataFrame:
+    """
+    Query the store, reading only matching partitions and row groups.
+
+    Args:
+        root (str or Path): Store directory.
+        tickers (list[str], optional): Tickers to keep.
+        start, end (str or Timestamp, optional): Date range ``[start, end)``.
+            Naive values are taken as UTC.
+        period (str, optional): Pandas period such as ``"2020Q1"`` or
+            ``"2020-03"``; overrides ``start``/``end``.
+        columns (list[str], optional): Columns to return.
+
+    Returns:
+        pd.DataFrame: Matching rows with compact news dtypes, sorted by date.
+    """
+    meta = _read_metadata(root)
+    date_col, ticker_col = meta["date_col"], meta["ticker_col"]
+    if period is not None:
+        start, end = _period_bounds(period)
+
+    dataset = ds.dataset(
+        root,
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+    )
+    if columns is None:
+        columns = [
+            name for name in dataset.schema.names if name not in PARTITION_COLUMNS
+        ]
+    expression = build_filter(
+        meta["n_buckets"], tickers, start, end, date_col=date_col, ticker_col=ticker_col
+    )
+    table = dataset.to_table(columns=columns, filter=expression)
+
+    df = table.to_pandas()
+    if date_col in df.columns:
+        df = df.sort_values(date_col, kind="stable").reset_index(drop=True)
+    return compact_news_dtypes(df, date_col=date_col)
@@ -19,6 +19,8 @@ import yfinance as yf
 from ta import add_all_ta_features
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
+from utils.news_store import read_news_store
+
 
 class TickerAnalyzer:
     """
@@ -72,25 +74,57 @@ class TickerAnalyzer:
         except Exception as e:
             raise RuntimeError(f"Failed to add technical indicators: {e}")
 
-    def analyze_sentiment(self, news_df: pd.DataFrame) -> pd.DataFrame:
+    def analyze_sentiment(
+        self, news_df: pd.DataFrame, rescore: bool = True
+    ) -> pd.DataFrame:
         """
         Analyzes sentiment in news headlines.
 
         Args:
             news_df (pd.DataFrame): News data with 'headline' and 'date' columns.
+            rescore (bool): If False, keep existing 'sentiment' scores (e.g. from
+                the news store) and only score rows where it is missing.
         """
         if "headline" not in news_df.columns or "date" not in news_df.columns:
             raise ValueError("news_df must contain 'headline' and 'date' columns.")
 
         try:
-            news_df["sentiment"] = news_df["headline"].apply(
-                lambda text: self.analyzer.polarity_scores(text)["compound"]
-            )
+            if rescore or "sentiment" not in news_df.columns:
+                news_df["sentiment"] = news_df["headline"].apply(
+                    lambda text: self.analyzer.polarity_scores(text)["compound"]
+                )
+            else:
+                missing = news_df["sentiment"].isna()
+                if missing.any():
+                    news_df.loc[missing, "sentiment"] = news_df.loc[
+                        missing, "headline"
+                    ].apply(
+                        lambda text: self.analyzer.polarity_scores(text)["compound"]
+                    )
             self.sentiment_df = news_df
             return news_df
         except Exception as e:
             raise RuntimeError(f"Sentiment analysis failed: {e}")
 
+    def analyze_sentiment_from_store(
+        self, store_root: str, start=None, end=None, period=None
+    ) -> pd.DataFrame:
+        """
+        Loads this ticker's news from the partitioned news store and analyzes it.
+
+        Only the partitions and row groups for this ticker and date range are
+        read. Scores already in the store are reused.
+
+        Args:
+            store_root (str): Directory written by ``write_news_store``.
+            start, end (optional): Date range ``[start, end)``.
+            period (str, optional): Pandas period such as ``"2020Q1"``.
+        """
+        news_df = read_news_store(
+            store_root, tickers=[self.ticker], start=start, end=end, period=period
+        )
+        return self.analyze_sentiment(news_df, rescore=False)
+
     def merge_price_and_sentiment(self) -> pd.DataFrame:
         """Merges price data with sentiment scores based on date."""
         if self.price_df is None or self.sentiment_df is None:
@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.data_profiler import DataProfiler
+
+
+@pytest.fixture
+def sample_df():
+    return pd.DataFrame(
+        {
+            "headline": ["Up", "Down", "Up", " N/A ", None, "-", "Up", "null"],
+            "publisher": ["a", "b", "a", "c", "c", "b", "a", "NA"],
+            "score": [0.1, 0.2, 0.1, np.nan, 0.5, 0.2, 0.1, 0.3],
+        }
+    )
+
+
+def test_profile_matches_pandas(sample_df):
+    profile = DataProfiler.from_frame(sample_df)
+
+    pd.testing.assert_series_equal(
+        profile.missing_counts(), sample_df.isna().sum(), check_names=False
+    )
+    pd.testing.assert_series_equal(
+        profile.distinct_counts(), sample_df.nunique(), check_names=False
+    )
+    assert profile.n_duplicates == sample_df.duplicated().sum()
+    assert profile.n_rows == len(sample_df)
+
+
+def test_invalid_values_match_string_scan(sample_df):
+    invalids = DataProfiler.from_frame(sample_df).invalid_values()
+    tokens = ["", "NA", "null", "NULL", "-", "N/A"]
+    for col in ["headline", "publisher"]:
+        mask = sample_df[col].astype(str).str.strip().isin(tokens)
+        assert invalids[col]["count"] == mask.sum()
+        pd.testing.assert_series_equal(
+            invalids[col]["examples"], sample_df.loc[mask, col].head(5)
+        )
+    assert "score" not in invalids
+
+
+def test_chunked_profile_equals_single_pass(sample_df):
+    whole = DataProfiler.from_frame(sample_df)
+    chunked = DataProfiler.from_frame(sample_df, chunksize=3)
+
+    pd.testing.assert_frame_equal(whole.summary(), chunked.summary())
+    assert whole.n_duplicates == chunked.n_duplicates
+    assert whole.invalid_values().keys() == chunked.invalid_values().keys()
+
+
+def test_from_csv_counts_duplicates_across_chunks(tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3, 1, 2, 4], "b": list("xyzxyq")})
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+
+    profile = DataProfiler.from_csv(path, chunksize=2)
+    assert profile.n_rows == 6
+    assert profile.n_duplicates == 2
+    assert profile.distinct_counts()["a"] == 4
+
+
+def test_update_rejects_mismatched_columns(sample_df):
+    profile = DataProfiler.from_frame(sample_df)
+    with pytest.raises(ValueError):
+        profile.update(sample_df.drop(columns=["score"]))
+
+
+def test_from_csv_hashes_are_independent_of_chunk_dtypes(tmp_path):
+    # Chunk 2 reads x as float64 (it has a missing value), the others as int64.
+    path = tmp_path / "data.csv"
+    path.write_text("x,y\n1,a\n2,b\n1,a\n,c\n2,b\n")
+
+    profile = DataProfiler.from_csv(path, chunksize=2)
+    assert profile.n_duplicates == 2
+    assert profile.distinct_counts()["x"] == 2
+    assert profile.missing_counts()["x"] == 1
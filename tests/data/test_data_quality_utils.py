@@ -1,8 +1,11 @@
+import logging
+
 import pandas as pd
 import pytest
 
 from src.eda.data_quality_utils import (
     DataQualityUtils,
+    parse_datetime_column,
 )  # Adjust this import to match your file structure
 
 
@@ -89,12 +92,79 @@ def test_count_duplicates(sample_df):
     assert dq.count_duplicates() == dq.check_duplicates()
 
 
-def test_convert_columns_to_datetime(sample_df, capsys):
-    """Should convert datetime-related columns and print conversion info"""
+def test_convert_columns_to_datetime(sample_df, caplog):
+    """Should convert datetime-related columns and log conversion info"""
     dq = DataQualityUtils(sample_df)
     dq.clean_column_names()
-    result_df = dq.convert_columns_to_datetime()
+    with caplog.at_level(logging.INFO):
+        result_df = dq.convert_columns_to_datetime()
 
     assert pd.api.types.is_datetime64_any_dtype(result_df["date_of_birth"])
-    captured = capsys.readouterr()
-    assert "Converted" in captured.out or "not found" in captured.out
+    assert "[date_of_birth] Converted: 1/3 (2 became NaT)" in caplog.text
+
+
+def test_parse_datetime_column_matches_full_parse():
+    """Should parse unique strings only and broadcast them back to every row"""
+    raw = pd.Series(
+        ["2020-06-05 10:30:54-04:00", " 2020-06-05 10:30:54-04:00 ", "null"] * 4
+        + ["2020-01-05 10:30:54-05:00", None]
+    )
+    parsed = parse_datetime_column(raw)
+
+    assert str(parsed.dtype) == "datetime64[ns, UTC]"
+    assert parsed.iloc[1] == pd.Timestamp("2020-06-05 14:30:54", tz="UTC")
+    assert parsed.iloc[-2] == pd.Timestamp("2020-01-05 15:30:54", tz="UTC")
+    assert parsed.isna().sum() == 5
+
+
+def test_parse_datetime_column_mixed_layouts_and_explicit_format():
+    raw = pd.Series(["2020-01-02", "2020/01/03", "junk"])
+    parsed = parse_datetime_column(raw)
+    assert parsed.dt.day.tolist()[:2] == [2, 3]
+    assert pd.isna(parsed.iloc[2])
+
+    explicit = parse_datetime_column(pd.Series(["02/01/2020"]), format="%d/%m/%Y")
+    assert explicit.iloc[0] == pd.Timestamp("2020-01-02", tz="UTC")
+
+
+def test_parse_datetime_column_explicit_format_is_strict():
+    raw = pd.Series(["02/01/2020", "01/13/2020"])
+    coerced = parse_datetime_column(raw, format="%d/%m/%Y")
+    assert coerced.iloc[0] == pd.Timestamp("2020-01-02", tz="UTC")
+    assert pd.isna(coerced.iloc[1])
+    with pytest.raises(ValueError):
+        parse_datetime_column(raw, format="%d/%m/%Y", errors="raise")
+
+
+def test_parse_datetime_column_inferred_format_can_mix_day_order():
+    # Inferred day-first from the first value; "01/13/2020" only fits
+    # month-first, so the mixed retry reads that row month-first.
+    parsed = parse_datetime_column(pd.Series(["13/01/2020", "01/13/2020"]))
+    assert parsed.tolist() == [pd.Timestamp("2020-01-13", tz="UTC")] * 2
+
+
+def test_convert_columns_to_datetime_missing_column_warns(sample_df, caplog):
+    dq = DataQualityUtils(sample_df)
+    with caplog.at_level(logging.WARNING):
+        dq.convert_columns_to_datetime(columns=["missing"])
+    assert "Column 'missing' not found." in caplog.text
+
+
+def test_profile_is_cached_and_invalidated(sample_df):
+    """Should reuse the profile until the frame is modified"""
+    dq = DataQualityUtils(sample_df)
+    profile = dq.profile()
+    assert dq.profile() is profile
+    dq.clean_column_names()
+    assert dq.profile() is not profile
+    assert "date_of_birth" in dq.profile().columns
+
+
+def test_profile_follows_reassigned_and_reshaped_frame():
+    dq = DataQualityUtils(pd.DataFrame({"a": [1, 1, 2]}))
+    assert dq.check_duplicates() == 1
+    dq.df = dq.df.drop_duplicates()
+    assert dq.check_duplicates() == 0
+
+    dq.df.drop(index=dq.df.index[-1], inplace=True)
+    assert dq.profile().n_rows == 1
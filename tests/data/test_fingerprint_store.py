@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+
+from src.eda.data_quality_utils import DataQualityUtils
+from src.eda.fingerprint_store import FingerprintStore, hash_rows
+
+
+def _batch(headlines, stocks):
+    return pd.DataFrame({"headline": headlines, "stock": stocks})
+
+
+def test_hash_rows_ignores_index():
+    df = _batch(["a", "b"], ["X", "Y"])
+    shifted = df.set_axis([10, 11])
+    np.testing.assert_array_equal(hash_rows(df), hash_rows(shifted))
+
+
+def test_within_batch_matches_duplicated():
+    df = _batch(["a", "b", "a", "c", "b"], ["X", "Y", "X", "Z", "Y"])
+    store = FingerprintStore()
+    flagged = store.add(df)
+    pd.testing.assert_series_equal(flagged, df.duplicated())
+    assert len(store) == 3
+
+
+def test_duplicates_across_batches_are_flagged():
+    store = FingerprintStore(subset=["headline"])
+    store.add(_batch(["a", "b"], ["X", "Y"]))
+
+    flagged = store.add(_batch(["b", "c", "c"], ["Z", "Z", "Z"]))
+    assert flagged.tolist() == [True, False, True]
+    assert len(store) == 3
+
+
+def test_check_does_not_store():
+    store = FingerprintStore()
+    store.check(_batch(["a"], ["X"]))
+    assert len(store) == 0
+
+
+def test_store_persists_between_runs(tmp_path):
+    path = tmp_path / "fingerprints.npy"
+    store = FingerprintStore(path)
+    store.add(_batch(["a", "b"], ["X", "Y"]))
+    store.save()
+
+    reloaded = FingerprintStore(path)
+    assert len(reloaded) == 2
+    flagged = reloaded.add(_batch(["b", "d"], ["Y", "W"]))
+    assert flagged.tolist() == [True, False]
+
+
+def test_data_quality_utils_flag_duplicates():
+    store = FingerprintStore()
+    DataQualityUtils(_batch(["a", "b"], ["X", "Y"])).flag_duplicates(store)
+    flagged = DataQualityUtils(_batch(["a", "z"], ["X", "Y"])).flag_duplicates(
+        store, add=False
+    )
+    assert flagged.tolist() == [True, False]
+    assert len(store) == 2
+
+
+def test_rows_repeat_across_batches_with_different_dtypes():
+    store = FingerprintStore()
+    store.add(pd.DataFrame({"id": [1, 2], "headline": ["a", "b"]}))
+    # A missing id makes pandas read the column as float64.
+    later = pd.DataFrame({"id": [2.0, np.nan], "headline": ["b", "c"]})
+    assert store.add(later).tolist() == [True, False]
+    assert store.check(pd.DataFrame({"id": [None], "headline": ["c"]})).tolist() == [
+        True
+    ]
+
+    shared = FingerprintStore()
+    DataQualityUtils(pd.DataFrame({"id": [1, 2]})).flag_duplicates(shared)
+    flagged = DataQualityUtils(pd.DataFrame({"id": [2.0, np.nan]})).flag_duplicates(
+        shared
+    )
+    assert flagged.tolist() == [True, False]
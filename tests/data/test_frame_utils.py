@@ -0,0 +1,104 @@
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.data_quality_utils import DataQualityUtils
+from eda.frame_utils import analyzer_frame
+from eda.publisher_analyzer import PublisherAnalyzer
+from eda.textual_eda import TextualEDA
+from eda.time_series_analyzer import TimeSeriesAnalyzer
+from eda.topic_modeler import TopicModeler
+from eda.visualizer import DataVisualizer
+
+
+@pytest.fixture
+def news_df():
+    return pd.DataFrame(
+        {
+            "headline": [
+                "Stocks rally as tech earnings beat",
+                "Oil prices fall on supply worries",
+                "Tech stocks rally again",
+                "Central bank holds rates",
+                "Oil supply worries ease",
+                "Earnings beat lifts tech",
+            ],
+            "publisher": ["a@x.com", "b@y.com", "a@x.com", "c", "b@y.com", "a@x.com"],
+            "date": [
+                "2025-06-01",
+                "2025-06-02",
+                "2025-06-02",
+                "bad date",
+                "2025-06-04",
+                "2025-06-05",
+            ],
+            "stock": ["AAPL", "XOM", "MSFT", "JPM", "XOM", "AAPL"],
+            "sentiment_score": [0.5, -0.3, 0.4, 0.0, 0.2, 0.6],
+        }
+    )
+
+
+def test_analyzer_frame_copy_is_independent(news_df):
+    frame = analyzer_frame(news_df)
+    assert not np.shares_memory(
+        frame["sentiment_score"].to_numpy(), news_df["sentiment_score"].to_numpy()
+    )
+
+
+def test_analyzer_frame_without_copy_shares_all_columns(news_df):
+    frame = analyzer_frame(news_df, copy=False)
+    assert list(frame.columns) == list(news_df.columns)
+    assert np.shares_memory(
+        frame["sentiment_score"].to_numpy(), news_df["sentiment_score"].to_numpy()
+    )
+    frame["sentiment_score"] = 0.0
+    assert news_df["sentiment_score"].iloc[0] == 0.5
+
+
+def test_no_copy_analyzers_leave_caller_frame_untouched(news_df):
+    original = news_df.copy()
+
+    dq = DataQualityUtils(news_df, copy=False)
+    dq.clean_dataframe()
+    dq.convert_columns_to_datetime()
+    dq.summary()
+
+    eda = TextualEDA(news_df, source_col="publisher", copy=False)
+    eda.headline_length_stats()
+    eda.publication_trends()
+    eda.weekday_distribution()
+
+    tsa = TimeSeriesAnalyzer(news_df, copy=False)
+    tsa.detect_spikes()
+
+    pa = PublisherAnalyzer(news_df, copy=False)
+    pa.run_all(plot=False)
+
+    modeler = TopicModeler(news_df, n_topics=2, copy=False)
+    modeler.fit()
+    modeler.plot_topic_distribution()
+
+    DataVisualizer(news_df, copy=False).plot_articles_per_publisher()
+    plt.close("all")
+
+    pd.testing.assert_frame_equal(news_df, original)
+
+
+def test_no_copy_mode_keeps_all_columns(news_df):
+    tsa = TimeSeriesAnalyzer(news_df, copy=False)
+    assert list(tsa.df.columns) == ["headline", "publisher", "stock", "sentiment_score"]
+    assert list(PublisherAnalyzer(news_df, copy=False).df.columns) == list(
+        news_df.columns
+    )
+    labeled = {}
+    for copy in (True, False):
+        modeler = TopicModeler(news_df, n_topics=2, copy=copy)
+        modeler.fit()
+        modeler.assign_topics()
+        labeled[copy] = modeler.get_labeled_df()
+    assert list(labeled[False].columns) == [*news_df.columns, "Predicted Topic"]
+    pd.testing.assert_frame_equal(labeled[False], labeled[True])
+    eda = TextualEDA(news_df, source_col="publishr", copy=False)
+    with pytest.raises(KeyError, match="Did you mean 'publisher'"):
+        eda.articles_per_publisher()
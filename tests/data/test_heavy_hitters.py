@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.heavy_hitters import SlidingTopK, SpaceSaving
+
+
+def zipf_stream(n, n_items, seed):
+    rng = np.random.default_rng(seed)
+    return pd.Series(rng.zipf(1.3, n) % n_items).map("item{}".format)
+
+
+def assert_within_bounds(sketch, stream):
+    exact = stream.value_counts()
+    bound = len(stream) / sketch.capacity
+    top = sketch.top(sketch.capacity)
+    for item, row in top.iterrows():
+        true = exact.get(item, 0)
+        assert row["guaranteed"] <= true <= row["count"]
+        assert row["error"] <= bound
+    # Every item more frequent than N / capacity must be tracked.
+    assert set(exact[exact > bound].index) <= set(top.index)
+
+
+def test_single_sketch_error_bounds():
+    stream = zipf_stream(20_000, 500, seed=0)
+    sketch = SpaceSaving(capacity=50)
+    sketch.update_many(stream)
+    assert sketch.total == len(stream)
+    assert len(sketch) == 50
+    assert_within_bounds(sketch, stream)
+
+
+def test_exact_when_capacity_covers_all_items():
+    stream = zipf_stream(5_000, 30, seed=1)
+    sketch = SpaceSaving(capacity=100)
+    for item in stream:
+        sketch.update(item)
+    top = sketch.top(10)
+    expected = stream.value_counts().head(10)
+    assert top["count"].tolist() == expected.tolist()
+    assert (top["error"] == 0).all()
+
+
+def test_merged_worker_sketches_keep_bounds():
+    stream = zipf_stream(30_000, 800, seed=2)
+    sketches = []
+    for part in np.array_split(stream, 4):
+        sketch = SpaceSaving(capacity=60)
+        sketch.update_many(part)
+        sketches.append(sketch)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged = merged.merge(sketch)
+    assert merged.total == len(stream)
+    assert len(merged) <= 60
+    assert_within_bounds(merged, stream)
+
+
+def test_sliding_window_matches_exact_window_counts():
+    rng = np.random.default_rng(3)
+    times = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+        np.sort(rng.integers(0, 48 * 3600, 4_000)), unit="s"
+    )
+    items = pd.Series(rng.choice(["AAPL", "NVDA", "TSLA", "MSFT"], 4_000))
+    window = SlidingTopK(window="6h", bucket="1h", capacity=10)
+    for start in range(0, 4_000, 500):
+        window.update(items[start : start + 500], times[start : start + 500])
+
+    cutoff = times.max().floor("1h") - pd.Timedelta("5h")
+    expected = items[times >= cutoff].value_counts()
+    top = window.top(4)
+    assert top["count"].to_dict() == expected.to_dict()
+    assert len(window._buckets) == 6
+
+
+def test_sliding_window_bounded_sketch_keeps_bounds():
+    stream = zipf_stream(10_000, 300, seed=4)
+    times = pd.date_range("2020-01-01", periods=len(stream), freq="min")
+    window = SlidingTopK(window="2h", bucket="30min", capacity=20)
+    window.update(stream, times)
+    live = stream[times >= times.max().floor("30min") - pd.Timedelta("90min")]
+    sketch = window.sketch()
+    assert sketch.total == len(live)
+    # Merging buckets adds their error bounds, so the total is still N / k.
+    assert_within_bounds(sketch, live.reset_index(drop=True))
+
+
+def test_sliding_window_keeps_bucket_exactly_window_old():
+    window = SlidingTopK(window="2h", bucket="1h", capacity=10)
+    window.update(["AAPL"], [pd.Timestamp("2020-01-01 00:00")])
+    window.update(["NVDA"], [pd.Timestamp("2020-01-01 02:00")])
+    # The 00:00 bucket starts exactly 2h before the newest timestamp.
+    assert window.top()["count"].to_dict() == {"AAPL": 1, "NVDA": 1}
+    window.update(["NVDA"], [pd.Timestamp("2020-01-01 02:00:01")])
+    assert window.top()["count"].to_dict() == {"NVDA": 2}
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        SpaceSaving(capacity=0)
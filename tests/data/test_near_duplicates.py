@@ -0,0 +1,111 @@
+import itertools
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.eda.near_duplicates as near_duplicates
+from src.eda.near_duplicates import (
+    NearDuplicateDetector,
+    lsh_bands,
+    minhash_signatures,
+    normalize_headlines,
+    shingle_hashes,
+)
+
+
+def jaccard(a, b, k=5):
+    sa = {a[i : i + k] for i in range(max(len(a) - k + 1, 1))}
+    sb = {b[i : i + k] for i in range(max(len(b) - k + 1, 1))}
+    return len(sa & sb) / len(sa | sb)
+
+
+@pytest.fixture
+def headlines():
+    rng = np.random.default_rng(0)
+    words = "stocks rally oil falls tech earnings beat bank rates cut fed".split()
+    stories = [" ".join(rng.choice(words, 9)) + f" story {i}" for i in range(40)]
+    rows = []
+    for story in stories:
+        rows.append(story.capitalize())
+        rows.append(story.upper() + "!")
+        rows.append(story + " update")
+    return pd.Series(rows)
+
+
+def test_shingle_hashes_match_python_shingles():
+    texts = ["abcdefg", "xyz", "abcdefh"]
+    hashes, starts = shingle_hashes(texts, k=3)
+    assert starts.tolist() == [0, 5, 6, 11]
+    # Equal shingles hash equally, inside and across texts.
+    assert hashes[0] == hashes[starts[2]]
+    assert len(set(hashes[starts[0] : starts[1]].tolist())) == 5
+
+
+def test_clusters_match_brute_force_jaccard(headlines):
+    detector = NearDuplicateDetector(threshold=0.8)
+    clusters = detector.cluster(headlines)
+    normalized = normalize_headlines(headlines)
+    for i, j in itertools.combinations(range(len(headlines)), 2):
+        similarity = jaccard(normalized[i], normalized[j])
+        if similarity >= 0.9:
+            assert clusters[i] == clusters[j]
+        elif similarity < 0.5:
+            assert clusters[i] != clusters[j]
+    # Case and punctuation variants normalize to the same text.
+    assert (clusters.iloc[0::3].to_numpy() == clusters.iloc[1::3].to_numpy()).all()
+    assert 40 <= clusters.nunique() < 80
+
+
+def test_missing_and_empty_headlines_get_minus_one():
+    clusters = NearDuplicateDetector().cluster(
+        pd.Series(
+            ["Fed cuts rates", None, "!!!", "Fed cuts rates."], index=[5, 6, 7, 8]
+        )
+    )
+    assert clusters.tolist() == [0, -1, -1, 0]
+    assert clusters.index.tolist() == [5, 6, 7, 8]
+
+
+def test_lsh_bands_reach_recall_at_threshold():
+    bands, rows = lsh_bands(128, 0.8)
+    assert bands * rows == 128
+    assert 1 - (1 - 0.8**rows) ** bands >= 0.95
+    with pytest.raises(ValueError):
+        NearDuplicateDetector(threshold=0)
+
+
+def test_link_compares_all_bucket_members():
+    detector = NearDuplicateDetector(threshold=0.8, num_perm=6)
+    detector.bands, detector.rows = 1, 2
+    # All three share the band; only the last two agree on >= 80% of slots.
+    signatures = np.array(
+        [[1, 1, 0, 0, 0, 0], [1, 1, 5, 5, 5, 5], [1, 1, 5, 5, 5, 6]], np.uint32
+    )
+    labels = detector._link(signatures)
+    assert labels[1] == labels[2] != labels[0]
+
+
+def test_minhash_batches_over_texts_and_permutations(monkeypatch):
+    texts = normalize_headlines(pd.Series(["a short one", "x" * 40, "tech rally"]))
+    hashes, starts = shingle_hashes(texts)
+    expected = minhash_signatures(hashes, starts, num_perm=16)
+    # Fewer cells than the longest text has shingles, and than all texts.
+    monkeypatch.setattr(near_duplicates, "_MAX_BATCH_CELLS", 20)
+    np.testing.assert_array_equal(minhash_signatures(hashes, starts, 16), expected)
+
+
+def test_large_cluster_links_in_bounded_memory():
+    story = "apple shares climb after record quarterly earnings beat estimates"
+    texts = pd.Series([f"{story} via outlet {i}" for i in range(3_000)])
+    detector = NearDuplicateDetector()
+    signatures = detector.signatures(normalize_headlines(texts))
+
+    tracemalloc.start()
+    labels = detector._link(signatures)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    assert len(np.unique(labels)) == 1
+    # All within-bucket pairs would take ~3000**2 / 2 * 16 bytes per band.
+    assert peak < 8 * 2**20
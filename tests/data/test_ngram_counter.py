@@ -0,0 +1,65 @@
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from src.eda.ngram_counter import NGramCounter
+from src.nlp.text_utils import TokenizedCorpus
+
+
+def exact_ngrams(texts, groups, n):
+    counts = Counter()
+    corpus = TokenizedCorpus.from_texts(pd.Series(texts))
+    for row, group in enumerate(groups):
+        tokens = corpus.tokens(row)
+        for i in range(len(tokens) - n + 1):
+            counts[(group, " ".join(tokens[i : i + n]))] += 1
+    return counts
+
+
+def make_chunks(seed=0, n_chunks=4, size=300):
+    rng = np.random.default_rng(seed)
+    words = np.array(["fed", "cuts", "rates", "stocks", "rally", "oil", "falls"])
+    for _ in range(n_chunks):
+        texts = [" ".join(rng.choice(words, rng.integers(1, 6))) for _ in range(size)]
+        texts[0] = None
+        yield texts, rng.choice(["AAPL", "TSLA"], size).tolist()
+
+
+def test_chunked_counts_match_exact_counts():
+    counter = NGramCounter(ngram_range=(1, 3))
+    all_texts, all_groups = [], []
+    for texts, groups in make_chunks():
+        counter.update(texts, groups)
+        all_texts += texts
+        all_groups += groups
+
+    top = counter.top(k=1000)
+    for n in (1, 2, 3):
+        expected = exact_ngrams(all_texts, all_groups, n)
+        got = top[top["n"] == n]
+        assert dict(zip(zip(got["group"], got["ngram"]), got["count"])) == expected
+    assert counter.max_pruned_count == 0
+
+
+def test_pruning_bounds_memory_and_keeps_heavy_ngrams():
+    counter = NGramCounter(ngram_range=(2, 2), max_entries=20)
+    for texts, _ in make_chunks(seed=1):
+        counter.update(texts + ["stocks rally hard"] * 50)
+        assert len(counter) <= 20
+    top = counter.top(k=1)
+    assert top["ngram"].tolist() == ["stocks rally"]
+    assert top["n"].tolist() == [2]
+    assert counter.max_pruned_count > 0
+
+
+def test_top_limits_rows_per_group():
+    counter = NGramCounter(ngram_range=(1, 1))
+    counter.update(["a bb cc bb", "bb dd"], ["x", "y"])
+    top = counter.top(k=1)
+    assert top.to_dict("list") == {
+        "group": ["x", "y"],
+        "n": [1, 1],
+        "ngram": ["bb", "bb"],
+        "count": [2, 1],
+    }
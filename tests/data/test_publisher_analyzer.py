@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -95,3 +96,71 @@ def test_run_all(sample_data):
     assert "top_publishers" in results
     assert "domain_counts" in results
     assert "sentiment_by_publisher" in results
+
+
+@pytest.fixture
+def large_sample():
+    rng = np.random.default_rng(3)
+    names = [f"user{i}@site{i % 6}.com" for i in range(30)] + ["Reuters", "Benzinga"]
+    publishers = pd.Series(rng.choice(names, 2000), dtype=object)
+    publishers[rng.random(2000) < 0.05] = None
+    scores = rng.uniform(-1, 1, 2000)
+    scores[rng.random(2000) < 0.1] = np.nan
+    return pd.DataFrame({"publisher": publishers, "sentiment_score": scores})
+
+
+@pytest.mark.parametrize("dtype", [object, "category"])
+def test_single_pass_matches_per_analysis_scans(large_sample, dtype):
+    df = large_sample.astype({"publisher": dtype})
+    results = PublisherAnalyzer(df).run_all(top_n=40, plot=False)
+
+    expected_top = df["publisher"].value_counts().head(40)
+    pd.testing.assert_series_equal(results["top_publishers"], expected_top)
+
+    domains = df["publisher"].astype(object).str.extract(r"@([\w\.-]+)")[0]
+    expected_domains = domains.rename("publisher_domain").value_counts().head(40)
+    pd.testing.assert_series_equal(results["domain_counts"], expected_domains)
+
+    expected_sentiment = (
+        df.groupby("publisher", observed=True)["sentiment_score"]
+        .mean()
+        .sort_values(ascending=False)
+        .head(40)
+    )
+    pd.testing.assert_series_equal(
+        results["sentiment_by_publisher"], expected_sentiment
+    )
+
+
+def test_aggregate_is_computed_once(sample_data):
+    analyzer = PublisherAnalyzer(sample_data)
+    table = analyzer.aggregate()
+    analyzer.run_all(plot=False)
+    assert analyzer.aggregate() is table
+    assert table.loc["alice@example.com", "count"] == 3
+    assert table.loc["carol@test.org", "domain"] == "test.org"
+
+
+def test_heavy_hitters_match_value_counts(sample_data):
+    analyzer = PublisherAnalyzer(sample_data)
+    top = analyzer.analyze_heavy_hitters(top_n=3, capacity=10)
+    expected = sample_data["publisher"].value_counts().head(3)
+    assert top["count"].tolist() == expected.tolist()
+    assert (top["error"] == 0).all()
+    assert "heavy_hitters_publisher" in analyzer.results
+
+
+def test_heavy_hitters_for_tickers_in_window():
+    df = pd.DataFrame(
+        {
+            "publisher": ["a", "b", "a", "c", "a", "b"],
+            "stock": ["AAPL", "NVDA", "NVDA", "NVDA", "AAPL", "TSLA"],
+            "date": pd.date_range("2020-01-01", periods=6, freq="h"),
+        }
+    )
+    analyzer = PublisherAnalyzer(df, copy=False)
+    sketch = analyzer.track_heavy_hitters("stock", window="3h", chunksize=2)
+    # The 02:00 bucket starts exactly 3h before the newest row and is kept.
+    assert sketch.top(5)["count"].to_dict() == {"NVDA": 2, "AAPL": 1, "TSLA": 1}
+    with pytest.raises(ValueError):
+        analyzer.track_heavy_hitters("missing")
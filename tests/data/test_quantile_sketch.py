@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.quantile_sketch import QuantileSketch, sketch_series
+
+
+def test_small_input_matches_describe_exactly():
+    values = pd.Series([3.0, 1.0, np.nan, 7.0, 2.0, 10.0])
+    sketch = sketch_series(values, chunksize=2)
+    assert sketch.exact
+    pd.testing.assert_series_equal(sketch.describe(), values.describe())
+
+
+def test_merged_worker_sketches_have_bounded_rank_error():
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(3, 1, 200_000)
+    parts = [
+        QuantileSketch(seed=i).update(chunk)
+        for i, chunk in enumerate(np.array_split(values, 9))
+    ]
+    sketch = parts[0]
+    for part in parts[1:]:
+        sketch.merge(part)
+
+    assert sum(map(len, sketch._levels)) <= 3 * sketch.k
+    stats = sketch.describe()
+    expected = pd.Series(values).describe()
+    for key in ("count", "mean", "std", "min", "max"):
+        assert stats[key] == pytest.approx(expected[key])
+
+    qs = np.linspace(0.01, 0.99, 99)
+    ranks = np.searchsorted(np.sort(values), sketch.quantile(qs)) / len(values)
+    assert np.abs(ranks - qs).max() < 0.02
+
+
+def test_histogram_counts_sum_to_count():
+    sketch = QuantileSketch(k=16).update(np.arange(1000))
+    counts, edges = sketch.histogram(bins=10)
+    assert counts.sum() == 1000
+    assert edges[0] == 0 and edges[-1] == 999
+    assert np.isnan(QuantileSketch().describe()["mean"])
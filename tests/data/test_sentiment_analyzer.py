@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -79,3 +80,18 @@ def test_correlation_with_prices(sample_df, price_df):
         analyzer.correlation_with_prices(df_scored.drop(columns=["date"]), price_df)
     with pytest.raises(ValueError):
         analyzer.correlation_with_prices(df_scored, price_df.drop(columns=["date"]))
+
+
+def test_lexicon_scores_reuse_corpus_and_track_vader():
+    from nlp.text_utils import TokenizedCorpus
+
+    analyzer = SentimentAnalyzer()
+    texts = pd.Series(["Great profits and strong growth", "Terrible losses", None])
+    corpus = TokenizedCorpus.from_texts(texts)
+    scores = analyzer.lexicon_scores(corpus=corpus)
+    assert scores.iloc[0] > 0.5 and scores.iloc[1] < -0.5 and scores.iloc[2] == 0
+    pd.testing.assert_series_equal(scores, analyzer.lexicon_scores(texts))
+    exact = [analyzer.analyze_text(t) for t in texts.iloc[:2]]
+    assert np.sign(exact).tolist() == np.sign(scores.iloc[:2]).tolist()
+    with pytest.raises(ValueError):
+        analyzer.lexicon_scores()
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+
+from src.eda.spike_detector import StreamingSpikeDetector
+
+
+def test_flags_burst_after_warmup():
+    detector = StreamingSpikeDetector(alpha=0.2, threshold=3.0, min_periods=5)
+    counts = [10, 11, 9, 10, 12, 10, 11, 60, 10, 11]
+    flags = detector.scan(counts)
+    assert flags.tolist() == [False] * 7 + [True, False, False]
+
+
+def test_no_flags_before_min_periods():
+    detector = StreamingSpikeDetector(min_periods=3)
+    assert not detector.scan([1, 100, 1000]).any()
+
+
+def test_clipping_keeps_baseline_robust():
+    counts = [10, 10, 11, 9, 10, 10, 200, 200, 10]
+    clipped = StreamingSpikeDetector(alpha=0.3, clip=True).scan(counts)
+    raw = StreamingSpikeDetector(alpha=0.3, clip=False).scan(counts)
+    assert clipped[6] and clipped[7]
+    assert raw[6] and not raw[7]
+
+
+def test_keys_are_independent_and_match_single_key_runs():
+    rng = np.random.default_rng(0)
+    series = {key: rng.poisson(lam, 50) for key, lam in [("A", 5), ("B", 50)]}
+    series["B"][30] = 200
+
+    keyed = StreamingSpikeDetector()
+    flags = {key: [] for key in series}
+    for t in range(50):
+        step = keyed.update_many(["A", "B"], [series["A"][t], series["B"][t]])
+        flags["A"].append(step[0])
+        flags["B"].append(step[1])
+
+    for key, counts in series.items():
+        np.testing.assert_array_equal(flags[key], StreamingSpikeDetector().scan(counts))
+    assert flags["B"][30]
+
+
+def test_update_many_rejects_repeated_keys():
+    with pytest.raises(ValueError):
+        StreamingSpikeDetector().update_many(["A", "A"], [1, 2])
+
+
+def test_checkpoint_round_trip(tmp_path):
+    counts = [5, 6, 5, 7, 6, 5, 6, 30, 6]
+    detector = StreamingSpikeDetector(alpha=0.25)
+    for key in ["NVDA", "TSLA"]:
+        detector.scan(counts[:5], key=key)
+
+    path = tmp_path / "spikes.npz"
+    detector.save(path)
+    restored = StreamingSpikeDetector.load(path)
+
+    assert restored.state("NVDA") == detector.state("NVDA")
+    np.testing.assert_array_equal(
+        restored.scan(counts[5:], key="TSLA"), detector.scan(counts[5:], key="TSLA")
+    )
+
+
+@pytest.mark.parametrize(
+    "counts, first_spike",
+    [([0] * 5 + [1] * 20 + [5] * 10, 25), ([10] * 6 + [11] * 20, None)],
+)
+def test_recovers_after_constant_warmup(counts, first_spike):
+    detector = StreamingSpikeDetector()
+    flags = detector.scan(counts)
+    spikes = np.flatnonzero(flags)
+    assert (spikes[0] if len(spikes) else None) == first_spike
+    assert not flags[-5:].any()
+    # The baseline follows the new level instead of staying clipped.
+    moved = detector.state(None)["mean"] - counts[0]
+    assert moved > (counts[-1] - counts[0]) / 2
+
+
+def test_checkpoint_keeps_numpy_and_tuple_keys(tmp_path):
+    detector = StreamingSpikeDetector()
+    keys = [np.int64(3), ("AAPL", "h"), "TSLA"]
+    detector.update_many(keys, [1, 2, 3])
+    path = tmp_path / "spikes.npz"
+    detector.save(path)
+    restored = StreamingSpikeDetector.load(path)
+    for key in keys:
+        assert restored.state(key) == detector.state(key)
+    assert restored.min_std == detector.min_std
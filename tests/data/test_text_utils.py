@@ -0,0 +1,186 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+
+from nlp.text_utils import (
+    EntityTagger,
+    TokenizedCorpus,
+    clean_text_series,
+    fit_vectorizer,
+)
+
+ENTITIES = {
+    "AAPL": ["Apple", "Apple Inc"],
+    "ON": ["ON Semiconductor", "onsemi"],
+    "META": ["Meta Platforms", "Facebook"],
+    "GOOGL": ["Alphabet", "Google"],
+}
+
+
+@pytest.fixture
+def tagger():
+    return EntityTagger(ENTITIES)
+
+
+def test_tags_names_aliases_and_tickers(tagger):
+    text = "Apple Inc and $GOOGL rally; Facebook parent Meta Platforms slips"
+    spans = tagger.tag_text(text)
+    assert [(text[s:e], t) for s, e, t in spans] == [
+        ("Apple Inc", "AAPL"),
+        ("GOOGL", "GOOGL"),
+        ("Facebook", "META"),
+        ("Meta Platforms", "META"),
+    ]
+
+
+def test_word_boundaries_and_ticker_case(tagger):
+    assert tagger.tag_text("Pineapple prices turn on, then off") == []
+    assert tagger.tag_text("AAPLX fund and GOOGLX") == []
+    assert [t for *_, t in tagger.tag_text("apple's ON rally")] == ["AAPL", "ON"]
+    assert [t for *_, t in tagger.tag_text("ONSEMI beats")] == ["ON"]
+
+
+def test_matches_brute_force_regex_on_random_texts(tagger):
+    rng = np.random.default_rng(0)
+    vocab = ["Apple", "apple", "Google", "on", "ON", "META", "meta", "stock", "up"]
+    for _ in range(200):
+        text = " ".join(rng.choice(vocab, 6))
+        expected = []
+        for ticker, aliases in ENTITIES.items():
+            for m in re.finditer(rf"\b{re.escape(ticker)}\b", text):
+                expected.append((m.start(), m.end(), ticker))
+            for alias in aliases:
+                pattern = rf"\b{re.escape(alias)}\b"
+                for m in re.finditer(pattern, text, flags=re.IGNORECASE):
+                    expected.append((m.start(), m.end(), ticker))
+        assert tagger.tag_text(text) == sorted(set(expected))
+
+
+def test_batch_tagging_aligns_and_parallel_matches_serial(tagger):
+    texts = pd.Series(
+        ["Apple and Google", None, "Apple and Google", "Nothing here"] * 10,
+        index=range(100, 140),
+    )
+    serial = tagger.tag(texts)
+    assert serial.index.equals(texts.index)
+    assert serial["tickers"].iloc[0] == ["AAPL", "GOOGL"]
+    assert serial["spans"].iloc[0] == [(0, 5, "AAPL"), (10, 16, "GOOGL")]
+    assert serial["tickers"].iloc[1] == [] and serial["spans"].iloc[3] == []
+    parallel = tagger.tag(texts, n_jobs=2, chunksize=1)
+    pd.testing.assert_frame_equal(serial, parallel)
+
+
+@pytest.fixture
+def headlines():
+    return pd.Series(
+        [
+            "Stocks rally as tech earnings beat!",
+            "Oil prices fall on supply worries",
+            None,
+            "Stocks rally as tech earnings beat!",
+            "Tech stocks rally again, see https://x.io",
+            "A",
+        ],
+        index=list("abcdef"),
+    )
+
+
+def test_corpus_interns_tokens_once_per_distinct_text(headlines):
+    corpus = TokenizedCorpus.from_texts(headlines)
+    assert len(corpus) == 6 and corpus.n_documents == 5
+    assert corpus.token_ids.dtype == np.int32
+    assert corpus.tokens(0) == ["stocks", "rally", "as", "tech", "earnings", "beat"]
+    assert corpus.tokens(3) == corpus.tokens(0)
+    assert corpus.tokens(2) == [] and corpus.tokens(5) == []
+    assert len(corpus.vocabulary) == len(set(corpus.vocabulary))
+    expected = clean_text_series(headlines.fillna("")).where(headlines.notna(), "")
+    pd.testing.assert_series_equal(corpus.cleaned_text(), expected)
+
+
+@pytest.mark.parametrize(
+    "vectorizer",
+    [
+        TfidfVectorizer(stop_words="english"),
+        TfidfVectorizer(max_df=0.5, min_df=2, sublinear_tf=True),
+        CountVectorizer(binary=True, min_df=1),
+    ],
+)
+def test_fit_vectorizer_matches_fit_transform(headlines, vectorizer):
+    corpus = TokenizedCorpus.from_texts(headlines)
+    reference = type(vectorizer)(**vectorizer.get_params())
+    expected = reference.fit_transform(corpus.cleaned_text())
+
+    X = fit_vectorizer(vectorizer, corpus)
+    assert vectorizer.vocabulary_ == reference.vocabulary_
+    assert abs(X - expected).max() < 1e-12
+    new = ["tech stocks fall"]
+    assert abs(vectorizer.transform(new) - reference.transform(new)).max() < 1e-12
+
+
+def _fitted_state(vectorizer) -> dict:
+    state = {
+        name: value
+        for name, value in vars(vectorizer).items()
+        if name.endswith("_") and not name.startswith("_")
+    }
+    if isinstance(vectorizer, TfidfVectorizer):
+        state["idf_"] = vectorizer.idf_
+    return state
+
+
+@pytest.mark.parametrize(
+    "vectorizer",
+    [
+        TfidfVectorizer(stop_words="english"),
+        CountVectorizer(min_df=2),
+    ],
+)
+def test_fit_vectorizer_sets_the_same_fitted_state(headlines, vectorizer):
+    # fit_vectorizer writes scikit-learn's fitted attributes itself; this
+    # fails if a scikit-learn upgrade adds or changes any of them.
+    corpus = TokenizedCorpus.from_texts(headlines)
+    reference = type(vectorizer)(**vectorizer.get_params())
+    reference.fit_transform(corpus.cleaned_text())
+    fit_vectorizer(vectorizer, corpus)
+
+    expected, state = _fitted_state(reference), _fitted_state(vectorizer)
+    assert state.keys() == expected.keys()
+    for name, value in expected.items():
+        if isinstance(value, np.ndarray):
+            assert state[name].dtype == value.dtype
+            np.testing.assert_allclose(state[name], value)
+        else:
+            assert state[name] == value
+
+
+@pytest.mark.parametrize(
+    "vectorizer",
+    [
+        CountVectorizer(strip_accents="unicode"),
+        TfidfVectorizer(strip_accents="ascii"),
+        TfidfVectorizer(dtype=np.float32),
+        CountVectorizer(lowercase=True),
+    ],
+)
+def test_fit_vectorizer_honours_text_and_dtype_settings(vectorizer):
+    texts = pd.Series(["Café prices RISE", "cafe prices fall", "Ünïcode test"])
+    # A cleaner that keeps case and accents, so the settings matter.
+    corpus = TokenizedCorpus.from_texts(texts, cleaner=lambda s: s)
+    reference = type(vectorizer)(**vectorizer.get_params())
+    expected = reference.fit_transform(corpus.cleaned_text())
+
+    X = fit_vectorizer(vectorizer, corpus)
+    assert vectorizer.vocabulary_ == reference.vocabulary_
+    assert X.dtype == expected.dtype
+    assert abs(X - expected).max() < 1e-6
+    if isinstance(vectorizer, TfidfVectorizer):
+        assert vectorizer.idf_.dtype == reference.idf_.dtype
+
+
+def test_lexicon_scores_sum_token_values(headlines):
+    corpus = TokenizedCorpus.from_texts(headlines)
+    scores = corpus.lexicon_scores({"rally": 2.0, "fall": -1.5, "worries": -1.0})
+    assert scores.tolist() == [2.0, -2.5, 0.0, 2.0, 2.0, 0.0]
@@ -76,6 +76,17 @@ def test_weekday_distribution(sample_df):
     assert weekdays.sum() == len(sample_df)
 
 
+def test_publication_trends_weekday_ties_keep_first_appearance():
+    dates = ["2025-06-06", "2025-06-02", "2025-06-04", "2025-06-04"]
+    df = pd.DataFrame({"headline": ["A"] * 4, "source": ["S"] * 4, "date": dates})
+    weekday_dist = TextualEDA(df).publication_trends()[1]
+    expected = pd.to_datetime(pd.Series(dates, name="date")).dt.day_name()
+    pd.testing.assert_series_equal(
+        weekday_dist, expected.value_counts(), check_index_type=False
+    )
+    assert list(weekday_dist.index) == ["Wednesday", "Friday", "Monday"]
+
+
 def test_weekday_distribution_with_invalid_dates():
     df = pd.DataFrame({"headline": ["A"], "source": ["S"], "date": ["invalid-date"]})
     eda = TextualEDA(df)
@@ -83,3 +94,62 @@ def test_weekday_distribution_with_invalid_dates():
     eda.publication_trends()
     with pytest.raises(ValueError):
         eda.weekday_distribution()
+
+
+def test_articles_per_publisher_dedupes_syndicated_headlines():
+    df = pd.DataFrame(
+        {
+            "headline": [
+                "Fed holds interest rates steady amid inflation worries",
+                "Fed holds interest rates steady amid inflation worries.",
+                "FED HOLDS INTEREST RATES STEADY AMID INFLATION WORRIES!",
+                "Oil prices jump after supply cut announcement",
+            ],
+            "source": ["Wire", "Blog", "Blog", "Blog"],
+        }
+    )
+    eda = TextualEDA(df)
+    assert eda.articles_per_publisher().to_dict() == {"Blog": 3, "Wire": 1}
+    deduped = eda.articles_per_publisher(dedupe=True)
+    assert deduped.to_dict() == {"Wire": 1, "Blog": 1}
+    assert eda.df["cluster_id"].tolist() == [0, 0, 0, 1]
+
+
+def test_top_ngrams_per_ticker_and_day():
+    df = pd.DataFrame(
+        {
+            "headline": [
+                "Fed cuts rates",
+                "Fed cuts rates again",
+                "Oil falls",
+                "Fed cuts rates",
+            ],
+            "stock": ["AAPL", "AAPL", "TSLA", "TSLA"],
+            "date": ["2025-06-01 10:00", "2025-06-01 18:00", "2025-06-02", None],
+        }
+    )
+    eda = TextualEDA(df)
+    overall = eda.top_ngrams(ngram_range=(2, 3), k=1, chunksize=2)
+    assert overall["ngram"].tolist() == ["fed cuts", "fed cuts rates"]
+    assert overall["count"].tolist() == [3, 3]
+
+    by_ticker = eda.top_ngrams(ngram_range=(1, 1), k=1, by="ticker")
+    assert by_ticker.set_index("group")["count"].to_dict() == {"AAPL": 2, "TSLA": 1}
+
+    by_day = eda.top_ngrams(ngram_range=(2, 3), k=5, by="day")
+    assert by_day["group"].nunique() == 2
+    first_day = by_day[by_day["group"] == pd.Timestamp("2025-06-01", tz="UTC")]
+    trigrams = first_day[first_day["n"] == 3]
+    assert trigrams.iloc[0][["ngram", "count"]].tolist() == ["fed cuts rates", 2]
+
+
+def test_length_and_score_stats_use_sketch_without_new_columns(sample_df):
+    df = sample_df.assign(sentiment_score=[0.5, -0.25, 0.0])
+    eda = TextualEDA(df)
+    stats = eda.headline_length_stats(chunksize=2)
+    lengths = df["headline"].str.len().rename("headline_length")
+    pd.testing.assert_series_equal(stats, lengths.describe().astype(float))
+    assert "headline_length" not in eda.df.columns
+
+    scores = eda.sentiment_score_stats(chunksize=2)
+    pd.testing.assert_series_equal(scores, df["sentiment_score"].describe())
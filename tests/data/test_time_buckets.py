@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.eda.time_buckets import WEEKDAY_NAMES, TimeBuckets
+
+
+@pytest.fixture
+def dates():
+    return pd.Series(
+        pd.to_datetime(
+            [
+                "1969-12-31 23:30",
+                "2024-02-28 09:15",
+                None,
+                "2024-03-01 09:59",
+                "2024-03-01 17:00",
+            ]
+        ),
+        name="date",
+    )
+
+
+def test_codes_match_pandas_accessors(dates):
+    buckets = TimeBuckets(dates)
+    valid = dates.dropna()
+    assert len(buckets) == 4
+    np.testing.assert_array_equal(buckets.weekday, valid.dt.weekday)
+    np.testing.assert_array_equal(buckets.hour, valid.dt.hour)
+
+    counts = buckets.counts("day")
+    expected = valid.dt.normalize().value_counts().sort_index()
+    pd.testing.assert_series_equal(counts, expected, check_index_type=False)
+    assert counts.index.name == "date"
+    assert (
+        len(buckets.counts("day", fill=True))
+        == (valid.max().normalize() - valid.min().normalize()).days + 1
+    )
+
+
+def test_weekday_and_hour_counts(dates):
+    buckets = TimeBuckets(dates)
+    weekdays = buckets.counts("weekday", fill=True)
+    assert list(weekdays.index) == list(WEEKDAY_NAMES)
+    assert weekdays.to_dict() == {
+        "Monday": 0,
+        "Tuesday": 0,
+        "Wednesday": 2,
+        "Thursday": 0,
+        "Friday": 2,
+        "Saturday": 0,
+        "Sunday": 0,
+    }
+    assert buckets.counts("hour").to_dict() == {9: 2, 17: 1, 23: 1}
+    with pytest.raises(ValueError):
+        buckets.counts("minute")
+
+
+def test_means_ignore_missing_values_and_keep_local_time(dates):
+    aware = dates.dt.tz_localize("America/New_York")
+    buckets = TimeBuckets(aware)
+    means = buckets.means([1.0, 2.0, 5.0, np.nan, 4.0], "day")
+    assert means.to_dict() == {
+        pd.Timestamp("1969-12-31"): 1.0,
+        pd.Timestamp("2024-02-28"): 2.0,
+        pd.Timestamp("2024-03-01"): 4.0,
+    }
+    with pytest.raises(TypeError):
+        TimeBuckets(dates.astype(str))
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 import pytest
 
+from src.eda.spike_detector import StreamingSpikeDetector
 from src.eda.time_series_analyzer import TimeSeriesAnalyzer
 
 
@@ -71,3 +73,154 @@ def test_plot_spikes_runs_without_error():
     df = pd.DataFrame({"date": dates.repeat(counts), "val": range(sum(counts))})
     tsa = TimeSeriesAnalyzer(df)
     tsa.plot_spikes()
+
+
+@pytest.mark.parametrize("freq", ["h", "3h", "D", "2D", "W", "ME", "MS"])
+def test_count_cube_rollup_matches_resample(freq):
+    rng = np.random.default_rng(0)
+    stamps = pd.Timestamp("2025-01-01 05:17") + pd.to_timedelta(
+        rng.integers(0, 90 * 24 * 60, 500), unit="min"
+    )
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": stamps}))
+    expected = tsa.df.resample(freq).size()
+    pd.testing.assert_series_equal(tsa.get_publication_frequency(freq), expected)
+
+
+@pytest.mark.parametrize("freq", ["h", "D", "W", "ME", "B"])
+def test_rollup_with_unaligned_cube_matches_resample(freq):
+    rng = np.random.default_rng(2)
+    # Starts at midnight on a Monday and a month, inside a 7min cube bin
+    # that begins at 23:54 on Sunday, December 31st.
+    minutes = np.r_[0, rng.integers(0, 60 * 24 * 60, 800)]
+    stamps = pd.Timestamp("2024-01-01") + pd.to_timedelta(minutes, unit="min")
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": stamps}), cube_freq="7min")
+    expected = tsa.df.resample(freq).size()
+    pd.testing.assert_series_equal(tsa.get_publication_frequency(freq), expected)
+
+
+@pytest.mark.parametrize("freq", ["D", "W", "h"])
+def test_rollup_in_half_hour_offset_timezone_matches_resample(freq):
+    # Local midnight in +05:30 is 18:30 UTC, between hourly cube edges.
+    stamps = pd.date_range("2020-01-01", periods=300, freq="17min", tz="Asia/Kolkata")
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": stamps}))
+    expected = tsa.df.resample(freq).size()
+    daily = tsa.get_publication_frequency(freq)
+    pd.testing.assert_series_equal(daily, expected)
+    assert daily.index[0] >= pd.Timestamp("2020-01-01", tz="Asia/Kolkata")
+    grouped = tsa._time_codes(freq)[0]
+    assert (
+        np.bincount(grouped).tolist()
+        == expected[expected > 0].reindex(expected.index, fill_value=0).tolist()
+    )
+
+
+def test_count_cube_handles_timezones_and_fine_frequencies():
+    stamps = pd.date_range("2025-03-01", periods=200, freq="37min", tz="US/Eastern")
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": stamps}))
+
+    cube = tsa.count_cube()
+    assert cube.dtype == np.int32
+    assert cube.sum() == 200
+    pd.testing.assert_series_equal(
+        tsa.get_publication_frequency("D"), tsa.df.resample("D").size()
+    )
+    # Finer than the cube: falls back to the raw rows.
+    pd.testing.assert_series_equal(
+        tsa.get_publication_frequency("15min"), tsa.df.resample("15min").size()
+    )
+
+
+def test_publication_frequency_is_cached():
+    dates = pd.date_range(start="2025-06-01", periods=10)
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": dates}))
+    first = tsa.get_publication_frequency("W")
+    first.iloc[0] = -1
+    assert tsa.get_publication_frequency("W").iloc[0] >= 0
+    assert "W" in tsa._frequency_cache
+
+
+@pytest.fixture
+def ticker_news():
+    rng = np.random.default_rng(1)
+    n = 600
+    stamps = pd.Timestamp("2025-01-01") + pd.to_timedelta(
+        rng.integers(0, 60 * 24, n), unit="h"
+    )
+    tickers = rng.choice(["AAPL", "MSFT", "NVDA", None], n, p=[0.4, 0.3, 0.2, 0.1])
+    df = pd.DataFrame({"date": stamps, "stock": tickers})
+    burst = pd.DataFrame({"date": [pd.Timestamp("2025-02-10 12:00")] * 40})
+    return pd.concat([df, burst.assign(stock="NVDA")], ignore_index=True)
+
+
+@pytest.mark.parametrize("freq", ["D", "W", "6h"])
+def test_grouped_frequency_matches_per_group_resample(ticker_news, freq):
+    tsa = TimeSeriesAnalyzer(ticker_news)
+    grouped = tsa.get_grouped_frequency("stock", freq)
+
+    assert list(grouped.groups) == ["AAPL", "MSFT", "NVDA"]
+    assert grouped.matrix.sum() == ticker_news["stock"].notna().sum()
+    for ticker in grouped.groups:
+        expected = tsa.df[tsa.df["stock"] == ticker].resample(freq).size()
+        series = grouped.series(ticker)
+        pd.testing.assert_series_equal(
+            series[series.index.isin(expected.index)],
+            expected,
+            check_names=False,
+            check_freq=False,
+        )
+
+
+def test_grouped_sparse_matches_dense(ticker_news):
+    tsa = TimeSeriesAnalyzer(ticker_news)
+    dense = tsa.get_grouped_frequency("stock", "D")
+    sparse = tsa.get_grouped_frequency("stock", "D", sparse=True)
+    assert sparse.is_sparse
+    np.testing.assert_array_equal(sparse.matrix.toarray(), dense.matrix)
+    pd.testing.assert_frame_equal(sparse.to_frame(), dense.to_frame())
+
+
+def test_grouped_spikes_match_per_group_detection(ticker_news):
+    tsa = TimeSeriesAnalyzer(ticker_news)
+    spikes = tsa.detect_grouped_spikes("stock", threshold=2.0, sparse=True)
+
+    assert ((spikes["stock"] == "NVDA") & (spikes["date"] == "2025-02-10")).any()
+    for ticker in ["AAPL", "MSFT", "NVDA"]:
+        single = TimeSeriesAnalyzer(ticker_news[ticker_news["stock"] == ticker])
+        expected = single.detect_spikes(threshold=2.0)
+        got = spikes[spikes["stock"] == ticker]
+        assert got["date"].tolist() == expected["date"].tolist()
+        assert got["article_count"].tolist() == expected["article_count"].tolist()
+
+
+def test_grouped_frequency_without_copy(ticker_news):
+    with pytest.raises(KeyError, match="group_cols"):
+        TimeSeriesAnalyzer(ticker_news, copy=False).get_grouped_frequency("missing")
+    tsa = TimeSeriesAnalyzer(ticker_news, copy=False)
+    assert tsa.get_grouped_frequency("stock").matrix.shape[0] == 3
+    tsa.plot_grouped_trend("stock", ["NVDA", "AAPL"])
+
+
+def test_detect_spikes_ewma_delegates_to_streaming_detector(ticker_news):
+    tsa = TimeSeriesAnalyzer(ticker_news)
+    spikes = tsa.detect_spikes(method="ewma", alpha=0.2)
+    series = tsa.get_publication_frequency("D")
+    flags = StreamingSpikeDetector(alpha=0.2).scan(series.to_numpy())
+
+    assert spikes["date"].tolist() == series.index[flags].tolist()
+    assert pd.Timestamp("2025-02-10") in spikes["date"].values
+
+
+def test_grouped_ewma_spikes_match_single_group_runs(ticker_news):
+    tsa = TimeSeriesAnalyzer(ticker_news)
+    spikes = tsa.detect_grouped_spikes("stock", method="ewma", sparse=True)
+    for ticker in ["AAPL", "MSFT", "NVDA"]:
+        single = TimeSeriesAnalyzer(ticker_news[ticker_news["stock"] == ticker])
+        expected = single.detect_spikes(method="ewma")
+        got = spikes[spikes["stock"] == ticker]
+        assert got["date"].tolist() == expected["date"].tolist()
+
+
+def test_detect_spikes_unknown_method():
+    tsa = TimeSeriesAnalyzer(pd.DataFrame({"date": ["2025-06-01"]}))
+    with pytest.raises(ValueError):
+        tsa.detect_spikes(method="median")
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 import pytest
+from sklearn.decomposition import LatentDirichletAllocation
 
 from eda.topic_modeler import TextCleaner, TopicModeler  # adjust import as needed
 
@@ -89,3 +91,180 @@ def test_empty_and_missing_text_column():
 def test_text_cleaner_fit_returns_self():
     cleaner = TextCleaner()
     assert cleaner.fit(None) is cleaner
+
+
+def test_text_cleaner_parallel_matches_serial():
+    raw_text = pd.Series(
+        ["Stocks UP! see https://x.io/a", None, "Stocks UP! see https://x.io/a"]
+        + [f"Headline #{i}, again" for i in range(20)]
+    )
+    serial = TextCleaner().transform(raw_text)
+    parallel = TextCleaner(n_jobs=2, chunksize=5).transform(raw_text)
+    pd.testing.assert_series_equal(serial, parallel)
+    assert serial.iloc[0] == serial.iloc[2] == "stocks up see"
+    assert serial.iloc[1] == ""
+    assert TextCleaner(n_jobs=2).get_params()["n_jobs"] == 2
+
+
+def test_fit_and_plot_share_one_transform(monkeypatch):
+    data = pd.DataFrame(
+        {
+            "headline": [
+                "Economy is growing fast",
+                "Economy growth slows",
+                "Sports events postponed due to weather",
+                "Sports events resume",
+            ]
+        }
+    )
+    modeler = TopicModeler(data, text_col="headline", n_topics=2)
+    calls = []
+    cleaner = modeler.pipeline.named_steps["cleaner"]
+    original = cleaner.transform
+    monkeypatch.setattr(cleaner, "transform", lambda X: calls.append(1) or original(X))
+    modeler.fit()
+    tfidf = modeler.tfidf_matrix()
+    modeler.plot_topic_distribution()
+    labels = modeler.assign_topics()
+
+    assert len(calls) == 1
+    assert modeler.tfidf_matrix() is tfidf
+    assert labels.str.startswith("Topic ").all()
+
+
+def _write_archive(path):
+    rng = np.random.default_rng(0)
+    markets = ["stocks", "rally", "earnings", "shares", "market", "profit"]
+    sports = ["football", "match", "league", "goal", "coach", "season"]
+    rows = [
+        " ".join(rng.choice(words, 5)).capitalize() + "!"
+        for _ in range(60)
+        for words in (markets, sports)
+    ]
+    pd.DataFrame({"headline": rows, "other": range(len(rows))}).to_csv(
+        path, index=False
+    )
+    return set(markets + sports)
+
+
+def test_fit_streaming_recovers_keywords_from_hash_vocab(tmp_path):
+    csv_path = tmp_path / "archive.csv"
+    vocabulary = _write_archive(csv_path)
+    checkpoint = tmp_path / "lda.joblib"
+
+    modeler = TopicModeler(pd.DataFrame({"headline": []}), n_topics=2)
+    modeler.fit_streaming(
+        csv_path, chunksize=20, n_features=2**12, checkpoint_path=checkpoint
+    )
+    keywords = modeler.get_keywords()
+    assert len(keywords) == 2
+    for words in keywords.values():
+        assert 0 < len(words) <= 10
+        assert set(words) <= vocabulary
+    assert checkpoint.exists()
+
+
+def test_fit_streaming_resumes_from_checkpoint(tmp_path, monkeypatch):
+    csv_path = tmp_path / "archive.csv"
+    _write_archive(csv_path)
+    checkpoint = tmp_path / "lda.joblib"
+    kwargs = dict(chunksize=20, n_features=2**12, checkpoint_path=checkpoint)
+    first = TopicModeler(pd.DataFrame({"headline": []}), n_topics=2)
+    first.fit_streaming(csv_path, **kwargs)
+
+    resumed = TopicModeler(pd.DataFrame({"headline": []}), n_topics=2)
+    calls = []
+    monkeypatch.setattr(
+        LatentDirichletAllocation, "partial_fit", lambda *a, **k: calls.append(1)
+    )
+    resumed.fit_streaming(csv_path, resume=True, **kwargs)
+    assert calls == []
+    assert resumed.get_keywords() == first.get_keywords()
+
+
+def test_fit_streaming_model_labels_documents():
+    frames = [
+        pd.DataFrame({"headline": ["Stocks rally on earnings", "League match ends"]})
+    ] * 3
+    modeler = TopicModeler(frames[0], n_topics=2)
+    modeler.fit_streaming(frames, n_features=2**10)
+    assert modeler.assign_topics().str.startswith("Topic ").all()
+
+
+def test_select_n_topics_scores_each_candidate(tmp_path):
+    csv_path = tmp_path / "archive.csv"
+    _write_archive(csv_path)
+    modeler = TopicModeler(pd.read_csv(csv_path), n_topics=2)
+
+    parallel = modeler.select_n_topics([2, 3, 4], n_jobs=2, workdir=tmp_path)
+    serial = modeler.select_n_topics([2, 3, 4], n_jobs=1)
+
+    assert parallel.index.tolist() == [2, 3, 4]
+    assert list(parallel.columns) == ["perplexity", "coherence", "fit_time"]
+    assert np.isfinite(parallel.to_numpy()).all()
+    assert (parallel["coherence"] <= 0).all()
+    pd.testing.assert_series_equal(parallel["perplexity"], serial["perplexity"])
+    assert list(tmp_path.iterdir()) == [csv_path]
+
+
+@pytest.mark.parametrize("engine", ["nmf", "minibatch_nmf"])
+def test_nmf_engines_keep_interface(engine, tmp_path):
+    csv_path = tmp_path / "archive.csv"
+    vocabulary = _write_archive(csv_path)
+    modeler = TopicModeler(pd.read_csv(csv_path), n_topics=2, engine=engine)
+    modeler.fit()
+
+    keywords = modeler.get_keywords()
+    assert len(keywords) == 2
+    assert all(set(words) <= vocabulary for words in keywords.values())
+    modeler.assign_topics()
+    assert modeler.get_labeled_df()["Predicted Topic"].str.startswith("Topic ").all()
+    assert modeler.lda_model is modeler.model
+
+
+def test_engine_validation_and_streaming_minibatch_nmf():
+    with pytest.raises(ValueError, match="Unknown engine"):
+        TopicModeler(pd.DataFrame({"headline": []}), engine="svd")
+    frames = [pd.DataFrame({"headline": ["Stocks rally", "League match ends"]})] * 2
+    with pytest.raises(ValueError):
+        TopicModeler(frames[0], n_topics=2, engine="nmf").fit_streaming(frames)
+    modeler = TopicModeler(frames[0], n_topics=2, engine="minibatch_nmf")
+    assert len(modeler.fit_streaming(frames, n_features=2**10).get_keywords()) == 2
+
+
+def test_save_load_round_trip_with_mmap(tmp_path):
+    csv_path = tmp_path / "archive.csv"
+    _write_archive(csv_path)
+    df = pd.read_csv(csv_path)
+    modeler = TopicModeler(df, n_topics=2).fit()
+    path = tmp_path / "topics.joblib"
+    modeler.save(path)
+
+    loaded = TopicModeler.load(path)
+    assert isinstance(loaded.model.components_, np.memmap)
+    assert loaded.get_keywords() == modeler.get_keywords()
+    batch = df["headline"].iloc[:15]
+    pd.testing.assert_series_equal(
+        loaded.predict_topics(batch), modeler.predict_topics(batch)
+    )
+    pd.testing.assert_frame_equal(
+        loaded.predict_topics(batch, return_proba=True),
+        pd.DataFrame(
+            modeler.document_topics()[:15],
+            index=batch.index,
+            columns=["Topic 1", "Topic 2"],
+        ),
+    )
+
+
+def test_predict_topics_has_no_side_effects():
+    data = pd.DataFrame(
+        {"headline": ["Economy grows", "Economy slows", "Match won", "Match lost"]}
+    )
+    modeler = TopicModeler(data, n_topics=2).fit()
+    labels = modeler.predict_topics(["Economy grows again", None])
+    assert labels.str.startswith("Topic ").all()
+    assert "Predicted Topic" not in modeler.get_labeled_df().columns
+    assert modeler._doc_topics is None
+    with pytest.raises(ValueError):
+        TopicModeler(data).save("unused.joblib")
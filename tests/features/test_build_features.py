@@ -0,0 +1,154 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from features.build_features import DailyFeatureStore, partition_digests
+
+
+@pytest.fixture
+def prices():
+    days = pd.bdate_range("2024-01-01", periods=30)
+    rng = np.random.default_rng(0)
+    frames = [
+        pd.DataFrame(
+            {
+                "stock": ticker,
+                "Date": days,
+                "Close": 100 * np.cumprod(1 + rng.normal(0, 0.01, len(days))),
+            }
+        )
+        for ticker in ("AAPL", "TSLA", "NVDA")
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+@pytest.fixture
+def news():
+    return pd.DataFrame(
+        {
+            "stock": ["AAPL", "AAPL", "AAPL", "TSLA"],
+            "date": pd.to_datetime(
+                [
+                    "2024-01-02 09:00",
+                    "2024-01-02 15:00",
+                    "2024-01-06 10:00",  # Saturday -> Monday 2024-01-08
+                    "2024-01-03 11:00",
+                ],
+                utc=True,
+            ),
+            "sentiment_score": [0.5, -0.1, 0.8, -0.4],
+        }
+    )
+
+
+def test_features_per_ticker_and_day(tmp_path, news, prices):
+    store = DailyFeatureStore(tmp_path, horizons=(1,), lags=(1,))
+    report = store.update(news, prices)
+    assert report == {
+        "recomputed": ["AAPL", "NVDA", "TSLA"],
+        "unchanged": [],
+        "removed": [],
+    }
+
+    aapl = store.load(["AAPL"]).set_index("date")
+    assert len(aapl) == 30
+    jan2 = aapl.loc[pd.Timestamp("2024-01-02", tz="UTC")]
+    assert jan2["sentiment_mean"] == pytest.approx(0.2)
+    assert jan2["sentiment_count"] == 2
+    assert jan2["sentiment_std"] == pytest.approx(np.std([0.5, -0.1], ddof=1))
+    assert aapl.loc[pd.Timestamp("2024-01-08", tz="UTC"), "sentiment_count"] == 1
+    assert aapl["sentiment_count"].sum() == 3
+
+    close = aapl["close"]
+    np.testing.assert_allclose(
+        aapl["forward_return_1d"].iloc[:-1], (close.shift(-1) / close - 1).iloc[:-1]
+    )
+    assert np.isnan(aapl["forward_return_1d"].iloc[-1])
+    np.testing.assert_allclose(
+        aapl["return_1d_lag1"].iloc[2:], aapl["return_1d"].shift(1).iloc[2:]
+    )
+    assert aapl["momentum_rsi"].notna().sum() > 0
+
+    window = store.load(start="2024-01-03", end="2024-01-05", columns=["close"])
+    assert list(window.columns) == ["ticker", "date", "close"]
+    assert len(window) == 3 * 2
+
+
+def test_update_recomputes_only_changed_partitions(tmp_path, news, prices):
+    store = DailyFeatureStore(tmp_path)
+    store.update(news, prices)
+    mtime = {t: store.partition_path(t) for t in ("AAPL", "NVDA", "TSLA")}
+    mtime = {t: os.stat(p).st_mtime_ns for t, p in mtime.items()}
+
+    # Same content in a different row order: nothing to do.
+    report = store.update(news.iloc[::-1], prices.sample(frac=1, random_state=0))
+    assert report["recomputed"] == []
+
+    changed = news.copy()
+    changed.loc[3, "sentiment_score"] = 0.9
+    report = store.update(changed, prices[prices["stock"] != "NVDA"])
+    assert report == {
+        "recomputed": ["TSLA"],
+        "unchanged": ["AAPL"],
+        "removed": ["NVDA"],
+    }
+    assert sorted(store.manifest()) == ["AAPL", "TSLA"]
+    assert store.load()["ticker"].unique().tolist() == ["AAPL", "TSLA"]
+    assert store.load(["TSLA"])["sentiment_mean"].max() == pytest.approx(0.9)
+    assert os.stat(store.partition_path("AAPL")).st_mtime_ns == mtime["AAPL"]
+
+    # A different configuration invalidates every partition.
+    report = DailyFeatureStore(tmp_path, horizons=(1, 10)).update(changed, prices)
+    assert report["recomputed"] == ["AAPL", "NVDA", "TSLA"]
+
+
+def test_partition_digests_ignore_row_order():
+    frame = pd.DataFrame({"k": ["a", "b", "a"], "v": [1, 2, 3]})
+    digests = partition_digests(frame, "k", ["k", "v"])
+    assert digests == partition_digests(frame.iloc[[2, 1, 0]], "k", ["k", "v"])
+    assert (
+        digests["b"]
+        != partition_digests(frame.assign(v=[1, 5, 3]), "k", ["k", "v"])["b"]
+    )
+
+
+def test_news_after_the_close_counts_towards_the_next_session(tmp_path, prices):
+    news = pd.DataFrame(
+        {
+            "stock": "AAPL",
+            "date": pd.to_datetime(
+                [
+                    "2023-12-29 15:00",  # before the first price row: dropped
+                    "2024-01-02 20:59",  # 15:59 New York -> 2024-01-02
+                    "2024-01-02 21:00",  # 16:00 New York -> 2024-01-03
+                    "2024-01-03 02:00",  # 21:00 New York on 01-02 -> 01-03
+                ],
+                utc=True,
+            ),
+            "sentiment_score": [1.0, 0.2, 0.4, 0.6],
+        }
+    )
+    store = DailyFeatureStore(tmp_path)
+    store.update(news, prices)
+    counts = store.load(["AAPL"]).set_index("date")["sentiment_count"]
+    assert counts[pd.Timestamp("2024-01-01", tz="UTC")] == 0
+    assert counts[pd.Timestamp("2024-01-02", tz="UTC")] == 1
+    assert counts[pd.Timestamp("2024-01-03", tz="UTC")] == 2
+    assert counts.sum() == 3
+
+
+def test_removal_handles_path_like_tickers_and_leftovers(tmp_path, prices):
+    prices = prices.replace({"stock": {"TSLA": "BRK/B"}})
+    store = DailyFeatureStore(tmp_path)
+    no_news = pd.DataFrame(columns=["stock", "date", "sentiment_score"])
+    store.update(no_news, prices)
+    path = store.partition_path("BRK/B")
+    assert os.path.dirname(os.path.dirname(path)) == str(tmp_path)
+    assert store.load(["BRK/B"])["ticker"].unique().tolist() == ["BRK/B"]
+
+    open(f"{path}.tmp", "w").close()  # left behind by an interrupted write
+    report = store.update(no_news, prices[prices["stock"] != "BRK/B"])
+    assert report["removed"] == ["BRK/B"]
+    assert not os.path.exists(os.path.dirname(path))
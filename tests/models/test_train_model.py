@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import LogisticRegression, SGDRegressor
+
+from models.train_model import WalkForwardTrainer, walk_forward_splits, warm_start_mode
+
+
+@pytest.fixture
+def features():
+    rng = np.random.default_rng(0)
+    days = pd.bdate_range("2024-01-01", periods=120, tz="UTC")
+    frame = pd.DataFrame(
+        {
+            "ticker": np.repeat(["AAPL", "TSLA"], len(days)),
+            "date": np.tile(days, 2),
+            "sentiment_mean": rng.normal(0, 0.3, 2 * len(days)),
+            "return_1d": rng.normal(0, 0.01, 2 * len(days)),
+        }
+    )
+    frame.loc[::7, "sentiment_mean"] = np.nan  # days without news
+    noise = rng.normal(0, 0.002, len(frame))
+    frame["forward_return_1d"] = 0.02 * frame["sentiment_mean"].fillna(0) + noise
+    frame.loc[frame["date"] == days[-1], "forward_return_1d"] = np.nan
+    return frame
+
+
+def test_walk_forward_splits_expand_and_respect_gap():
+    dates = np.repeat(np.arange(12), 2)
+    splits = walk_forward_splits(dates, n_splits=3, gap=2)
+    assert len(splits) == 3
+    previous = 0
+    for train, test in splits:
+        assert dates[train].max() + 2 < dates[test].min()
+        assert set(train).isdisjoint(test)
+        assert len(train) > previous
+        previous = len(train)
+    assert [dates[test].min() for _, test in splits] == [3, 6, 9]
+    assert splits[-1][1].max() == len(dates) - 1
+    with pytest.raises(ValueError):
+        walk_forward_splits(dates, n_splits=20)
+
+
+def test_warm_start_mode():
+    assert warm_start_mode(SGDRegressor()) == "partial_fit"
+    assert warm_start_mode(LogisticRegression()) == "warm_start"
+    assert warm_start_mode(GradientBoostingRegressor()) is None
+
+
+def test_run_scores_folds_and_caches_artifacts(tmp_path, features):
+    trainer = WalkForwardTrainer(
+        features=["sentiment_mean", "return_1d"], n_jobs=2, cache_dir=tmp_path
+    )
+    result = trainer.run(features)
+    folds = result["folds"]
+    assert list(folds.index) == [0, 1, 2, 3, 4]
+    assert {"fit_time", "predict_time", "mae", "rmse", "r2"} <= set(folds.columns)
+    assert (folds["r2"] > 0.5).all()
+    assert not folds["warm"].any()  # Ridge refits every fold
+    assert result["predictions"].index.isin(features.index).all()
+    assert len(result["predictions"]) == folds["n_test"].sum()
+    assert not result["cached"]
+
+    again = trainer.run(features.sample(frac=1, random_state=0))
+    assert again["cached"]
+    pd.testing.assert_frame_equal(again["folds"], folds)
+
+    changed = features.assign(return_1d=features["return_1d"] * 2)
+    assert trainer.run(changed)["key"] != result["key"]
+
+
+def test_warm_chain_and_classification(features):
+    trainer = WalkForwardTrainer(
+        estimator=LogisticRegression(max_iter=1000),
+        task="classification",
+        n_splits=4,
+        n_jobs=1,
+    )
+    result = trainer.run(features)
+    assert result["folds"]["warm"].tolist() == [False, True, True, True]
+    assert (result["folds"]["accuracy"] > 0.7).all()
+    assert set(result["predictions"].unique()) <= {0, 1}
+    assert len(result["fold_models"]) == 4
+
+    sgd = WalkForwardTrainer(SGDRegressor(random_state=0), n_splits=3, n_jobs=1)
+    assert sgd.run(features)["folds"]["warm"].tolist() == [False, True, True]
+
+    with pytest.raises(ValueError):
+        WalkForwardTrainer(LogisticRegression(), task="regression")
+
+
+def test_cache_key_depends_on_warm_chain_layout(tmp_path, features):
+    def trainer(n_jobs):
+        return WalkForwardTrainer(
+            LogisticRegression(max_iter=1000),
+            task="classification",
+            n_jobs=n_jobs,
+            cache_dir=tmp_path,
+        )
+
+    warm = trainer(1).run(features)
+    assert warm["folds"]["warm"].tolist() == [False, True, True, True, True]
+    cold = trainer(5).run(features)
+    assert not cold["cached"]
+    assert not cold["folds"]["warm"].any()
+    assert cold["key"] != warm["key"]
+    # Cold folds do not depend on the worker count.
+    assert (
+        WalkForwardTrainer(n_jobs=1).chains() == WalkForwardTrainer(n_jobs=2).chains()
+    )
+
+
+def test_partial_fit_chain_starts_with_full_fit(features):
+    def run(n_jobs):
+        trainer = WalkForwardTrainer(
+            SGDRegressor(random_state=0), n_splits=3, n_jobs=n_jobs
+        )
+        return trainer.run(features)
+
+    cold = run(3)
+    assert not cold["folds"]["warm"].any()
+    # A full fit runs several epochs; a single partial_fit pass runs one.
+    assert all(model.n_iter_ > 1 for model in cold["fold_models"])
+
+    warm = run(1)
+    assert warm["folds"]["warm"].tolist() == [False, True, True]
+    assert warm["folds"]["r2"].iloc[0] == pytest.approx(cold["folds"]["r2"].iloc[0])
+    assert warm["fold_models"][0].n_iter_ > 1
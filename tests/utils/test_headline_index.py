@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from eda.textual_eda import TextualEDA
+from utils.headline_index import (
+    HeadlineIndex,
+    build_headline_index,
+    decode_varints,
+    encode_varints,
+    intersect,
+    union,
+)
+
+
+@pytest.fixture
+def news():
+    rng = np.random.default_rng(0)
+    n = 2_000
+    words = np.array(
+        ["downgrade", "upgrade", "earnings", "beat", "miss", "Price", "target"]
+    )
+    headlines = [" ".join(rng.choice(words, 4)) + "!" for _ in range(n)]
+    headlines[5] = None
+    dates = pd.Timestamp("2020-01-01", tz="UTC") + pd.to_timedelta(
+        rng.integers(0, 90 * 24, n), unit="h"
+    )
+    return pd.DataFrame(
+        {
+            "headline": headlines,
+            "stock": rng.choice(["TSLA", "AAPL", "NVDA"], n),
+            "date": dates,
+            "source": rng.choice(["a", "b"], n),
+        }
+    )
+
+
+def contains(news, word):
+    return news["headline"].str.contains(rf"\b{word}\b", case=False, na=False)
+
+
+def test_varint_round_trip():
+    values = np.array([0, 1, 127, 128, 300, 2**32, 2**63 - 1], dtype=np.uint64)
+    encoded = encode_varints(values)
+    assert encoded.dtype == np.uint8 and len(encoded) < values.nbytes
+    np.testing.assert_array_equal(decode_varints(encoded), values)
+
+
+def test_queries_match_full_scan(news, tmp_path):
+    build_headline_index(news, tmp_path / "index")
+    index = HeadlineIndex(tmp_path / "index")
+
+    expected = np.flatnonzero(contains(news, "downgrade"))
+    np.testing.assert_array_equal(index.term("Downgrade"), expected)
+    np.testing.assert_array_equal(
+        index.term("price"), np.flatnonzero(contains(news, "price"))
+    )
+    assert len(index.term("unknown")) == 0
+
+    month = news["date"].between(
+        pd.Timestamp("2020-02-01", tz="UTC"),
+        pd.Timestamp("2020-03-01", tz="UTC"),
+        inclusive="left",
+    )
+    mask = contains(news, "downgrade") & (news["stock"] == "TSLA") & month
+    rows = index.search(
+        all_terms=["downgrade"], tickers=["TSLA"], start="2020-02", end="2020-03"
+    )
+    np.testing.assert_array_equal(rows, np.flatnonzero(mask))
+
+    either = contains(news, "upgrade") | contains(news, "downgrade")
+    rows = index.search(any_terms=["upgrade", "downgrade"], all_terms=["miss beat"])
+    mask = either & contains(news, "miss") & contains(news, "beat")
+    np.testing.assert_array_equal(rows, np.flatnonzero(mask))
+
+    combined = union(
+        index.ticker("AAPL"), intersect(index.term("beat"), index.ticker("NVDA"))
+    )
+    mask = (news["stock"] == "AAPL") | (
+        contains(news, "beat") & (news["stock"] == "NVDA")
+    )
+    np.testing.assert_array_equal(combined, np.flatnonzero(mask))
+    assert len(index.search()) == len(news)
+
+
+def test_results_feed_analyzers(news, tmp_path):
+    index = build_headline_index(news, tmp_path)
+    rows = index.search(all_terms=["downgrade"], tickers=["TSLA"])
+    subset = index.select(news, rows)
+    counts = TextualEDA(subset).articles_per_publisher()
+    assert counts.sum() == len(rows)
+    with pytest.raises(ValueError):
+        index.select(news.iloc[:10], rows)
+
+
+def test_date_index_parses_mixed_formats(tmp_path):
+    df = pd.DataFrame(
+        {
+            "headline": ["a", "b", "c"],
+            "date": [
+                "2020-06-05 10:30:54-04:00",
+                "2020-05-22 00:00:00",
+                "2020-06-01 09:00:00",
+            ],
+        }
+    )
+    index = build_headline_index(df, tmp_path / "index", date_col="date")
+    assert index.date_range().tolist() == [0, 1, 2]
+    assert index.date_range("2020-06-01", "2020-06-05 14:30").tolist() == [2]
+    assert index.date_range("2020-06-05 14:30").tolist() == [0]
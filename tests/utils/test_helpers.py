@@ -0,0 +1,78 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from eda.publisher_analyzer import PublisherAnalyzer
+from eda.textual_eda import TextualEDA
+from eda.time_series_analyzer import TimeSeriesAnalyzer
+from utils.helpers import load_news_frame, memory_usage_report
+
+
+@pytest.fixture
+def news_csv(tmp_path):
+    df = pd.DataFrame(
+        {
+            "headline": ["Stocks rally", "Oil falls", "Tech gains", "Banks slip"],
+            "url": ["https://a/1", "https://a/2", "https://b/3", "https://b/4"],
+            "publisher": ["a@x.com", "b@y.com", "a@x.com", "b@y.com"],
+            "date": [
+                "2020-06-05 10:30:54-04:00",
+                "2020-06-05 10:45:54-04:00",
+                "2020-01-03 09:00:00-05:00",
+                "N/A",
+            ],
+            "stock": ["A", "XOM", "A", "JPM"],
+        }
+    )
+    path = tmp_path / "news.csv"
+    df.to_csv(path)  # leaves an unnamed index column, like the raw dataset
+    return path
+
+
+def _assert_compact(df):
+    assert isinstance(df["publisher"].dtype, pd.CategoricalDtype)
+    assert isinstance(df["stock"].dtype, pd.CategoricalDtype)
+    assert df["headline"].dtype == "string[pyarrow]"
+    assert str(df["date"].dtype) == "datetime64[ns, UTC]"
+
+
+def test_load_news_csv_uses_compact_dtypes(news_csv):
+    df = load_news_frame(news_csv)
+    assert list(df.columns) == ["headline", "url", "publisher", "date", "stock"]
+    _assert_compact(df)
+    assert df["date"].iloc[2] == pd.Timestamp("2020-01-03 14:00:00", tz="UTC")
+    assert df["date"].isna().sum() == 1
+
+
+def test_load_news_parquet_with_projection(news_csv, tmp_path):
+    path = tmp_path / "news.parquet"
+    load_news_frame(news_csv).to_parquet(path)
+
+    df = load_news_frame(path)
+    _assert_compact(df)
+
+    projected = load_news_frame(path, columns=["headline", "stock"])
+    assert list(projected.columns) == ["headline", "stock"]
+
+
+def test_memory_usage_report(news_csv):
+    df = load_news_frame(news_csv)
+    report = memory_usage_report(df)
+    assert list(report.columns) == ["dtype", "bytes", "MB"]
+    assert report.loc["total", "bytes"] == df.memory_usage(deep=True, index=False).sum()
+    assert report.loc["stock", "dtype"] == "category"
+
+
+def test_analyzers_accept_loader_output(news_csv):
+    df = load_news_frame(news_csv)
+
+    stats = TextualEDA(df).headline_length_stats()
+    assert stats["max"] == len("Stocks rally")
+
+    results = PublisherAnalyzer(df.assign(sentiment_score=0.1)).run_all(plot=False)
+    assert results["top_publishers"].iloc[0] == 2
+    assert results["domain_counts"].index[0] == "x.com"
+
+    counts = TimeSeriesAnalyzer(df).get_publication_frequency("ME")
+    assert counts.sum() == 3
+    plt.close("all")
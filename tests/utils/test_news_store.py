@@ -0,0 +1,121 @@
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from eda.time_series_analyzer import TimeSeriesAnalyzer
+from utils.news_store import (
+    PARTITION_SCHEMA,
+    build_filter,
+    read_news_store,
+    ticker_bucket,
+    write_news_store,
+)
+from utils.ticker_analyzer import TickerAnalyzer
+
+
+@pytest.fixture
+def scored_news():
+    rng = np.random.default_rng(0)
+    n = 400
+    dates = pd.Timestamp("2019-11-01", tz="UTC") + pd.to_timedelta(
+        rng.integers(0, 240 * 24, n), unit="h"
+    )
+    return pd.DataFrame(
+        {
+            "headline": [f"headline {i}" for i in range(n)],
+            "publisher": rng.choice(["a", "b", "c"], n),
+            "date": dates,
+            "stock": rng.choice(["NVDA", "AAPL", "TSLA", "MSFT"], n),
+            "sentiment": rng.uniform(-1, 1, n),
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path, scored_news):
+    root = tmp_path / "news_store"
+    half = len(scored_news) // 2
+    write_news_store(scored_news.iloc[:half], root, n_buckets=4)
+    write_news_store(scored_news.iloc[half:], root, n_buckets=4)
+    return root
+
+
+def test_ticker_bucket_is_stable():
+    buckets = ticker_bucket(["NVDA", "AAPL", "NVDA"], 8)
+    assert buckets[0] == buckets[2]
+    assert ((buckets >= 0) & (buckets < 8)).all()
+
+
+def test_query_matches_pandas_filter(store, scored_news):
+    result = read_news_store(store, tickers=["NVDA"], period="2020Q1")
+
+    mask = (
+        (scored_news["stock"] == "NVDA")
+        & (scored_news["date"] >= "2020-01-01")
+        & (scored_news["date"] < "2020-04-01")
+    )
+    expected = scored_news[mask].sort_values("date")
+    assert len(result) == len(expected) > 0
+    assert set(result["stock"]) == {"NVDA"}
+    np.testing.assert_allclose(result["sentiment"], expected["sentiment"])
+    assert isinstance(result["stock"].dtype, pd.CategoricalDtype)
+
+
+def test_filter_prunes_partitions(store):
+    dataset = ds.dataset(
+        store,
+        format="parquet",
+        partitioning=ds.partitioning(PARTITION_SCHEMA, flavor="hive"),
+    )
+    expression = build_filter(4, ["NVDA"], "2020-01-01", "2020-04-01")
+    selected = list(dataset.get_fragments(filter=expression))
+    assert 0 < len(selected) < len(list(dataset.get_fragments()))
+
+
+def test_bucket_count_must_match(store, scored_news):
+    with pytest.raises(ValueError):
+        write_news_store(scored_news, store, n_buckets=8)
+
+
+def test_consumers_read_store_directly(store, scored_news):
+    analyzer = TickerAnalyzer("nvda")
+    news = analyzer.analyze_sentiment_from_store(store, period="2020Q1")
+    assert not news.empty
+    assert set(news["stock"]) == {"NVDA"}
+    # Stored scores are reused rather than recomputed from the headline.
+    assert news["sentiment"].abs().max() > 0.0
+
+    tsa = TimeSeriesAnalyzer.from_store(store, tickers=["NVDA"], period="2020Q1")
+    assert tsa.get_publication_frequency("D").sum() == len(news)
+
+
+def test_offset_bounds_select_utc_month_partitions(tmp_path):
+    news = pd.DataFrame(
+        {
+            "headline": ["late january", "early february"],
+            "date": pd.to_datetime(["2020-01-31 23:30", "2020-02-01 04:00"], utc=True),
+            "stock": ["NVDA", "NVDA"],
+        }
+    )
+    root = tmp_path / "store"
+    write_news_store(news, root, n_buckets=2)
+    # 01:00+02:00 is 2020-01-31 23:00 UTC, so January must still be read.
+    result = read_news_store(root, start="2020-02-01 01:00+02:00")
+    assert result["headline"].tolist() == ["late january", "early february"]
+    result = read_news_store(root, end="2020-01-31 18:00-05:00")
+    assert result["headline"].tolist() == []
+    # 23:30-05:00 is 2020-02-01 04:30 UTC, so February must be read too.
+    result = read_news_store(root, end="2020-01-31 23:30-05:00")
+    assert result["headline"].tolist() == ["late january", "early february"]
+
+
+def test_eda_time_series_module_does_not_import_utils():
+    import subprocess
+    import sys
+
+    code = "import sys, eda.time_series_analyzer; print('utils' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "False"